@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""对比逐 chunk 转写与 transcribe_many 批量转写的吞吐。
+
+对同一组 chunk 文件，按不同 chunks_per_call 分组调用 FunASREngine，
+输出墙钟耗时与 RTF（墙钟 / 音频时长）。batch_size 取自配置 asr.batch_size，
+可用 --batch-sizes 覆盖以观察 FunASR 内部批大小的影响。
+
+用法：
+    uv run python scripts/bench_asr_batch.py --config config.yaml \\
+        --audio data/processing/x/chunk_*.wav --chunks-per-call 1 4 8
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+import wave
+from pathlib import Path
+
+from audio_journal.asr.funasr import FunASREngine
+from audio_journal.config import load_config
+
+
+def _duration_s(path: Path) -> float:
+    with wave.open(str(path), "rb") as wf:
+        return wf.getnframes() / float(wf.getframerate())
+
+
+def _run(engine: FunASREngine, paths: list[str], chunks_per_call: int) -> float:
+    t0 = time.perf_counter()
+    for i in range(0, len(paths), chunks_per_call):
+        group = paths[i : i + chunks_per_call]
+        if len(group) == 1:
+            engine.transcribe(group[0])
+        else:
+            engine.transcribe_many(group)
+    return time.perf_counter() - t0
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="ASR 批量转写吞吐 benchmark")
+    parser.add_argument("--config", type=Path, default=Path("config.yaml"))
+    parser.add_argument("--audio", type=Path, nargs="+", required=True, help="chunk wav 文件")
+    parser.add_argument("--chunks-per-call", type=int, nargs="+", default=[1, 4])
+    parser.add_argument("--batch-sizes", type=int, nargs="+", default=None)
+    args = parser.parse_args()
+
+    cfg = load_config(args.config)
+    paths = [str(p) for p in args.audio]
+    audio_s = sum(_duration_s(p) for p in args.audio)
+    print(f"chunks={len(paths)} audio={audio_s:.1f}s")
+
+    batch_sizes = args.batch_sizes or [cfg.asr.batch_size]
+    print(f"{'batch_size':>10}{'per_call':>10}{'wall_s':>10}{'rtf':>8}")
+    for batch_size in batch_sizes:
+        asr_cfg = cfg.asr.model_copy(update={"batch_size": batch_size})
+        engine = FunASREngine(asr_cfg, model_dir=asr_cfg.model_dir)
+        # 预热一次，排除首次推理的初始化开销。
+        engine.transcribe(paths[0])
+        for per_call in args.chunks_per_call:
+            wall = _run(engine, paths, per_call)
+            print(f"{batch_size:>10}{per_call:>10}{wall:>10.2f}{wall / audio_s:>8.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+"""对比 FunASR 冷启动与快照载入的模型加载耗时（time-to-first-transcription）。
+
+依次：清空快照 → 冷启动（同时写入快照）→ 多次从快照启动；可选 --audio 在每次
+启动后转写一个短文件，得到加载 + 首次转写的总耗时。
+
+用法：
+    uv run python scripts/bench_asr_load.py --config config.yaml --audio sample.wav
+"""
+
+from __future__ import annotations
+
+import argparse
+import shutil
+import time
+from pathlib import Path
+
+from audio_journal.asr.funasr import FunASREngine
+from audio_journal.config import load_config
+
+
+def _start(cfg, audio: Path | None) -> tuple[str, float, float]:
+    t0 = time.perf_counter()
+    engine = FunASREngine(cfg.asr, model_dir=cfg.asr.model_dir)
+    if audio is not None:
+        engine.transcribe(str(audio))
+    return engine.load_source, engine.load_seconds, time.perf_counter() - t0
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="ASR 模型加载耗时 benchmark")
+    parser.add_argument("--config", type=Path, default=Path("config.yaml"))
+    parser.add_argument("--audio", type=Path, default=None, help="加载后转写的短音频")
+    parser.add_argument("--repeats", type=int, default=3)
+    args = parser.parse_args()
+
+    cfg = load_config(args.config)
+    cfg.asr.model_snapshot = True
+    shutil.rmtree(cfg.asr.model_dir / ".snapshots", ignore_errors=True)
+
+    print(f"{'source':>10}{'load_s':>10}{'ttft_s':>10}")
+    for _ in range(1 + args.repeats):
+        source, load_s, total_s = _start(cfg, args.audio)
+        print(f"{source:>10}{load_s:>10.2f}{total_s:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
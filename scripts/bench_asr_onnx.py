@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+"""对比 torch（FunASREngine）与 ONNX int8（OnnxASREngine）后端的 RTF 与字错误率。
+
+以 FunASREngine 的输出为参考文本，计算 ONNX 输出的 CER（中文按字计算，
+忽略标点与空白；英文等同样按字符计算，作为 WER 的近似）。
+
+用法：
+    uv run python scripts/bench_asr_onnx.py --config config.yaml --audio fixture.wav
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+import wave
+from pathlib import Path
+
+from audio_journal.asr.base import ASREngine
+from audio_journal.asr.funasr import FunASREngine
+from audio_journal.asr.onnx import OnnxASREngine
+from audio_journal.config import load_config
+from audio_journal.telemetry.accuracy import char_error_rate, normalize_for_cer
+
+
+def _duration_s(path: Path) -> float:
+    with wave.open(str(path), "rb") as wf:
+        return wf.getnframes() / float(wf.getframerate())
+
+
+def _run(engine: ASREngine, paths: list[Path]) -> tuple[str, float]:
+    t0 = time.perf_counter()
+    texts = ["".join(u.text for u in engine.transcribe(str(p))) for p in paths]
+    return "".join(texts), time.perf_counter() - t0
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="ONNX ASR 后端 benchmark")
+    parser.add_argument("--config", type=Path, default=Path("config.yaml"))
+    parser.add_argument("--audio", type=Path, nargs="+", required=True)
+    args = parser.parse_args()
+
+    cfg = load_config(args.config)
+    asr_cfg = cfg.asr.model_copy(update={"device": "cpu"})
+    audio_s = sum(_duration_s(p) for p in args.audio)
+    print(f"files={len(args.audio)} audio={audio_s:.1f}s")
+
+    ref_text, torch_s = _run(FunASREngine(asr_cfg, model_dir=asr_cfg.model_dir), args.audio)
+    onnx_text, onnx_s = _run(OnnxASREngine(asr_cfg, model_dir=asr_cfg.model_dir), args.audio)
+
+    ref, hyp = normalize_for_cer(ref_text), normalize_for_cer(onnx_text)
+    cer = char_error_rate(ref, hyp)
+
+    print(f"{'backend':<10}{'wall_s':>10}{'rtf':>8}")
+    print(f"{'torch':<10}{torch_s:>10.2f}{torch_s / audio_s:>8.3f}")
+    print(f"{'onnx-int8':<10}{onnx_s:>10.2f}{onnx_s / audio_s:>8.3f}")
+    print(f"CER(onnx vs torch) = {cer:.2%}  ({len(ref)} 字)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""多进程 CPU ASR 扩展性 benchmark。
+
+对同一组 chunk，分别以不同 worker 数（每个 worker 的 torch 线程数 = 核数 / workers，
+或 --threads 指定）运行 ProcessPoolASREngine，输出墙钟耗时、RTF 与相对单 worker 的加速比。
+模型加载计入预热，不计入转写耗时。
+
+用法：
+    uv run python scripts/bench_asr_pool.py --config config.yaml \\
+        --audio data/processing/x/chunks/chunk_*.wav --workers 1 2 4 8
+"""
+
+from __future__ import annotations
+
+import argparse
+import functools
+import time
+import wave
+from pathlib import Path
+
+from audio_journal.asr.funasr import FunASREngine
+from audio_journal.asr.pool import ProcessPoolASREngine
+from audio_journal.config import load_config
+
+
+def _duration_s(path: Path) -> float:
+    with wave.open(str(path), "rb") as wf:
+        return wf.getnframes() / float(wf.getframerate())
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="多进程 ASR benchmark")
+    parser.add_argument("--config", type=Path, default=Path("config.yaml"))
+    parser.add_argument("--audio", type=Path, nargs="+", required=True, help="chunk wav 文件")
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4])
+    parser.add_argument("--threads", type=int, default=0, help="每个 worker 的线程数，0 = 均分")
+    args = parser.parse_args()
+
+    cfg = load_config(args.config)
+    asr_cfg = cfg.asr.model_copy(update={"device": "cpu"})
+    paths = [str(p) for p in args.audio]
+    audio_s = sum(_duration_s(p) for p in args.audio)
+    print(f"chunks={len(paths)} audio={audio_s:.1f}s")
+
+    factory = functools.partial(FunASREngine, asr_cfg, model_dir=asr_cfg.model_dir)
+    print(f"{'workers':>8}{'threads':>9}{'wall_s':>10}{'rtf':>8}{'speedup':>9}")
+    baseline = None
+    for n in args.workers:
+        engine = ProcessPoolASREngine(factory, workers=n, threads_per_worker=args.threads)
+        try:
+            # 预热：触发所有 worker 加载模型
+            engine.transcribe_many(paths[:n])
+            t0 = time.perf_counter()
+            engine.transcribe_many(paths)
+            wall = time.perf_counter() - t0
+        finally:
+            engine.close()
+        baseline = baseline or wall
+        print(
+            f"{n:>8}{engine.threads_per_worker:>9}{wall:>10.2f}"
+            f"{wall / audio_s:>8.3f}{baseline / wall:>9.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+"""转写中间结果的 JSON 与 .ajt 二进制格式对比。
+
+合成一天量级的 utterance（默认 10 万条），按 50 条一段分段后分别比较：
+- 逐条 JSON（JSONL，每行一个 utterance，model_dump_json）
+- 旧 ASR 缓存格式（gzip 压缩的紧凑 JSON 数组）
+- .ajt 片段文件（未压缩 / zlib 压缩），以及只载入列式表、不物化对象的情况
+
+输出编码大小、写入与读回（含重建 Segment / Utterance 对象）耗时。
+
+用法：
+    uv run python scripts/bench_binary_format.py --count 100000
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import gzip
+import json
+import random
+import time
+
+from audio_journal.models.schemas import Segment, Speaker, Utterance
+from audio_journal.models.utterance_table import UtteranceTable
+from audio_journal.storage.binary import dumps_segments, dumps_table, loads_segments, loads_table
+
+
+def _synthesize(count: int, seed: int, per_segment: int) -> list[Segment]:
+    rng = random.Random(seed)
+    speakers = [Speaker(id=f"SPEAKER_{i:02d}") for i in range(4)]
+    t = 0.0
+    utts = []
+    for _ in range(count):
+        dur = rng.uniform(1.0, 8.0)
+        utts.append(
+            Utterance(
+                speaker=rng.choice(speakers),
+                text="今天的会议主要讨论了下个季度的计划安排。"[: rng.randint(4, 20)],
+                start_time=round(t, 3),
+                end_time=round(t + dur, 3),
+            )
+        )
+        t += dur + rng.uniform(0.1, 1.5)
+    segments = []
+    for lo in range(0, count, per_segment):
+        chunk = utts[lo : lo + per_segment]
+        segments.append(
+            Segment(
+                id=f"day-{chunk[0].start_time:.2f}-{chunk[-1].end_time:.2f}",
+                utterances=chunk,
+                start_time=chunk[0].start_time,
+                end_time=chunk[-1].end_time,
+                duration=chunk[-1].end_time - chunk[0].start_time,
+                source_file="day.wav",
+            )
+        )
+    return segments
+
+
+def _jsonl_dump(segments: list[Segment]) -> bytes:
+    lines = []
+    for seg in segments:
+        header = seg.model_dump(exclude={"utterances"})
+        lines.append(json.dumps({**header, "count": len(seg.utterances)}, ensure_ascii=False))
+        lines.extend(u.model_dump_json() for u in seg.utterances)
+    return "\n".join(lines).encode("utf-8")
+
+
+def _jsonl_load(data: bytes) -> list[Segment]:
+    lines = data.decode("utf-8").split("\n")
+    segments = []
+    i = 0
+    while i < len(lines):
+        header = json.loads(lines[i])
+        count = header.pop("count")
+        utts = [Utterance.model_validate_json(line) for line in lines[i + 1 : i + 1 + count]]
+        segments.append(Segment(**header, utterances=utts))
+        i += 1 + count
+    return segments
+
+
+def _gzip_dump(segments: list[Segment]) -> bytes:
+    rows = [
+        [u.speaker.id, u.text, u.start_time, u.end_time] for s in segments for u in s.utterances
+    ]
+    raw = json.dumps({"v": 1, "u": rows}, ensure_ascii=False, separators=(",", ":"))
+    return gzip.compress(raw.encode("utf-8"))
+
+
+def _gzip_load(data: bytes) -> list[Utterance]:
+    rows = json.loads(gzip.decompress(data))["u"]
+    return [
+        Utterance(speaker=Speaker(id=spk), text=text, start_time=start, end_time=end)
+        for spk, text, start, end in rows
+    ]
+
+
+def _count(out: list) -> int:
+    return sum(len(x.utterances) for x in out) if isinstance(out[0], Segment) else len(out)
+
+
+def _timed(fn, repeat: int) -> tuple[object, float]:
+    # 与 timeit 一致，计时期间暂停 GC：10 万个存活对象会让分代 GC 的耗时盖过解析本身
+    best = float("inf")
+    out = None
+    for _ in range(repeat):
+        out = None
+        gc.collect()
+        gc.disable()
+        try:
+            t0 = time.perf_counter()
+            out = fn()
+            best = min(best, time.perf_counter() - t0)
+        finally:
+            gc.enable()
+    return out, best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="binary intermediate format benchmark")
+    parser.add_argument("--count", type=int, default=100_000)
+    parser.add_argument("--per-segment", type=int, default=50)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    segments = _synthesize(args.count, args.seed, args.per_segment)
+    print(f"utterances={args.count} segments={len(segments)}")
+
+    cases = {
+        "jsonl": (lambda: _jsonl_dump(segments), _jsonl_load),
+        "json.gz": (lambda: _gzip_dump(segments), _gzip_load),
+        "ajt": (lambda: dumps_segments(segments), loads_segments),
+        "ajt+zlib": (lambda: dumps_segments(segments, compress=True), loads_segments),
+    }
+    for name, (dump, load) in cases.items():
+        data, t_dump = _timed(dump, args.repeat)
+        out, t_load = _timed(lambda load=load, data=data: load(data), args.repeat)
+        assert _count(out) == args.count
+        print(
+            f"{name:9s} size={len(data) / 1e6:7.2f}MB  "
+            f"save={t_dump * 1000:8.1f}ms  load={t_load * 1000:8.1f}ms"
+        )
+
+    # 只载入列式表（分段/渲染可直接使用，不物化 Utterance）
+    table = UtteranceTable.from_utterances([u for s in segments for u in s.utterances])
+    data = dumps_table(table)
+    _, t_load = _timed(lambda: loads_table(data), args.repeat)
+    print(f"{'ajt table':9s} size={len(data) / 1e6:7.2f}MB  load={t_load * 1000:8.1f}ms（不物化）")
+
+    restored = loads_segments(dumps_segments(segments))
+    assert [s.model_dump() for s in restored] == [s.model_dump() for s in segments]
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+"""对比 FunASR 内置 fsmn-vad 与复用 chunker 能量包络（asr.vad_source: chunker）。
+
+先用 VADChunker 切分输入音频（同时生成语音区间 sidecar），再分别以两种
+vad_source 转写全部 chunk，报告 ASR 耗时、节省比例，以及以模型 VAD 输出为参考的
+CER 差异（忽略标点与空白）。
+
+用法：
+    uv run python scripts/bench_chunker_vad.py --config config.yaml --audio long.wav
+"""
+
+from __future__ import annotations
+
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+from audio_journal.asr.funasr import FunASREngine
+from audio_journal.chunker.vad_chunker import VADChunker
+from audio_journal.config import load_config
+from audio_journal.telemetry.accuracy import char_error_rate, normalize_for_cer
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="chunker 语音区间 vs fsmn-vad benchmark")
+    parser.add_argument("--config", type=Path, default=Path("config.yaml"))
+    parser.add_argument("--audio", type=Path, required=True)
+    args = parser.parse_args()
+
+    cfg = load_config(args.config)
+    with tempfile.TemporaryDirectory() as tmp:
+        chunks = VADChunker(cfg.chunker).split(args.audio, Path(tmp))
+        audio_s = sum(c.duration for c in chunks)
+        speech_s = sum(b - a for c in chunks for a, b in c.speech_regions)
+        print(f"chunks={len(chunks)} audio={audio_s:.1f}s speech_regions={speech_s:.1f}s")
+
+        texts: dict[str, str] = {}
+        walls: dict[str, float] = {}
+        for source in ("model", "chunker"):
+            asr_cfg = cfg.asr.model_copy(update={"vad_source": source})
+            engine = FunASREngine(asr_cfg, model_dir=asr_cfg.model_dir)
+            t0 = time.perf_counter()
+            utterances = [u for c in chunks for u in engine.transcribe(str(c.path))]
+            walls[source] = time.perf_counter() - t0
+            texts[source] = normalize_for_cer("".join(u.text for u in utterances))
+
+    ref, hyp = texts["model"], texts["chunker"]
+    cer = char_error_rate(ref, hyp)
+    saved = 1 - walls["chunker"] / walls["model"] if walls["model"] else 0.0
+
+    print(f"{'vad_source':<12}{'wall_s':>10}{'rtf':>8}")
+    for source in ("model", "chunker"):
+        print(f"{source:<12}{walls[source]:>10.2f}{walls[source] / audio_s:>8.3f}")
+    print(f"ASR 耗时节省: {saved:.1%}")
+    print(f"CER(chunker vs model) = {cer:.2%}  ({len(ref)} 字)")
+
+
+if __name__ == "__main__":
+    main()
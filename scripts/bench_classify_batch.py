@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+"""批量分类（classifier.batch_size）的调用次数 / token / 延迟对比，用于选择 K。
+
+使用替身 LLM：按估算输入/输出 token 计时（固定往返 + 每 token 耗时），
+批量 prompt 按 "### sN" 块逐段应答；--drop-rate 按比例丢弃结果项以模拟模型漏答，
+触发单独调用回退。不访问真实 API。
+
+用法：
+    uv run python scripts/bench_classify_batch.py --segments 48 --batch-sizes 1,4,8,16
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import random
+import re
+import time
+from pathlib import Path
+
+from audio_journal.classifier.scene import SceneClassifier
+from audio_journal.llm.base import LLMProvider, estimate_tokens
+from audio_journal.models.schemas import Segment, Speaker, Utterance
+
+_SCENES = ["meeting", "business", "idea", "learning", "phone", "chat"]
+_BLOCK = re.compile(r"^### (s\d+)\n(.*?)(?=^### s\d+\n|\Z)", re.M | re.S)
+_TAG = re.compile(r"<(\w+)>")
+
+
+class StandInLLM(LLMProvider):
+    """按 token 模拟延迟的替身 LLM；场景取自转写文本里的 <scene> 标记。"""
+
+    def __init__(
+        self, *, rtt_s: float, in_token_s: float, out_token_s: float, drop_rate: float, seed: int
+    ) -> None:
+        self.rtt_s = rtt_s
+        self.in_token_s = in_token_s
+        self.out_token_s = out_token_s
+        self.drop_rate = drop_rate
+        self.rng = random.Random(seed)
+        self.calls = 0
+        self.input_tokens = 0
+        self.output_tokens = 0
+
+    async def complete(self, prompt: str, system: str = "", json_mode: bool = False) -> str:
+        blocks = _BLOCK.findall(prompt)
+        if blocks:
+            results = [
+                {"id": bid, "scene": _scene_of(body), "confidence": 0.9}
+                for bid, body in blocks
+                if self.rng.random() >= self.drop_rate
+            ]
+            reply = json.dumps({"results": results}, ensure_ascii=False)
+        else:
+            reply = json.dumps(
+                {"scene": _scene_of(prompt), "confidence": 0.9, "reasoning": "bench"},
+                ensure_ascii=False,
+            )
+        tokens_in = estimate_tokens(system) + estimate_tokens(prompt)
+        tokens_out = estimate_tokens(reply)
+        self.calls += 1
+        self.input_tokens += tokens_in
+        self.output_tokens += tokens_out
+        delay = self.rtt_s + tokens_in * self.in_token_s + tokens_out * self.out_token_s
+        await asyncio.sleep(delay)
+        return reply
+
+
+def _scene_of(text: str) -> str:
+    m = _TAG.search(text)
+    return m.group(1) if m else "chat"
+
+
+def _make_segments(n: int, utterances: int, seed: int) -> list[Segment]:
+    rng = random.Random(seed)
+    segments = []
+    for i in range(n):
+        scene = rng.choice(_SCENES)
+        utts = [
+            Utterance(
+                speaker=Speaker(id=f"SPEAKER_{j % 3:02d}"),
+                text=f"<{scene}> 片段{i}第{j}句，讨论接口进度和上线计划。",
+                start_time=float(j * 5),
+                end_time=float(j * 5 + 4),
+            )
+            for j in range(utterances)
+        ]
+        segments.append(
+            Segment(
+                id=f"seg{i:04d}-{scene}",
+                utterances=utts,
+                start_time=0.0,
+                end_time=float(utterances * 5),
+                duration=float(utterances * 5),
+                source_file="bench.wav",
+            )
+        )
+    return segments
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="批量场景分类 benchmark")
+    parser.add_argument("--segments", type=int, default=48)
+    parser.add_argument("--utterances", type=int, default=40, help="每个片段的 utterance 数")
+    parser.add_argument("--batch-sizes", default="1,2,4,8,16")
+    parser.add_argument("--rtt-ms", type=float, default=300.0, help="每次调用固定往返耗时")
+    parser.add_argument("--in-token-us", type=float, default=50.0, help="每个输入 token 耗时")
+    parser.add_argument("--out-token-ms", type=float, default=15.0, help="每个输出 token 耗时")
+    parser.add_argument("--drop-rate", type=float, default=0.02, help="批量结果项漏答比例")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--prompts", type=Path, default=Path("./prompts"))
+    args = parser.parse_args()
+
+    segments = _make_segments(args.segments, args.utterances, args.seed)
+    expected = [seg.id.split("-", 1)[1] for seg in segments]
+
+    print(
+        f"{'K':>4}{'calls':>8}{'in_tokens':>12}{'out_tokens':>12}"
+        f"{'fallbacks':>11}{'accuracy':>10}{'wall_s':>9}"
+    )
+    for k in (int(x) for x in args.batch_sizes.split(",")):
+        llm = StandInLLM(
+            rtt_s=args.rtt_ms / 1000.0,
+            in_token_s=args.in_token_us / 1e6,
+            out_token_s=args.out_token_ms / 1000.0,
+            drop_rate=args.drop_rate,
+            seed=args.seed,
+        )
+        clf = SceneClassifier(
+            prompt_path=args.prompts / "classifier.txt",
+            llm=llm,
+            batch_prompt_path=args.prompts / "classifier_batch.txt",
+            batch_size=k,
+        )
+        t0 = time.perf_counter()
+        out = asyncio.run(clf.classify_many(segments))
+        wall = time.perf_counter() - t0
+        accuracy = sum(c.scene.value == e for c, e in zip(out, expected)) / len(out)
+        print(
+            f"{k:>4}{llm.calls:>8}{llm.input_tokens:>12}{llm.output_tokens:>12}"
+            f"{clf.batch_fallbacks:>11}{accuracy:>10.0%}{wall:>9.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""对比两段式（分类 + 分析）与 fused 单次调用的 token 与延迟。
+
+使用替身 LLM：按估算输入 token 计时（固定往返 + 每 token 耗时），
+返回同时满足分类/分析/fused 解析的 JSON，不访问真实 API。
+
+用法：
+    uv run python scripts/bench_fused_classify.py --segments 50 --utterances 120
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import time
+from pathlib import Path
+
+from audio_journal.analyzer.meeting import MeetingAnalyzer
+from audio_journal.classifier.fused import FusedClassifier
+from audio_journal.classifier.scene import SceneClassifier
+from audio_journal.llm.base import LLMProvider, estimate_tokens
+from audio_journal.models.schemas import SceneType, Segment, Speaker, Utterance
+
+_ANALYSIS = {
+    "summary": "同步项目进度",
+    "key_points": ["接口本周完成"],
+    "decisions": [],
+    "action_items": [],
+    "participants": ["SPEAKER_00", "SPEAKER_01"],
+    "topics": ["进度"],
+}
+
+
+class StandInLLM(LLMProvider):
+    """按输入 token 模拟延迟的替身 LLM。"""
+
+    def __init__(self, *, rtt_s: float, per_token_s: float, scenes: dict[str, str]) -> None:
+        self.rtt_s = rtt_s
+        self.per_token_s = per_token_s
+        self.scenes = scenes
+        self.calls = 0
+        self.input_tokens = 0
+
+    async def complete(self, prompt: str, system: str = "", json_mode: bool = False) -> str:
+        tokens = estimate_tokens(system) + estimate_tokens(prompt)
+        self.calls += 1
+        self.input_tokens += tokens
+        await asyncio.sleep(self.rtt_s + tokens * self.per_token_s)
+
+        scene = next((v for k, v in self.scenes.items() if k in prompt), "chat")
+        reply = {"scene": scene, "confidence": 0.9, "reasoning": "bench", **_ANALYSIS}
+        reply["analysis"] = _ANALYSIS if scene == "meeting" else {}
+        return json.dumps(reply, ensure_ascii=False)
+
+
+def _make_segments(n: int, utterances: int) -> list[Segment]:
+    segments: list[Segment] = []
+    for i in range(n):
+        # 约一半是 meeting，其余为非深度分析场景。
+        tag = f"seg{i:04d}{'M' if i % 2 == 0 else 'C'}"
+        utts = [
+            Utterance(
+                speaker=Speaker(id=f"SPEAKER_{j % 3:02d}"),
+                text=f"{tag} 这是第{j}句转写内容，讨论接口进度和上线计划。",
+                start_time=float(j * 5),
+                end_time=float(j * 5 + 4),
+            )
+            for j in range(utterances)
+        ]
+        segments.append(
+            Segment(
+                id=tag,
+                utterances=utts,
+                start_time=0.0,
+                end_time=float(utterances * 5),
+                duration=float(utterances * 5),
+                source_file="bench.wav",
+            )
+        )
+    return segments
+
+
+async def _run_two_call(segments: list[Segment], prompts: Path, llm: StandInLLM) -> None:
+    classifier = SceneClassifier(prompt_path=prompts / "classifier.txt", llm=llm)
+    meeting = MeetingAnalyzer(llm=llm, prompt_path=prompts / "meeting.txt")
+    for seg in segments:
+        cseg = await classifier.classify(seg)
+        if cseg.scene == SceneType.MEETING:
+            await meeting.analyze(cseg)
+
+
+async def _run_fused(segments: list[Segment], prompts: Path, llm: StandInLLM) -> None:
+    meeting = MeetingAnalyzer(llm=llm, prompt_path=prompts / "meeting.txt")
+    fused = FusedClassifier(
+        prompt_path=prompts / "fused.txt", llm=llm, analyzers={SceneType.MEETING: meeting}
+    )
+    for seg in segments:
+        await fused.classify_and_analyze(seg)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="fused 分类+分析 benchmark")
+    parser.add_argument("--segments", type=int, default=50)
+    parser.add_argument("--utterances", type=int, default=120, help="每个片段的 utterance 数")
+    parser.add_argument("--rtt-ms", type=float, default=20.0, help="每次调用固定往返耗时")
+    parser.add_argument("--per-token-us", type=float, default=5.0, help="每个输入 token 耗时")
+    parser.add_argument("--prompts", type=Path, default=Path("./prompts"))
+    args = parser.parse_args()
+
+    segments = _make_segments(args.segments, args.utterances)
+    scenes = {seg.id: "meeting" if seg.id.endswith("M") else "chat" for seg in segments}
+
+    print(f"{'mode':<10}{'calls':>8}{'in_tokens':>12}{'wall_s':>10}")
+    for name, runner in [("two-call", _run_two_call), ("fused", _run_fused)]:
+        llm = StandInLLM(
+            rtt_s=args.rtt_ms / 1000.0, per_token_s=args.per_token_us / 1e6, scenes=scenes
+        )
+        t0 = time.perf_counter()
+        asyncio.run(runner(segments, args.prompts, llm))
+        wall = time.perf_counter() - t0
+        print(f"{name:<10}{llm.calls:>8}{llm.input_tokens:>12}{wall:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
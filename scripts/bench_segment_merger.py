@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""SegmentMerger 在一天量级数据上的合并耗时与内存分配。
+
+合成一天的会议类 ClassifiedSegment（默认 16 小时、每条 utterance 约 4 秒、
+每 10 分钟一个片段、片段间隔 60 秒；每场会议约 1.5 小时，会议之间休息 15 分钟），
+每场会议合并为一个 MergedSegment。
+对比旧实现（复制 + 整体排序 + pydantic 校验构造）与当前实现。
+
+用法：
+    uv run python scripts/bench_segment_merger.py --hours 16
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+import tracemalloc
+
+from audio_journal.config import MergerConfig
+from audio_journal.merger.segment_merger import SegmentMerger
+from audio_journal.models.schemas import (
+    ClassifiedSegment,
+    MergedSegment,
+    SceneType,
+    Speaker,
+    Utterance,
+)
+
+
+class _LegacyMerger(SegmentMerger):
+    """旧版 _create_merged_segment：复制全部 utterance、排序、校验构造。"""
+
+    def _create_merged_segment(self, segments: list[ClassifiedSegment]) -> MergedSegment:
+        all_utterances: list[Utterance] = []
+        for seg in segments:
+            all_utterances.extend(seg.utterances)
+        all_utterances.sort(key=lambda u: u.start_time)
+        return MergedSegment(
+            id="merged-" + "-".join(seg.id for seg in segments),
+            scene=segments[0].scene,
+            utterances=all_utterances,
+            start_time=segments[0].start_time,
+            end_time=segments[-1].end_time,
+            duration=segments[-1].end_time - segments[0].start_time,
+            source_file=segments[0].source_file,
+            original_segment_ids=[seg.id for seg in segments],
+            gap_durations=[
+                segments[i + 1].start_time - segments[i].end_time
+                for i in range(len(segments) - 1)
+            ],
+            confidence=sum(seg.confidence for seg in segments) / len(segments),
+            value_tags=list({t for seg in segments for t in seg.value_tags}),
+        )
+
+
+def _synthesize(
+    hours: float, utt_s: float, seg_s: float, gap_s: float, meeting_s: float
+) -> list[ClassifiedSegment]:
+    speaker = Speaker(id="SPEAKER_00")
+    segments = []
+    t = 0.0
+    meeting_start = 0.0
+    total = hours * 3600
+    i = 0
+    while t < total:
+        if t + seg_s - meeting_start > meeting_s:
+            # 会议结束：休息时间超过合并器的最大间隔，下一场单独合并
+            t += 900.0
+            meeting_start = t
+        n = int(seg_s / utt_s)
+        utts = [
+            Utterance(
+                speaker=speaker,
+                text="会议内容",
+                start_time=t + k * utt_s,
+                end_time=t + (k + 1) * utt_s,
+            )
+            for k in range(n)
+        ]
+        segments.append(
+            ClassifiedSegment(
+                id=f"seg-{i}",
+                utterances=utts,
+                start_time=t,
+                end_time=t + seg_s,
+                duration=seg_s,
+                source_file="day.wav",
+                scene=SceneType.MEETING,
+                confidence=0.9,
+            )
+        )
+        t += seg_s + gap_s
+        i += 1
+    return segments
+
+
+def _measure(merger: SegmentMerger, segments: list[ClassifiedSegment], repeats: int):
+    best = float("inf")
+    for _ in range(repeats):
+        t0 = time.perf_counter()
+        merger.merge(segments)
+        best = min(best, time.perf_counter() - t0)
+    tracemalloc.start()
+    out = merger.merge(segments)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return out, best, peak
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="SegmentMerger benchmark")
+    parser.add_argument("--hours", type=float, default=16.0)
+    parser.add_argument("--utterance-s", type=float, default=4.0)
+    parser.add_argument("--segment-s", type=float, default=600.0)
+    parser.add_argument("--gap-s", type=float, default=60.0)
+    parser.add_argument("--meeting-h", type=float, default=1.5)
+    parser.add_argument("--repeats", type=int, default=5)
+    args = parser.parse_args()
+
+    segments = _synthesize(
+        args.hours, args.utterance_s, args.segment_s, args.gap_s, args.meeting_h * 3600
+    )
+    n_utts = sum(len(s.utterances) for s in segments)
+    cfg = MergerConfig()
+
+    legacy, t_old, mem_old = _measure(_LegacyMerger(cfg), segments, args.repeats)
+    current, t_new, mem_new = _measure(SegmentMerger(cfg), segments, args.repeats)
+    assert [s.model_dump() for s in legacy] == [s.model_dump() for s in current]
+    merged = sum(isinstance(s, MergedSegment) for s in current)
+    print(f"segments={len(segments)} utterances={n_utts} merged_segments={merged}")
+
+    print(f"{'':>8}{'time_ms':>10}{'peak_alloc_kb':>16}")
+    print(f"{'legacy':>8}{t_old * 1000:>10.2f}{mem_old / 1024:>16.0f}")
+    print(f"{'current':>8}{t_new * 1000:>10.2f}{mem_new / 1024:>16.0f}")
+
+
+if __name__ == "__main__":
+    main()
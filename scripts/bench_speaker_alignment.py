@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""词级时间戳 → 说话人段对齐的 microbenchmark。
+
+合成一段长音频的 token 流（默认 4 小时、每秒约 4 个字、平均 8 秒换一次说话人），
+对比逐段全量扫描（旧实现）与排序索引（_WordIndex）的耗时，并校验输出一致。
+
+用法：
+    uv run python scripts/bench_speaker_alignment.py --hours 4
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import time
+
+from audio_journal.asr.funasr import _WordIndex
+
+
+def _linear(timestamp: list, start_ms: float, end_ms: float) -> str:
+    words = []
+    for ts in timestamp:
+        if len(ts) < 3:
+            continue
+        if ts[0] >= start_ms and ts[1] <= end_ms:
+            words.append(ts[2])
+    return "".join(words)
+
+
+def _synthesize(hours: float, tokens_per_s: float, turn_s: float, seed: int):
+    rng = random.Random(seed)
+    total_ms = int(hours * 3600 * 1000)
+    step = 1000.0 / tokens_per_s
+
+    timestamp: list[list] = []
+    t = 0.0
+    while t < total_ms:
+        dur = step * rng.uniform(0.6, 0.95)
+        timestamp.append([int(t), int(t + dur), "字"])
+        t += step * rng.uniform(0.8, 1.2)
+
+    turns: list[tuple[int, int]] = []
+    t = 0.0
+    while t < total_ms:
+        length = turn_s * 1000 * rng.uniform(0.3, 1.7)
+        turns.append((int(t), int(t + length)))
+        t += length
+    return timestamp, turns
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="说话人对齐 microbenchmark")
+    parser.add_argument("--hours", type=float, default=4.0)
+    parser.add_argument("--tokens-per-s", type=float, default=4.0)
+    parser.add_argument("--turn-s", type=float, default=8.0, help="平均说话人段时长")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--skip-linear", action="store_true", help="跳过旧实现（很慢）")
+    args = parser.parse_args()
+
+    timestamp, turns = _synthesize(args.hours, args.tokens_per_s, args.turn_s, args.seed)
+    print(f"tokens={len(timestamp)} turns={len(turns)}")
+
+    t0 = time.perf_counter()
+    index = _WordIndex(timestamp)
+    indexed = [index.text_in_range(s, e) for s, e in turns]
+    indexed_s = time.perf_counter() - t0
+    print(f"{'indexed':<10}{indexed_s:>10.3f}s")
+
+    if args.skip_linear:
+        return
+    t0 = time.perf_counter()
+    linear = [_linear(timestamp, s, e) for s, e in turns]
+    linear_s = time.perf_counter() - t0
+    print(f"{'linear':<10}{linear_s:>10.3f}s  speedup={linear_s / indexed_s:.0f}x")
+    assert linear == indexed, "输出不一致"
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""在已有归档上评估特征预分类：各阈值下可省下的 LLM 调用比例与一致率。
+
+读取归档索引（archive/<date>/index.jsonl）与对应 Markdown 中的「原始转写」，
+重建片段后运行 HeuristicClassifier，与归档里的场景标签（LLM 分类结果）对比。
+应在启用 classifier.heuristic（非 shadow）之前的归档上运行，否则部分标签本身来自预分类。
+
+用法：
+    uv run python scripts/eval_heuristic_classifier.py --archive ./data/archive
+"""
+
+from __future__ import annotations
+
+import argparse
+import re
+from collections import Counter
+from pathlib import Path
+
+from audio_journal.classifier.heuristic import HeuristicClassifier, HeuristicPrediction
+from audio_journal.models.schemas import SceneType, Segment, Speaker, Utterance
+from audio_journal.storage.index import JSONLArchiveIndex
+
+_LINE = re.compile(r"^\[(\d+):(\d{2}):(\d{2})\] (\S+): (.*)$")
+
+
+def _segment_from_markdown(path: Path, source_file: str) -> Segment | None:
+    text = path.read_text(encoding="utf-8")
+    _, _, body = text.partition("## 原始转写")
+    rows = []
+    for line in body.splitlines():
+        m = _LINE.match(line.strip())
+        if m:
+            h, mi, s, spk, utt = m.groups()
+            rows.append((int(h) * 3600 + int(mi) * 60 + int(s), spk, utt))
+    if not rows:
+        return None
+    # 归档只保留开始时间：结束时间取下一条的开始（最后一条按 1 秒）
+    ends = [r[0] for r in rows[1:]] + [rows[-1][0] + 1]
+    utts = [
+        Utterance(speaker=Speaker(id=spk), text=utt, start_time=start, end_time=max(end, start))
+        for (start, spk, utt), end in zip(rows, ends)
+    ]
+    start, end = utts[0].start_time, utts[-1].end_time
+    return Segment(
+        id=path.stem,
+        utterances=utts,
+        start_time=start,
+        end_time=end,
+        duration=end - start,
+        source_file=source_file,
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="特征预分类评估")
+    parser.add_argument("--archive", type=Path, default=Path("./data/archive"))
+    parser.add_argument("--thresholds", default="0.6,0.7,0.8,0.9")
+    args = parser.parse_args()
+
+    clf = HeuristicClassifier()
+    labelled: list[tuple[SceneType, HeuristicPrediction]] = []
+    for entry in JSONLArchiveIndex(args.archive).list():
+        path = Path(entry.archive_path)
+        if not path.exists():
+            continue
+        seg = _segment_from_markdown(path, entry.source_file)
+        if seg is not None:
+            labelled.append((entry.scene, clf.predict(seg)))
+
+    if not labelled:
+        print(f"{args.archive} 中没有可评估的归档")
+        return
+
+    print(f"entries={len(labelled)}  labels={dict(Counter(s.value for s, _ in labelled))}")
+    print(f"{'threshold':>10}{'avoided':>10}{'agreement':>11}")
+    for threshold in (float(x) for x in args.thresholds.split(",")):
+        decided = [(label, p) for label, p in labelled if p.confidence >= threshold]
+        agreed = sum(label == p.scene for label, p in decided)
+        agreement = agreed / len(decided) if decided else 0.0
+        print(f"{threshold:>10.2f}{len(decided) / len(labelled):>10.0%}{agreement:>11.0%}")
+
+    confusions = Counter(
+        (label.value, p.scene.value)
+        for label, p in labelled
+        if p.confidence >= 0.8 and label != p.scene
+    )
+    for (label, pred), n in confusions.most_common(5):
+        print(f"  LLM={label:<9} 预分类={pred:<9} {n}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+"""将本地 FunASR 模型导出为 ONNX（可选 int8 量化），供 asr.engine: funasr-onnx 使用。
+
+导出结果写在各模型目录下：model.onnx，量化版为 model_quant.onnx。
+cam++ 说话人分离不在 ONNX 路径内，无需导出。
+
+用法：
+    uv run python scripts/export_onnx_models.py --config config.yaml
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+from pathlib import Path
+
+from audio_journal.config import load_config
+
+logging.basicConfig(
+    level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s"
+)
+logger = logging.getLogger(__name__)
+
+
+def export_model(model_path: Path, *, quantize: bool) -> None:
+    try:
+        from funasr import AutoModel
+    except ImportError as e:
+        raise RuntimeError("FunASR 未安装。请运行: pip install funasr modelscope") from e
+
+    logger.info(f"导出: {model_path} (quantize={quantize})")
+    model = AutoModel(model=str(model_path), device="cpu", disable_update=True)
+    model.export(type="onnx", quantize=quantize)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="导出 FunASR ONNX 模型")
+    parser.add_argument("--config", type=Path, default=Path("config.yaml"))
+    parser.add_argument(
+        "--no-quantize", action="store_true", help="只导出 fp32 模型（默认同时导出 int8 量化版）"
+    )
+    args = parser.parse_args()
+
+    cfg = load_config(args.config)
+    for name in (cfg.asr.model, cfg.asr.vad_model, cfg.asr.punc_model):
+        model_path = cfg.asr.model_dir / name
+        if not model_path.exists():
+            logger.error(f"❌ 模型不存在，先运行 scripts/download_funasr_models.py: {model_path}")
+            continue
+        export_model(model_path, quantize=not args.no_quantize)
+
+    logger.info("🎉 ONNX 导出完成")
+
+
+if __name__ == "__main__":
+    main()
@@ -2,9 +2,15 @@ from __future__ import annotations
 
 from abc import ABC, abstractmethod
 from pathlib import Path
+from typing import Any
 
 from audio_journal.llm.base import LLMProvider
-from audio_journal.models.schemas import ClassifiedSegment, MergedSegment, Utterance
+from audio_journal.models.schemas import (
+    AnalysisResult,
+    ClassifiedSegment,
+    MergedSegment,
+    Utterance,
+)
 
 
 class BaseAnalyzer(ABC):
@@ -19,6 +25,17 @@ class BaseAnalyzer(ABC):
     async def analyze(self, segment: ClassifiedSegment | MergedSegment):
         raise NotImplementedError
 
+    @abstractmethod
+    def parse_result(
+        self, segment: ClassifiedSegment | MergedSegment, data: dict[str, Any], transcript: str
+    ) -> AnalysisResult:
+        """将 LLM 返回的 JSON 字段转为 AnalysisResult。
+
+        与 analyze 拆开，便于 fused 模式把“分类+分析”合并为一次调用后复用同一套解析。
+        """
+
+        raise NotImplementedError
+
     def _render_prompt(self, *, transcript: str, start_time: str, end_time: str, speakers: str) -> str:
         prompt = self._prompt_template
         prompt = prompt.replace("{{transcript}}", transcript)
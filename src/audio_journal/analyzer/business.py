@@ -24,8 +24,11 @@ class BusinessAnalyzer(BaseAnalyzer):
         )
 
         text = await self.llm.complete(prompt, json_mode=True)
-        data = parse_json_strict(text)
+        return self.parse_result(segment, parse_json_strict(text), transcript)
 
+    def parse_result(
+        self, segment: ClassifiedSegment | MergedSegment, data: dict[str, Any], transcript: str
+    ) -> AnalysisResult:
         summary = str(data.get("summary", ""))
         commitments = list(data.get("commitments", []) or [])
         follow_ups = list(data.get("follow_ups", []) or [])
@@ -24,8 +24,11 @@ class ChatAnalyzer(BaseAnalyzer):
         )
 
         text = await self.llm.complete(prompt, json_mode=True)
-        data = parse_json_strict(text)
+        return self.parse_result(segment, parse_json_strict(text), transcript)
 
+    def parse_result(
+        self, segment: ClassifiedSegment | MergedSegment, data: dict[str, Any], transcript: str
+    ) -> AnalysisResult:
         summary = str(data.get("summary", ""))
         all_topics = list(data.get("all_topics", []) or [])
         high_value_topics = list(data.get("high_value_topics", []) or [])
@@ -24,8 +24,11 @@ class IdeaAnalyzer(BaseAnalyzer):
         )
 
         text = await self.llm.complete(prompt, json_mode=True)
-        data = parse_json_strict(text)
+        return self.parse_result(segment, parse_json_strict(text), transcript)
 
+    def parse_result(
+        self, segment: ClassifiedSegment | MergedSegment, data: dict[str, Any], transcript: str
+    ) -> AnalysisResult:
         core_idea = str(data.get("core_idea", ""))
         idea_type = str(data.get("idea_type", "unknown"))
         related_topics = list(data.get("related_topics", []) or [])
@@ -24,8 +24,11 @@ class LearningAnalyzer(BaseAnalyzer):
         )
 
         text = await self.llm.complete(prompt, json_mode=True)
-        data = parse_json_strict(text)
+        return self.parse_result(segment, parse_json_strict(text), transcript)
 
+    def parse_result(
+        self, segment: ClassifiedSegment | MergedSegment, data: dict[str, Any], transcript: str
+    ) -> AnalysisResult:
         summary = str(data.get("summary", ""))
         knowledge_points = list(data.get("knowledge_points", []) or [])
         sources = list(data.get("sources", []) or [])
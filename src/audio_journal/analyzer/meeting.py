@@ -29,8 +29,11 @@ class MeetingAnalyzer(BaseAnalyzer):
         )
 
         text = await self.llm.complete(prompt, json_mode=True)
-        data = parse_json_strict(text)
+        return self.parse_result(segment, parse_json_strict(text), transcript)
 
+    def parse_result(
+        self, segment: ClassifiedSegment | MergedSegment, data: dict[str, Any], transcript: str
+    ) -> AnalysisResult:
         summary = str(data.get("summary", ""))
         key_points = list(data.get("key_points", []) or [])
         decisions = list(data.get("decisions", []) or [])
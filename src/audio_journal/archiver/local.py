@@ -3,7 +3,7 @@ from __future__ import annotations
 import re
 from datetime import date
 from pathlib import Path
-from typing import Iterable, Optional
+from typing import Iterable, Literal, Optional
 
 import yaml
 
@@ -26,6 +26,7 @@ class LocalArchiver:
         source_file: str = "",
         title: str | None = None,
         duration: float | None = None,
+        tier: Literal["preview", "final"] = "final",
     ) -> ArchiveEntry:
         d = archive_date or date.today().isoformat()
         seq = self.index.next_sequence(d)
@@ -53,6 +54,7 @@ class LocalArchiver:
                 action_items=result.action_items,
                 topics=result.topics,
                 raw_text=result.raw_text,
+                tier=tier,
             ),
             encoding="utf-8",
         )
@@ -66,20 +68,58 @@ class LocalArchiver:
             archive_path=str(md_path),
             source_file=source_file,
             segment_id=result.segment_id,
+            tier=tier,
         )
         self.index.append(entry)
         return entry
 
+    def upgrade(self, entry_id: str, result: AnalysisResult) -> ArchiveEntry:
+        """用深度分析结果原地升级已归档的 preview 条目。
+
+        保持 id、日期与 Markdown 路径不变，仅重写内容与索引中的标题/tier，
+        这样已有的链接与搜索结果仍然有效。
+        """
+
+        entry = self.index.get_by_id(entry_id)
+        if entry is None:
+            raise KeyError(f"未找到归档条目: {entry_id}")
+
+        title = self._suggest_title(result)
+        Path(entry.archive_path).write_text(
+            _render_markdown(
+                entry_id=entry.id,
+                archive_date=entry.date,
+                scene=result.scene.value,
+                title=title,
+                duration=entry.duration,
+                source_file=entry.source_file,
+                segment_id=result.segment_id,
+                summary=result.summary,
+                key_points=result.key_points,
+                action_items=result.action_items,
+                topics=result.topics,
+                raw_text=result.raw_text,
+            ),
+            encoding="utf-8",
+        )
+
+        upgraded = entry.model_copy(update={"title": title, "scene": result.scene, "tier": "final"})
+        self.index.replace(upgraded)
+        return upgraded
+
     def archive_all(
         self,
         results: Iterable[AnalysisResult],
         *,
         archive_date: str | None = None,
         source_file: str = "",
+        tier: Literal["preview", "final"] = "final",
     ) -> list[ArchiveEntry]:
         entries: list[ArchiveEntry] = []
         for r in results:
-            entries.append(self.archive(r, archive_date=archive_date, source_file=source_file))
+            entries.append(
+                self.archive(r, archive_date=archive_date, source_file=source_file, tier=tier)
+            )
         return entries
 
     @staticmethod
@@ -118,6 +158,7 @@ def _render_markdown(
     action_items: list[str],
     topics: list[str],
     raw_text: str,
+    tier: str = "final",
 ) -> str:
     front: dict[str, object] = {
         "id": entry_id,
@@ -129,6 +170,8 @@ def _render_markdown(
     }
     if topics:
         front["topics"] = topics
+    if tier != "final":
+        front["tier"] = tier
 
     # 用 YAML dump 生成 front-matter，避免 title/topics 中的特殊字符破坏格式。
     front_yaml = yaml.dump(front, allow_unicode=True, sort_keys=False).strip()
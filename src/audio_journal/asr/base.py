@@ -13,3 +13,11 @@ class ASREngine(ABC):
         """转写音频文件，返回带时间戳与说话人标签的 utterances。"""
 
         raise NotImplementedError
+
+    def transcribe_many(self, audio_paths: list[str]) -> list[list[Utterance]]:
+        """批量转写多个音频，按输入顺序返回各自的 utterances。
+
+        默认逐个调用 transcribe；支持跨文件批处理的引擎可覆盖以提高吞吐。
+        """
+
+        return [self.transcribe(p) for p in audio_paths]
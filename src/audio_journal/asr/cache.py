@@ -0,0 +1,217 @@
+"""按内容寻址的 ASR 结果缓存。
+
+key 由 chunk 的 PCM 数据、语音区间 sidecar（.regions.json，由 chunker 参数决定）与
+ASR 配置指纹共同决定，与文件名/路径无关：
+同一段音频重新切分到新的 processing 目录也能命中。调整 prompt 或 merger 后
+重跑同一文件，不再重复最昂贵的转写步骤。
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import wave
+from pathlib import Path
+from typing import Optional
+
+from audio_journal.asr.base import ASREngine
+from audio_journal.chunker.vad_chunker import speech_regions_path
+from audio_journal.config import ASRConfig
+from audio_journal.models.schemas import Utterance
+from audio_journal.models.utterance_table import UtteranceTable
+from audio_journal.storage.binary import (
+    FormatError,
+    dumps_table,
+    loads_table,
+    write_bytes_atomic,
+)
+
+logger = logging.getLogger(__name__)
+
+# 缓存条目为 storage.binary 的 utterance 表（zlib 压缩）；格式版本由其文件头记录，
+# 版本不符的条目读取失败后删除并重新转写。
+_SUFFIX = ".ajt"
+# 改用二进制格式前的 gzip JSON 条目：不再读取，但计入总大小并优先淘汰（mtime 不再刷新）。
+_LEGACY_SUFFIXES = (".json.gz",)
+_READ_BLOCK = 1 << 20
+# 超出 max_bytes 时一次淘汰到该比例以下，满载后不必每次写入都扫描整个缓存目录
+_LOW_WATER = 0.9
+
+
+def asr_config_fingerprint(config: ASRConfig) -> str:
+    """影响转写输出的 ASR 配置项（模型、设备、开关）。batch_size 等只影响速度，不计入。
+
+    后端专属配置只在对应引擎下计入，避免改动未使用的配置导致缓存失效。
+    """
+
+    keys: dict[str, object] = {
+        "engine": config.engine,
+        "model": config.model,
+        "vad_model": config.vad_model,
+        "punc_model": config.punc_model,
+        "spk_model": config.spk_model,
+        "device": config.device,
+        "language": config.language,
+        "enable_speaker_diarization": config.enable_speaker_diarization,
+        "vad_source": config.vad_source,
+    }
+    if config.engine == "funasr-onnx":
+        keys["onnx_quantize"] = config.onnx.quantize
+    elif config.engine == "funasr-streaming":
+        keys["streaming"] = config.streaming.model_dump(mode="json")
+    return json.dumps(keys, sort_keys=True)
+
+
+class CachedASREngine(ASREngine):
+    """包装任意 ASREngine，按音频内容缓存转写结果。
+
+    结果以压缩的二进制 utterance 表（见 storage.binary）存于 cache_dir；
+    总大小超过 max_bytes 时按最近使用时间（mtime，命中时刷新）一次淘汰到 90% 以下。
+    """
+
+    def __init__(
+        self,
+        engine: ASREngine,
+        cache_dir: str | Path,
+        *,
+        fingerprint: str,
+        max_bytes: int,
+    ) -> None:
+        self.engine = engine
+        self.cache_dir = Path(cache_dir)
+        self.fingerprint = fingerprint
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._total_bytes: Optional[int] = None
+
+    def transcribe(self, audio_path: str) -> list[Utterance]:
+        key = self.key_for(audio_path)
+        cached = self._load(key)
+        if cached is not None:
+            self.hits += 1
+            return cached
+
+        self.misses += 1
+        utterances = self.engine.transcribe(audio_path)
+        if self._cacheable(audio_path, utterances):
+            self._store(key, utterances)
+        return utterances
+
+    def transcribe_many(self, audio_paths: list[str]) -> list[list[Utterance]]:
+        keys = [self.key_for(p) for p in audio_paths]
+        outputs: list[Optional[list[Utterance]]] = [self._load(k) for k in keys]
+
+        missing = [i for i, out in enumerate(outputs) if out is None]
+        self.hits += len(audio_paths) - len(missing)
+        self.misses += len(missing)
+        if missing:
+            # 只把未命中的 chunk 交给底层引擎，保留其批处理能力
+            if len(missing) == 1:
+                fresh = [self.engine.transcribe(audio_paths[missing[0]])]
+            else:
+                fresh = self.engine.transcribe_many([audio_paths[i] for i in missing])
+            for i, utterances in zip(missing, fresh):
+                if self._cacheable(audio_paths[i], utterances):
+                    self._store(keys[i], utterances)
+                outputs[i] = utterances
+
+        return [out or [] for out in outputs]
+
+    def key_for(self, audio_path: str | Path) -> str:
+        h = hashlib.sha256()
+        h.update(self.fingerprint.encode("utf-8"))
+        h.update(_audio_digest(Path(audio_path)))
+        # vad_source=chunker 时引擎只解码 sidecar 里的语音区间；区间随 chunker 参数变化
+        regions = speech_regions_path(audio_path)
+        if regions.exists():
+            h.update(b"regions\0")
+            h.update(regions.read_bytes())
+        return h.hexdigest()
+
+    def _path_for(self, key: str) -> Path:
+        return self.cache_dir / key[:2] / f"{key}{_SUFFIX}"
+
+    def _cacheable(self, audio_path: str, utterances: list[Utterance]) -> bool:
+        """空结果（多为批量结果缺失等偶发失败）与说话人分离回退的降级结果不写入缓存，
+        否则一次失败会成为该音频永久的转写结果。"""
+
+        if not utterances:
+            return False
+        # 引擎通过 last_diarization 标记本次调用各文件的状态；取不到时（子进程/远程）视为正常
+        status = getattr(self.engine, "last_diarization", None)
+        return not (isinstance(status, dict) and status.get(audio_path) == "fallback")
+
+    def _load(self, key: str) -> Optional[list[Utterance]]:
+        path = self._path_for(key)
+        try:
+            table = loads_table(path.read_bytes())
+        except FileNotFoundError:
+            return None
+        except (OSError, FormatError) as e:
+            logger.warning(f"ASR 缓存条目损坏或版本不符，忽略: {path}: {e}")
+            path.unlink(missing_ok=True)
+            self._total_bytes = None
+            return None
+
+        # 刷新 mtime，作为 LRU 的最近使用时间
+        os.utime(path)
+        return table.to_utterances()
+
+    def _store(self, key: str, utterances: list[Utterance]) -> None:
+        path = self._path_for(key)
+        data = dumps_table(UtteranceTable.from_utterances(utterances), compress=True)
+        old_size = path.stat().st_size if path.exists() else 0
+        write_bytes_atomic(path, data)
+
+        if self._total_bytes is not None:
+            self._total_bytes += path.stat().st_size - old_size
+        self._evict()
+
+    def _evict(self) -> None:
+        if self._total_bytes is None:
+            self._total_bytes = sum(p.stat().st_size for p in self._entries())
+        if self._total_bytes <= self.max_bytes:
+            return
+
+        target = self.max_bytes * _LOW_WATER
+        entries = sorted(self._entries(), key=lambda p: p.stat().st_mtime)
+        # 以本次扫描为准重新计数，顺带纠正其他进程写入造成的偏差
+        self._total_bytes = sum(p.stat().st_size for p in entries)
+        for path in entries:
+            if self._total_bytes <= target:
+                break
+            size = path.stat().st_size
+            path.unlink(missing_ok=True)
+            self._total_bytes -= size
+        logger.info(f"ASR 缓存淘汰后大小: {self._total_bytes / 1024 / 1024:.1f}MB")
+
+    def _entries(self) -> list[Path]:
+        if not self.cache_dir.exists():
+            return []
+        suffixes = (_SUFFIX, *_LEGACY_SUFFIXES)
+        return [p for suffix in suffixes for p in self.cache_dir.glob(f"*/*{suffix}")]
+
+
+def _audio_digest(path: Path) -> bytes:
+    """WAV 只哈希格式参数与 PCM 帧（忽略文件头里的元数据）；其他格式哈希整个文件。"""
+
+    try:
+        h = hashlib.sha256()
+        with wave.open(str(path), "rb") as wf:
+            h.update(
+                f"{wf.getnchannels()}:{wf.getsampwidth()}:{wf.getframerate()}".encode("ascii")
+            )
+            frames_per_block = max(1, _READ_BLOCK // (wf.getnchannels() * wf.getsampwidth()))
+            while block := wf.readframes(frames_per_block):
+                h.update(block)
+        return h.digest()
+    except (wave.Error, EOFError):
+        pass
+
+    h = hashlib.sha256()
+    with path.open("rb") as f:
+        while block := f.read(_READ_BLOCK):
+            h.update(block)
+    return h.digest()
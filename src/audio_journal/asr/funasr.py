@@ -1,10 +1,15 @@
 from __future__ import annotations
 
+import bisect
+import copy
 import logging
+import time
+import wave
 from pathlib import Path
-from typing import Any
+from typing import Any, Optional
 
 from audio_journal.asr.base import ASREngine
+from audio_journal.chunker.vad_chunker import read_speech_regions
 from audio_journal.config import ASRConfig
 from audio_journal.models.schemas import Speaker, Utterance
 
@@ -25,6 +30,14 @@ class FunASREngine(ASREngine):
         self.config = config
         self.model_dir = Path(model_dir)
         self._model: Any = None
+        self._fallback_model: Any = None
+        self._region_models: Optional[tuple[Any, Any]] = None
+        # 启动时的模型加载耗时与来源（snapshot / cold）
+        self.load_seconds = 0.0
+        self.load_source = "cold"
+        # 最近一次调用中各音频的说话人分离状态（ok / fallback / disabled），供遥测使用
+        self.last_diarization: dict[str, str] = {}
+        self._speaker_enabled = False
         self._load_model()
 
     def _load_model(self) -> None:
@@ -78,13 +91,24 @@ class FunASREngine(ASREngine):
         enable_speaker = getattr(self.config, "enable_speaker_diarization", True)
         if enable_speaker and spk_model_path.exists():
             model_kwargs["spk_model"] = str(spk_model_path)
+            self._speaker_enabled = True
             logger.info("  - 说话人分离: 已启用")
         else:
             logger.warning("  - 说话人分离: 已禁用")
 
-        self._model = AutoModel(**model_kwargs)
+        if self.config.model_snapshot:
+            from audio_journal.asr.snapshot import ModelSnapshotCache
 
-        logger.info("FunASR 模型加载完成")
+            cache = ModelSnapshotCache(self.model_dir / ".snapshots")
+            self._model, self.load_source, self.load_seconds = cache.load_or_build(
+                model_kwargs, lambda: AutoModel(**model_kwargs)
+            )
+        else:
+            t0 = time.perf_counter()
+            self._model = AutoModel(**model_kwargs)
+            self.load_seconds = time.perf_counter() - t0
+
+        logger.info(f"FunASR 模型加载完成（{self.load_source}）: {self.load_seconds:.2f}s")
 
     def transcribe(self, audio_path: str) -> list[Utterance]:
         """转写音频文件。
@@ -95,153 +119,282 @@ class FunASREngine(ASREngine):
         Returns:
             带时间戳与说话人标签的 utterances
         """
-        if self._model is None:
-            raise RuntimeError("FunASR 模型未加载")
+        if self.config.vad_source == "chunker":
+            regions = read_speech_regions(audio_path)
+            if regions is not None:
+                self.last_diarization = {audio_path: "disabled"}
+                return self._transcribe_regions(audio_path, regions)
 
         logger.info(f"转写音频: {audio_path}")
 
+        result = self._generate(audio_path)
+
+        # 解析结果
+        utterances: list[Utterance] = []
+
+        # FunASR 返回格式可能是嵌套的，需要处理
+        if not result:
+            logger.warning(f"FunASR 返回空结果: {audio_path}")
+            return utterances
+
+        # result 通常是 list[dict]，每个 dict 包含一个音频文件的结果
+        logger.debug(f"FunASR 返回 {type(result).__name__}，共 {len(result)} 个结果")
+        for item in result:
+            utterances.extend(self._parse_item(item))
+
+        logger.info(f"转写完成: {len(utterances)} 条 utterances")
+        return utterances
+
+    def transcribe_many(self, audio_paths: list[str]) -> list[list[Utterance]]:
+        """一次 generate 调用转写多个 chunk，按输入顺序返回各自的 utterances。
+
+        FunASR 对 list 输入每个文件返回一个结果，并带 key（文件名去扩展名）；
+        优先按 key 对齐，key 缺失或重复时退化为按位置对齐。
+        """
+        if not audio_paths:
+            return []
+        if len(audio_paths) == 1 or self.config.vad_source == "chunker":
+            # chunker 语音区间模式下，每个文件的各区间已在 _transcribe_regions 内批量解码
+            outputs = []
+            statuses: dict[str, str] = {}
+            for p in audio_paths:
+                outputs.append(self.transcribe(p))
+                statuses.update(self.last_diarization)
+            self.last_diarization = statuses
+            return outputs
+
+        logger.info(f"批量转写 {len(audio_paths)} 个音频")
+        result = self._generate(list(audio_paths))
+        items = [item for item in (result or []) if isinstance(item, dict)]
+
+        keys = [Path(p).stem for p in audio_paths]
+        by_key: dict[str, dict] = {}
+        if len(set(keys)) == len(keys):
+            by_key = {str(item["key"]): item for item in items if "key" in item}
+
+        outputs: list[list[Utterance]] = []
+        for i, key in enumerate(keys):
+            item = by_key.get(key) if by_key else (items[i] if i < len(items) else None)
+            if item is None:
+                logger.warning(f"FunASR 批量结果缺失: {audio_paths[i]}")
+                outputs.append([])
+                continue
+            outputs.append(self._parse_item(item))
+
+        logger.info(f"批量转写完成: {sum(len(u) for u in outputs)} 条 utterances")
+        return outputs
+
+    def _generate(self, audio_input: str | list[str]) -> Any:
+        if self._model is None:
+            raise RuntimeError("FunASR 模型未加载")
+
         # FunASR generate 方法
         # 返回格式: list[dict] with keys: text, timestamp, speaker
         # 重要：使用 VAD 模式时必须设置 sentence_timestamp=True 才能获取时间戳
+        paths = [audio_input] if isinstance(audio_input, str) else list(audio_input)
+        status = "ok" if self._speaker_enabled else "disabled"
+        self.last_diarization = {p: status for p in paths}
         try:
-            result = self._model.generate(
-                input=audio_path,
-                batch_size=self.config.batch_size,
-                language=self.config.language,
-                sentence_timestamp=True,  # 启用句子级时间戳
-            )
+            return self._run(self._model, audio_input)
         except AssertionError as e:
             # 说话人分离可能失败（segments 和 labels 数量不匹配）
-            # 降级：禁用说话人分离重试
             logger.warning(f"说话人分离失败，降级处理（不使用说话人分离）: {e}")
-            logger.info("重新加载模型（不含说话人分离）...")
 
-            # 重新加载模型，不使用说话人分离
-            asr_model_path = self.model_dir / self.config.model
-            vad_model_path = self.model_dir / self.config.vad_model
-            punc_model_path = self.model_dir / self.config.punc_model
+        if isinstance(audio_input, str):
+            self.last_diarization[audio_input] = "fallback"
+            return self._run(self._get_fallback_model(), audio_input)
+
+        # 批量输入：逐个重试，只有仍然失败的 chunk 才降级，其余保留说话人分离
+        results: list[Any] = []
+        for path in audio_input:
+            try:
+                results.extend(self._run(self._model, path) or [])
+            except AssertionError as e:
+                logger.warning(f"说话人分离失败，降级处理: {path}: {e}")
+                self.last_diarization[path] = "fallback"
+                results.extend(self._run(self._get_fallback_model(), path) or [])
+        return results
+
+    def _run(self, model: Any, audio_input: str | list[str]) -> Any:
+        return model.generate(
+            input=audio_input,
+            batch_size=self.config.batch_size,
+            language=self.config.language,
+            sentence_timestamp=True,  # 启用句子级时间戳
+        )
+
+    def _get_fallback_model(self) -> Any:
+        """不含说话人分离的降级模型，首次需要时构建并缓存。
+
+        优先复用主模型的 ASR/VAD/标点权重：浅拷贝 AutoModel 并去掉 spk_model，
+        不重新加载任何权重；主模型保持不变，后续 chunk 仍使用说话人分离。
+        """
+        if self._fallback_model is not None:
+            return self._fallback_model
 
+        if hasattr(self._model, "spk_model"):
+            fallback = copy.copy(self._model)
+            fallback.spk_model = None
+        else:
+            # 非预期的 AutoModel 结构，退化为单独加载一次
+            logger.info("加载降级模型（不含说话人分离）...")
             from funasr import AutoModel
-            self._model = AutoModel(
-                model=str(asr_model_path),
-                vad_model=str(vad_model_path),
-                punc_model=str(punc_model_path),
+
+            fallback = AutoModel(
+                model=str(self.model_dir / self.config.model),
+                vad_model=str(self.model_dir / self.config.vad_model),
+                punc_model=str(self.model_dir / self.config.punc_model),
                 device=self.config.device,
             )
+        self._fallback_model = fallback
+        return fallback
 
-            # 重试
-            result = self._model.generate(
-                input=audio_path,
-                batch_size=self.config.batch_size,
-                language=self.config.language,
-                sentence_timestamp=True,  # 启用句子级时间戳
-            )
+    def _transcribe_regions(
+        self, audio_path: str, regions: list[tuple[float, float]]
+    ) -> list[Utterance]:
+        """只解码 chunker 能量包络给出的语音区间，不经过 fsmn-vad。
+
+        各区间作为一批输入送给 ASR 模型，再逐条补标点；静音 chunk 直接返回空。
+        该路径没有 VAD 句子切分，不做说话人分离，说话人统一为 SPEAKER_00。
+        """
+        logger.info(f"转写音频（chunker 语音区间 {len(regions)} 段）: {audio_path}")
+        if not regions:
+            return []
+
+        import numpy as np
+
+        with wave.open(audio_path, "rb") as wf:
+            rate = wf.getframerate()
+            channels = wf.getnchannels()
+            frames = wf.readframes(wf.getnframes())
+        pcm = np.frombuffer(frames, dtype="<i2")[::channels].astype(np.float32) / 32768.0
+        clips = [pcm[int(a * rate) : int(b * rate)] for a, b in regions]
+
+        asr_model, punc_model = self._get_region_models()
+        result = asr_model.generate(input=clips, batch_size=self.config.batch_size, fs=rate)
 
-        # 解析结果
         utterances: list[Utterance] = []
+        for (region_start, region_end), item in zip(regions, result or []):
+            text = str(item.get("text", "")).strip() if isinstance(item, dict) else ""
+            if not text:
+                continue
+            if punc_model is not None:
+                punc_result = punc_model.generate(input=text)
+                if punc_result and isinstance(punc_result[0], dict):
+                    text = str(punc_result[0].get("text", text))
+            # 区间内的 token 时间戳（毫秒）用于收紧起止时间
+            ts = item.get("timestamp") or []
+            start = region_start + ts[0][0] / 1000.0 if ts else region_start
+            end = region_start + ts[-1][1] / 1000.0 if ts else region_end
+            utterances.append(
+                Utterance(
+                    speaker=Speaker(id="SPEAKER_00"),
+                    text=text,
+                    start_time=start,
+                    end_time=end,
+                )
+            )
 
-        # FunASR 返回格式可能是嵌套的，需要处理
-        if not result:
-            logger.warning(f"FunASR 返回空结果: {audio_path}")
+        logger.info(f"转写完成: {len(utterances)} 条 utterances")
+        return utterances
+
+    def _get_region_models(self) -> tuple[Any, Any]:
+        """(仅 ASR, 仅标点) 两个视图，与主模型共享权重。
+
+        AutoModel 在 vad_model 为空时直接对输入做单模型推理，
+        因此浅拷贝后去掉 VAD/标点/说话人模型即可得到纯 ASR；标点视图同理换入 punc 模型。
+        """
+        if self._region_models is None:
+            asr = copy.copy(self._model)
+            asr.vad_model = asr.punc_model = asr.spk_model = None
+
+            punc = None
+            if getattr(self._model, "punc_model", None) is not None:
+                punc = copy.copy(self._model)
+                punc.model = self._model.punc_model
+                punc.kwargs = self._model.punc_kwargs
+                punc.vad_model = punc.punc_model = punc.spk_model = None
+            self._region_models = (asr, punc)
+        return self._region_models
+
+    def _parse_item(self, item: Any) -> list[Utterance]:
+        """解析 generate 返回的单个音频结果。"""
+        utterances: list[Utterance] = []
+        if not isinstance(item, dict):
+            logger.warning(f"FunASR 返回格式异常: {type(item)}")
             return utterances
 
-        # result 通常是 list[dict]，每个 dict 包含一个音频文件的结果
-        print(f"\n=== FunASR 返回结果调试 ===")
-        print(f"result 类型: {type(result)}")
-        print(f"result 长度: {len(result) if isinstance(result, (list, tuple)) else 'N/A'}")
-
-        for idx, item in enumerate(result):
-            print(f"\n--- 处理第 {idx+1} 个结果 ---")
-            if not isinstance(item, dict):
-                logger.warning(f"FunASR 返回格式异常: {type(item)}")
-                continue
+        logger.debug(f"FunASR 结果键: {list(item.keys())}")
 
-            # 调试：打印所有键和值的类型
-            print(f"所有键: {list(item.keys())}")
-            for key, value in item.items():
-                if isinstance(value, str):
-                    print(f"  {key}: str[{len(value)}]")
-                elif isinstance(value, list):
-                    print(f"  {key}: list[{len(value)}]")
-                    if value and len(value) <= 3:
-                        print(f"    示例: {value}")
-                elif isinstance(value, dict):
-                    print(f"  {key}: dict with keys {list(value.keys())}")
-                else:
-                    print(f"  {key}: {type(value)}")
-
-            # 提取文本和时间戳
-            text = item.get("text", "")
-
-            # 检查 sentence_info（使用 sentence_timestamp=True 时的返回格式）
-            sentence_info = item.get("sentence_info", [])
-
-            # 尝试多种可能的键名
-            timestamp = (item.get("timestamp") or
-                        item.get("timestamps") or
-                        item.get("time") or
-                        [])
-
-            speaker = (item.get("speaker") or
-                      item.get("speakers") or
-                      item.get("spk") or
-                      [])
-
-            print(f"\n提取结果:")
-            print(f"  text 长度: {len(text)}")
-            print(f"  sentence_info: {type(sentence_info)}, 长度: {len(sentence_info) if sentence_info else 0}")
-            print(f"  timestamp: {type(timestamp)}, 长度: {len(timestamp) if timestamp else 0}")
-            print(f"  speaker: {type(speaker)}, 长度: {len(speaker) if speaker else 0}")
-
-            # 如果有 sentence_info，使用它来构建 utterances
-            if sentence_info:
-                print(f"\n✅ 找到 sentence_info，使用句子级时间戳")
-                for sent in sentence_info:
-                    if isinstance(sent, dict):
-                        sent_text = sent.get("text", "")
-                        sent_start = sent.get("start", 0) / 1000.0  # 转换为秒
-                        sent_end = sent.get("end", 0) / 1000.0
-                        sent_speaker = sent.get("spk", "SPEAKER_00")
-
-                        if sent_text.strip():
-                            utterances.append(
-                                Utterance(
-                                    speaker=Speaker(id=sent_speaker),
-                                    text=sent_text,
-                                    start_time=sent_start,
-                                    end_time=sent_end,
-                                )
-                            )
-                continue  # 跳过后续的 timestamp 处理
-
-            # 如果 timestamp 是空的，尝试从 text 中按固定长度分段
-            if not timestamp and text:
-                print(f"\n⚠️  没有时间戳信息，将按固定长度分段")
-                # 按句子分段（简单实现）
-                sentences = text.split('。')
-                for i, sent in enumerate(sentences):
-                    if sent.strip():
+        # 提取文本和时间戳
+        text = item.get("text", "")
+
+        # 检查 sentence_info（使用 sentence_timestamp=True 时的返回格式）
+        sentence_info = item.get("sentence_info", [])
+
+        # 尝试多种可能的键名
+        timestamp = (item.get("timestamp") or
+                    item.get("timestamps") or
+                    item.get("time") or
+                    [])
+
+        speaker = (item.get("speaker") or
+                  item.get("speakers") or
+                  item.get("spk") or
+                  [])
+
+        logger.debug(
+            f"text={len(text)} sentence_info={len(sentence_info or [])} "
+            f"timestamp={len(timestamp or [])} speaker={len(speaker or [])}"
+        )
+
+        # 如果有 sentence_info，使用它来构建 utterances
+        if sentence_info:
+            for sent in sentence_info:
+                if isinstance(sent, dict):
+                    sent_text = sent.get("text", "")
+                    sent_start = sent.get("start", 0) / 1000.0  # 转换为秒
+                    sent_end = sent.get("end", 0) / 1000.0
+                    sent_speaker = sent.get("spk", "SPEAKER_00")
+
+                    if sent_text.strip():
                         utterances.append(
                             Utterance(
-                                speaker=Speaker(id="SPEAKER_00"),
-                                text=sent + '。',
-                                start_time=float(i * 10),  # 假设每句10秒
-                                end_time=float((i + 1) * 10),
+                                speaker=Speaker(id=sent_speaker),
+                                text=sent_text,
+                                start_time=sent_start,
+                                end_time=sent_end,
                             )
                         )
-                continue
+            return utterances  # 跳过后续的 timestamp 处理
+
+        # 如果 timestamp 是空的，尝试从 text 中按固定长度分段
+        if not timestamp and text:
+            logger.warning("FunASR 结果没有时间戳信息，按固定长度分段")
+            # 按句子分段（简单实现）
+            sentences = text.split('。')
+            for i, sent in enumerate(sentences):
+                if sent.strip():
+                    utterances.append(
+                        Utterance(
+                            speaker=Speaker(id="SPEAKER_00"),
+                            text=sent + '。',
+                            start_time=float(i * 10),  # 假设每句10秒
+                            end_time=float((i + 1) * 10),
+                        )
+                    )
+            return utterances
 
-            # timestamp 格式: [[start_ms, end_ms, word], ...]
-            # speaker 格式: [[start_ms, end_ms, speaker_id], ...]
+        # timestamp 格式: [[start_ms, end_ms, word], ...]
+        # speaker 格式: [[start_ms, end_ms, speaker_id], ...]
 
-            # 如果有说话人分离结果，按说话人分段
-            if speaker:
-                utterances.extend(self._parse_with_speaker(text, timestamp, speaker))
-            else:
-                # 没有说话人分离，按时间戳分段
-                utterances.extend(self._parse_without_speaker(text, timestamp))
+        # 如果有说话人分离结果，按说话人分段
+        if speaker:
+            utterances.extend(self._parse_with_speaker(text, timestamp, speaker))
+        else:
+            # 没有说话人分离，按时间戳分段
+            utterances.extend(self._parse_without_speaker(text, timestamp))
 
-        logger.info(f"转写完成: {len(utterances)} 条 utterances")
         return utterances
 
     def _parse_with_speaker(
@@ -249,6 +402,7 @@ class FunASREngine(ASREngine):
     ) -> list[Utterance]:
         """解析带说话人分离的结果。"""
         utterances: list[Utterance] = []
+        words = _WordIndex(timestamp)
 
         # speaker 格式: [[start_ms, end_ms, speaker_id], ...]
         for spk_seg in speaker:
@@ -260,9 +414,7 @@ class FunASREngine(ASREngine):
             end_time = end_ms / 1000.0
 
             # 提取该说话人时间段内的文本
-            segment_text = self._extract_text_in_range(
-                text, timestamp, start_ms, end_ms
-            )
+            segment_text = words.text_in_range(start_ms, end_ms)
 
             if segment_text.strip():
                 utterances.append(
@@ -307,21 +459,6 @@ class FunASREngine(ASREngine):
 
         return utterances
 
-    def _extract_text_in_range(
-        self, text: str, timestamp: list, start_ms: float, end_ms: float
-    ) -> str:
-        """提取指定时间范围内的文本。"""
-        words = []
-        for ts in timestamp:
-            if len(ts) < 3:
-                continue
-            word_start, word_end, word = ts[0], ts[1], ts[2]
-            # 判断词是否在时间范围内
-            if word_start >= start_ms and word_end <= end_ms:
-                words.append(word)
-
-        return "".join(words)
-
     def _split_by_punctuation(
         self, text: str, timestamp: list
     ) -> list[tuple[str, float, float]]:
@@ -358,3 +495,27 @@ class FunASREngine(ASREngine):
             sentences.append(("".join(current_words), current_start, current_end))
 
         return sentences
+
+
+class _WordIndex:
+    """按开始时间排序的词索引，用于按说话人时间段取词。
+
+    取词规则：start >= 段开始 且 end <= 段结束，输出保持原 timestamp 顺序。
+    构建 O(n log n)，每次查询 O(log n + k)，避免每个说话人段都全量扫描。
+    """
+
+    def __init__(self, timestamp: list) -> None:
+        # (start, end, 原始下标, word)
+        words = [(ts[0], ts[1], i, ts[2]) for i, ts in enumerate(timestamp) if len(ts) >= 3]
+        self._words = sorted((w for w in words if w[1] >= w[0]), key=lambda w: w[0])
+        self._starts = [w[0] for w in self._words]
+        # end < start 的异常词无法用开始时间上界剪枝，单独线性检查（通常为空）
+        self._degenerate = [w for w in words if w[1] < w[0]]
+
+    def text_in_range(self, start_ms: float, end_ms: float) -> str:
+        lo = bisect.bisect_left(self._starts, start_ms)
+        hi = bisect.bisect_right(self._starts, end_ms)
+        hits = [w for w in self._words[lo:hi] if w[1] <= end_ms]
+        hits.extend(w for w in self._degenerate if w[0] >= start_ms and w[1] <= end_ms)
+        hits.sort(key=lambda w: w[2])
+        return "".join(w[3] for w in hits)
@@ -0,0 +1,132 @@
+"""ONNX Runtime ASR 后端（funasr-onnx，int8 量化）。
+
+CPU 主机上 torch 版 paraformer 推理是最大开销；导出为 ONNX 并做 int8 动态量化后
+由 onnxruntime 执行，速度与内存占用都明显下降。模型需先用
+`scripts/export_onnx_models.py` 导出（量化版为模型目录下的 model_quant.onnx）。
+
+流程：fsmn-vad 切出语音段 → paraformer 逐段识别 → ct-punc 补标点，
+每个语音段产出一条 utterance。ONNX 路径没有 cam++ 说话人分离，说话人统一为 SPEAKER_00。
+"""
+from __future__ import annotations
+
+import logging
+from pathlib import Path
+from typing import Any
+
+from audio_journal.asr.base import ASREngine
+from audio_journal.config import ASRConfig
+from audio_journal.models.schemas import Speaker, Utterance
+
+logger = logging.getLogger(__name__)
+
+_SAMPLE_RATE = 16000
+
+_MISSING_DEPS = "ONNX 后端依赖未安装。请运行: pip install 'audio-journal[onnx]'"
+
+
+class OnnxASREngine(ASREngine):
+    """基于 funasr-onnx 的 CPU ASR 引擎。"""
+
+    def __init__(self, config: ASRConfig, model_dir: str | Path = "./models") -> None:
+        self.config = config
+        self.model_dir = Path(model_dir)
+        self._asr: Any = None
+        self._vad: Any = None
+        self._punc: Any = None
+        self._load_model()
+
+    def _load_model(self) -> None:
+        try:
+            from funasr_onnx import CT_Transformer, Fsmn_vad, Paraformer
+        except ImportError as e:
+            raise RuntimeError(_MISSING_DEPS) from e
+
+        onnx_cfg = self.config.onnx
+        model_file = "model_quant.onnx" if onnx_cfg.quantize else "model.onnx"
+        paths = {
+            "ASR": self.model_dir / self.config.model,
+            "VAD": self.model_dir / self.config.vad_model,
+            "标点": self.model_dir / self.config.punc_model,
+        }
+        missing = [
+            f"{name} ({p / model_file})"
+            for name, p in paths.items()
+            if not (p / model_file).exists()
+        ]
+        if missing:
+            raise RuntimeError(
+                "ONNX 模型文件缺失（请先运行 scripts/export_onnx_models.py）:\n"
+                + "\n".join(f"  - {m}" for m in missing)
+            )
+
+        logger.info(f"加载 ONNX 模型（quantize={onnx_cfg.quantize}）: {self.config.model}")
+        kwargs = {
+            "quantize": onnx_cfg.quantize,
+            "intra_op_num_threads": onnx_cfg.intra_op_num_threads,
+        }
+        self._asr = Paraformer(str(paths["ASR"]), batch_size=1, **kwargs)
+        self._vad = Fsmn_vad(str(paths["VAD"]), **kwargs)
+        self._punc = CT_Transformer(str(paths["标点"]), **kwargs)
+
+    def transcribe(self, audio_path: str) -> list[Utterance]:
+        logger.info(f"转写音频（ONNX）: {audio_path}")
+        waveform = _load_audio(audio_path)
+
+        utterances: list[Utterance] = []
+        for beg_ms, end_ms in _vad_segments(self._vad(waveform)):
+            speech = waveform[_ms_to_sample(beg_ms) : _ms_to_sample(end_ms)]
+            if len(speech) == 0:
+                continue
+            text = _preds_text(self._asr(speech))
+            if not text:
+                continue
+            text = self._punc(text)[0]
+            utterances.append(
+                Utterance(
+                    speaker=Speaker(id="SPEAKER_00"),
+                    text=text,
+                    start_time=beg_ms / 1000.0,
+                    end_time=end_ms / 1000.0,
+                )
+            )
+
+        logger.info(f"转写完成: {len(utterances)} 条 utterances")
+        return utterances
+
+
+def _load_audio(audio_path: str) -> Any:
+    """读取为 16kHz 单声道 float32（funasr-onnx 依赖 librosa，顺带完成重采样）。"""
+
+    try:
+        import librosa
+    except ImportError as e:
+        raise RuntimeError(_MISSING_DEPS) from e
+
+    waveform, _ = librosa.load(audio_path, sr=_SAMPLE_RATE, mono=True)
+    return waveform
+
+
+def _vad_segments(result: Any) -> list[list[float]]:
+    """Fsmn_vad 对单条输入返回 [[[beg_ms, end_ms], ...]]，部分版本少一层嵌套。"""
+
+    if not result or not result[0]:
+        return []
+    first = result[0]
+    if isinstance(first[0], (list, tuple)):
+        return list(first)
+    return list(result)
+
+
+def _ms_to_sample(ms: float) -> int:
+    return int(ms * _SAMPLE_RATE / 1000)
+
+
+def _preds_text(result: Any) -> str:
+    if not result:
+        return ""
+    item = result[0]
+    preds = item.get("preds", "") if isinstance(item, dict) else item
+    # 旧版本返回 (text, tokens)
+    if isinstance(preds, (list, tuple)):
+        preds = preds[0] if preds else ""
+    return str(preds).strip()
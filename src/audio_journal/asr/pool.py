@@ -0,0 +1,151 @@
+"""多进程 CPU ASR：每个 worker 常驻一份模型，按 chunk 分片转写。
+
+单进程 + torch 默认线程数在多核 CPU 上扩展性很差（算子级并行粒度太细）。
+改为 N 个进程各自固定 torch 线程数、各自加载模型，chunk 之间天然并行。
+"""
+from __future__ import annotations
+
+import logging
+import multiprocessing
+import os
+import wave
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from pathlib import Path
+from typing import Callable, Optional
+
+from audio_journal.asr.base import ASREngine
+from audio_journal.asr.supervisor import ASRWorkerError
+from audio_journal.models.schemas import Utterance
+
+logger = logging.getLogger(__name__)
+
+# worker 进程内的常驻引擎（由 initializer 构建）
+_worker_engine: Optional[ASREngine] = None
+
+_THREAD_ENV_VARS = ("OMP_NUM_THREADS", "MKL_NUM_THREADS", "OPENBLAS_NUM_THREADS")
+
+
+class ProcessPoolASREngine(ASREngine):
+    """进程池 ASR 引擎。
+
+    engine_factory 在每个 worker 内调用一次以构建常驻引擎，必须可 pickle
+    （模块级函数或 functools.partial）。worker 使用 spawn 启动，避免 fork
+    继承父进程的 torch 线程池状态。
+
+    transcribe_many 按音频时长从长到短提交（LPT 调度），空闲 worker 总是
+    领取剩余最长的 chunk，使总耗时（makespan）接近最优。
+
+    worker 崩溃（如被 OOM 杀掉）会使整个进程池失效：丢弃旧池，下次调用时重建；
+    单个 chunk 失败转为 ASRWorkerError，由 Pipeline 跳过该 chunk。
+    """
+
+    def __init__(
+        self,
+        engine_factory: Callable[[], ASREngine],
+        *,
+        workers: int,
+        threads_per_worker: int = 0,
+    ) -> None:
+        self.engine_factory = engine_factory
+        self.workers = max(1, workers)
+        # 0 表示按核数均分
+        self.threads_per_worker = threads_per_worker or max(
+            1, (os.cpu_count() or 1) // self.workers
+        )
+        self._executor: Optional[ProcessPoolExecutor] = None
+
+    def transcribe(self, audio_path: str) -> list[Utterance]:
+        try:
+            return self._pool().submit(_transcribe_in_worker, audio_path).result()
+        except BrokenProcessPool as e:
+            self._discard_pool()
+            raise ASRWorkerError(f"ASR worker 进程崩溃: {audio_path}") from e
+
+    def transcribe_many(self, audio_paths: list[str]) -> list[list[Utterance]]:
+        pool = self._pool()
+        futures: dict[int, Future[list[Utterance]]] = {}
+        try:
+            for i in longest_first(audio_paths):
+                futures[i] = pool.submit(_transcribe_in_worker, audio_paths[i])
+            return [futures[i].result() for i in range(len(audio_paths))]
+        except BrokenProcessPool:
+            # 无法得知是哪个 chunk 导致崩溃：重建进程池后逐个重跑，让出问题的 chunk 单独失败
+            self._discard_pool()
+            logger.warning(f"ASR 进程池崩溃，改为逐个转写 {len(audio_paths)} 个 chunk")
+            return [self.transcribe(p) for p in audio_paths]
+
+    def close(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+    def _discard_pool(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    def _pool(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            logger.info(
+                f"启动 ASR 进程池: {self.workers} workers × {self.threads_per_worker} 线程"
+            )
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_worker,
+                initargs=(self.engine_factory, self.threads_per_worker),
+            )
+        return self._executor
+
+
+def longest_first(audio_paths: list[str]) -> list[int]:
+    """按音频时长降序返回下标；时长相同保持原顺序。"""
+
+    durations = [_duration_hint(Path(p)) for p in audio_paths]
+    return sorted(range(len(audio_paths)), key=lambda i: -durations[i])
+
+
+def _duration_hint(path: Path) -> float:
+    """WAV 读帧数换算秒数；其他格式用文件大小近似（只用于排序）。"""
+
+    try:
+        with wave.open(str(path), "rb") as wf:
+            return wf.getnframes() / float(wf.getframerate())
+    except (wave.Error, EOFError, OSError):
+        pass
+    try:
+        return float(path.stat().st_size)
+    except OSError:
+        return 0.0
+
+
+def _init_worker(engine_factory: Callable[[], ASREngine], num_threads: int) -> None:
+    # 必须在 import torch 之前设置，OpenMP/MKL 只在初始化时读取
+    for var in _THREAD_ENV_VARS:
+        os.environ[var] = str(num_threads)
+    _pin_torch_threads(num_threads)
+
+    global _worker_engine
+    _worker_engine = engine_factory()
+
+
+def _pin_torch_threads(num_threads: int) -> None:
+    try:
+        import torch
+    except ImportError:
+        return
+    torch.set_num_threads(num_threads)
+    try:
+        # 跨算子并行与进程级并行重叠，固定为 1
+        torch.set_num_interop_threads(1)
+    except RuntimeError:
+        # 已有并行任务运行后不可再设置
+        pass
+
+
+def _transcribe_in_worker(audio_path: str) -> list[Utterance]:
+    if _worker_engine is None:
+        raise RuntimeError("ASR worker 未初始化")
+    return _worker_engine.transcribe(audio_path)
+
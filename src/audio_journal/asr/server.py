@@ -0,0 +1,172 @@
+"""常驻 ASR 服务（本地 Unix socket）。
+
+模型只在服务进程里加载一次，`process`/`batch`/`start` 通过 RemoteASREngine
+复用，冷启动成本从“每次调用”降为“每次开机”。
+
+协议：每个连接一问一答，请求与响应各为一行 JSON。
+  请求  {"op": "ping"}
+        | {"op": "transcribe", "audio_path": "/abs/path.wav"}
+        | {"op": "transcribe_many", "audio_paths": ["/abs/a.wav", ...]}
+  响应  {"ok": true, ...} | {"ok": false, "error": "...", "kind": "engine" | "worker"}
+
+kind 为 worker 表示服务端受监管的 ASR worker 超时或崩溃，客户端还原为 ASRWorkerError，
+由 Pipeline 跳过该 chunk；其余错误为 RuntimeError。
+"""
+from __future__ import annotations
+
+import json
+import logging
+import os
+import socket
+import socketserver
+import threading
+from pathlib import Path
+from typing import Any, Optional
+
+from audio_journal.asr.base import ASREngine
+from audio_journal.asr.supervisor import ASRWorkerError
+from audio_journal.models.schemas import Utterance
+
+logger = logging.getLogger(__name__)
+
+
+class ASRServer:
+    """把任意 ASREngine 暴露在本地 Unix socket 上。
+
+    连接可并发接入，但转写串行执行（模型实例非线程安全）。
+    socket 文件权限为 0600，仅当前用户可访问。
+    """
+
+    def __init__(self, engine: ASREngine, socket_path: str | Path) -> None:
+        self.engine = engine
+        self.socket_path = Path(socket_path)
+        self._engine_lock = threading.Lock()
+        self._server: Optional[socketserver.ThreadingUnixStreamServer] = None
+
+    def serve_forever(self) -> None:
+        self._prepare_socket_path()
+        server = self._make_server()
+        self._server = server
+        os.chmod(self.socket_path, 0o600)
+        logger.info(f"ASR 服务已启动: {self.socket_path}")
+        try:
+            server.serve_forever()
+        finally:
+            server.server_close()
+            self.socket_path.unlink(missing_ok=True)
+
+    def shutdown(self) -> None:
+        if self._server is not None:
+            self._server.shutdown()
+
+    def handle(self, request: dict[str, Any]) -> dict[str, Any]:
+        op = request.get("op")
+        if op == "ping":
+            return {"ok": True}
+        if op == "transcribe":
+            audio_path = str(request.get("audio_path", ""))
+            with self._engine_lock:
+                utterances = self.engine.transcribe(audio_path)
+            return {"ok": True, "utterances": [u.model_dump(mode="json") for u in utterances]}
+        if op == "transcribe_many":
+            audio_paths = [str(p) for p in request.get("audio_paths", [])]
+            with self._engine_lock:
+                batches = self.engine.transcribe_many(audio_paths)
+            return {
+                "ok": True,
+                "batches": [[u.model_dump(mode="json") for u in utts] for utts in batches],
+            }
+        return {"ok": False, "error": f"未知操作: {op!r}"}
+
+    def _prepare_socket_path(self) -> None:
+        if not self.socket_path.exists():
+            self.socket_path.parent.mkdir(parents=True, exist_ok=True)
+            return
+        if _ping(self.socket_path, timeout_s=1.0):
+            raise RuntimeError(f"ASR 服务已在运行: {self.socket_path}")
+        # 上次异常退出遗留的 socket 文件
+        self.socket_path.unlink()
+
+    def _make_server(self) -> socketserver.ThreadingUnixStreamServer:
+        outer = self
+
+        class _Handler(socketserver.StreamRequestHandler):
+            def handle(self) -> None:
+                line = self.rfile.readline()
+                if not line:
+                    return
+                try:
+                    response = outer.handle(json.loads(line))
+                except ASRWorkerError as e:
+                    logger.error(f"ASR worker 失败: {e}")
+                    response = {"ok": False, "error": str(e), "kind": "worker"}
+                except Exception as e:  # noqa: BLE001
+                    logger.exception("ASR 请求处理失败")
+                    response = {"ok": False, "error": f"{type(e).__name__}: {e}", "kind": "engine"}
+                self.wfile.write(json.dumps(response, ensure_ascii=False).encode("utf-8") + b"\n")
+
+        server = socketserver.ThreadingUnixStreamServer(str(self.socket_path), _Handler)
+        server.daemon_threads = True
+        return server
+
+
+class RemoteASREngine(ASREngine):
+    """常驻 ASR 服务的客户端。"""
+
+    def __init__(self, socket_path: str | Path, *, timeout_s: Optional[float] = None) -> None:
+        self.socket_path = Path(socket_path)
+        # 转写耗时与音频长度成正比，默认不设超时。
+        self.timeout_s = timeout_s
+
+    def is_available(self) -> bool:
+        return _ping(self.socket_path, timeout_s=1.0)
+
+    def transcribe(self, audio_path: str) -> list[Utterance]:
+        # 服务进程的工作目录可能不同，统一发送绝对路径。
+        response = _request(
+            self.socket_path,
+            {"op": "transcribe", "audio_path": str(Path(audio_path).resolve())},
+            timeout_s=self.timeout_s,
+        )
+        _raise_for_error(response)
+        return [Utterance.model_validate(u) for u in response.get("utterances", [])]
+
+    def transcribe_many(self, audio_paths: list[str]) -> list[list[Utterance]]:
+        response = _request(
+            self.socket_path,
+            {"op": "transcribe_many", "audio_paths": [str(Path(p).resolve()) for p in audio_paths]},
+            timeout_s=self.timeout_s,
+        )
+        _raise_for_error(response)
+        return [
+            [Utterance.model_validate(u) for u in utts] for utts in response.get("batches", [])
+        ]
+
+
+def _raise_for_error(response: dict[str, Any]) -> None:
+    if response.get("ok"):
+        return
+    if response.get("kind") == "worker":
+        raise ASRWorkerError(f"ASR 服务 worker 失败: {response.get('error')}")
+    raise RuntimeError(f"ASR 服务转写失败: {response.get('error')}")
+
+
+def _request(
+    socket_path: Path, payload: dict[str, Any], *, timeout_s: Optional[float]
+) -> dict[str, Any]:
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.settimeout(timeout_s)
+        sock.connect(str(socket_path))
+        sock.sendall(json.dumps(payload, ensure_ascii=False).encode("utf-8") + b"\n")
+        with sock.makefile("rb") as f:
+            line = f.readline()
+    if not line:
+        raise RuntimeError("ASR 服务连接被关闭")
+    return json.loads(line)
+
+
+def _ping(socket_path: Path, *, timeout_s: float) -> bool:
+    try:
+        return bool(_request(socket_path, {"op": "ping"}, timeout_s=timeout_s).get("ok"))
+    except (OSError, ValueError, RuntimeError):
+        return False
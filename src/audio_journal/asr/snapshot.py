@@ -0,0 +1,123 @@
+"""ASR 模型快照缓存：缩短冷启动时间。
+
+AutoModel 每次启动都要解析各模型目录的配置、反序列化权重、初始化标点/说话人模型。
+这里在首次冷启动后把初始化完成的 AutoModel 整体用 torch.save 写成快照，之后用
+torch.load(mmap=True) 载入：跳过配置解析与模块构建，权重按需从页缓存映射而不是整块拷贝。
+
+快照 key 由构建参数、各模型目录内文件的 (路径, 大小, mtime) 以及 funasr/torch 版本决定，
+模型更新或升级依赖后自动失效。
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import time
+from pathlib import Path
+from typing import Any, Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+# AutoModel 上挂载的子模型属性
+_MODULE_ATTRS = ("model", "vad_model", "punc_model", "spk_model")
+
+
+def snapshot_key(model_kwargs: dict[str, Any]) -> str:
+    """返回 "构建参数哈希-模型文件与依赖版本哈希"；前半部分相同的旧快照可安全删除。"""
+
+    params = json.dumps(model_kwargs, sort_keys=True, default=str).encode("utf-8")
+    h = hashlib.sha256()
+    for value in sorted(str(v) for v in model_kwargs.values()):
+        path = Path(value)
+        if not path.is_dir():
+            continue
+        for f in sorted(path.rglob("*")):
+            if f.is_file():
+                st = f.stat()
+                h.update(f"{f.relative_to(path)}:{st.st_size}:{st.st_mtime_ns}".encode("utf-8"))
+    h.update(_versions().encode("utf-8"))
+    return f"{hashlib.sha256(params).hexdigest()[:16]}-{h.hexdigest()[:16]}"
+
+
+class ModelSnapshotCache:
+    """按构建参数管理 AutoModel 快照（存于 root 目录，一般为 models/.snapshots）。"""
+
+    def __init__(self, root: str | Path) -> None:
+        self.root = Path(root)
+
+    def path_for(self, model_kwargs: dict[str, Any]) -> Path:
+        return self.root / f"{snapshot_key(model_kwargs)}.pt"
+
+    def load_or_build(
+        self, model_kwargs: dict[str, Any], build: Callable[[], Any]
+    ) -> tuple[Any, str, float]:
+        """返回 (模型, 来源 "snapshot"/"cold", 加载耗时秒数)。"""
+
+        path = self.path_for(model_kwargs)
+        device = str(model_kwargs.get("device", "cpu"))
+
+        t0 = time.perf_counter()
+        model = self._load(path, device)
+        if model is not None:
+            return model, "snapshot", time.perf_counter() - t0
+
+        t0 = time.perf_counter()
+        model = build()
+        elapsed = time.perf_counter() - t0
+        self._save(model, path)
+        return model, "cold", elapsed
+
+    def _load(self, path: Path, device: str) -> Optional[Any]:
+        if not path.exists():
+            return None
+        try:
+            import torch
+
+            # 权重先映射到 CPU，再整体搬到目标设备（mmap 只支持 CPU 存储）
+            model = torch.load(path, map_location="cpu", mmap=True, weights_only=False)
+        except Exception as e:  # noqa: BLE001 - 快照损坏或版本不兼容时回退冷启动
+            logger.warning(f"模型快照不可用，回退为冷启动: {path}: {e}")
+            path.unlink(missing_ok=True)
+            return None
+        if device != "cpu":
+            _move_to_device(model, device)
+        return model
+
+    def _save(self, model: Any, path: Path) -> None:
+        try:
+            import torch
+
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = path.with_suffix(".tmp")
+            torch.save(model, tmp)
+            os.replace(tmp, path)
+        except Exception as e:  # noqa: BLE001 - 部分模型对象不可序列化，只影响下次启动速度
+            logger.warning(f"写入模型快照失败，下次仍将冷启动: {e}")
+            path.with_suffix(".tmp").unlink(missing_ok=True)
+            return
+        # 同一组构建参数只保留最新快照（模型文件更新后旧快照已失效）
+        prefix = path.stem.split("-")[0]
+        for old in self.root.glob(f"{prefix}-*.pt"):
+            if old != path:
+                old.unlink(missing_ok=True)
+        logger.info(f"已写入模型快照: {path}")
+
+
+def _move_to_device(model: Any, device: str) -> None:
+    for attr in _MODULE_ATTRS:
+        module = getattr(model, attr, None)
+        if module is not None and hasattr(module, "to"):
+            setattr(model, attr, module.to(device))
+
+
+def _versions() -> str:
+    from importlib.metadata import PackageNotFoundError, version
+
+    parts = []
+    for pkg in ("funasr", "torch"):
+        try:
+            parts.append(f"{pkg}={version(pkg)}")
+        except PackageNotFoundError:
+            parts.append(f"{pkg}=?")
+    return ";".join(parts)
@@ -0,0 +1,281 @@
+"""流式 ASR（FunASR paraformer-zh-streaming）。
+
+离线 paraformer 需要完整文件；流式模型按固定时长（默认 600ms）的 PCM 块增量解码，
+配合能量端点检测切出 utterance，录音未结束时即可开始分段与分析。
+
+流式模型不含说话人分离与时间戳，utterance 时间为块粒度近似值，说话人统一为
+SPEAKER_00；可选加载标点模型在每条 utterance 结束时补标点。
+"""
+from __future__ import annotations
+
+import logging
+import math
+import struct
+import time
+from array import array
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, BinaryIO, Iterable, Iterator, Optional
+
+from audio_journal.asr.base import ASREngine
+from audio_journal.config import ASRConfig
+from audio_journal.models.schemas import Speaker, Utterance
+
+logger = logging.getLogger(__name__)
+
+# 流式 paraformer 只支持 16kHz 单声道
+_SAMPLE_RATE = 16000
+_SAMPLE_WIDTH = 2
+
+
+@dataclass
+class _StreamState:
+    cache: dict = field(default_factory=dict)
+    parts: list[str] = field(default_factory=list)
+    pos_s: float = 0.0  # 已送入模型的音频时长
+    start_s: Optional[float] = None  # 当前 utterance 首次出字的块起点
+    voice_end_s: float = 0.0  # 当前 utterance 最后一个非静音块的终点
+    silent_s: float = 0.0  # 连续静音时长
+
+
+class StreamingFunASREngine(ASREngine):
+    """基于 FunASR 流式 paraformer 的 ASR 引擎。
+
+    - stream(): 消费任意 PCM 块序列（16kHz/16-bit/单声道），边解码边产出 utterance
+    - transcribe_stream(): 跟随一个仍在写入的 WAV 文件，直到文件停止增长
+    - transcribe(): 对完整文件走同一流式路径，兼容 ASREngine 接口
+    """
+
+    def __init__(self, config: ASRConfig, model_dir: str | Path = "./models") -> None:
+        self.config = config
+        self.stream_config = config.streaming
+        self.model_dir = Path(model_dir)
+        self._model: Any = None
+        self._punc_model: Any = None
+        self._load_model()
+
+    @property
+    def chunk_samples(self) -> int:
+        return _SAMPLE_RATE * self.stream_config.chunk_ms // 1000
+
+    def _load_model(self) -> None:
+        try:
+            from funasr import AutoModel
+        except ImportError as e:
+            raise RuntimeError("FunASR 未安装。请运行: pip install funasr modelscope") from e
+
+        model_path = self.model_dir / self.stream_config.model
+        if not model_path.exists():
+            raise RuntimeError(f"模型文件缺失:\n  - 流式 ASR ({model_path})")
+
+        logger.info(f"加载 FunASR 流式模型: {model_path}")
+        self._model = AutoModel(model=str(model_path), device=self.config.device)
+
+        punc_path = self.model_dir / self.config.punc_model
+        if self.stream_config.punctuate and punc_path.exists():
+            self._punc_model = AutoModel(model=str(punc_path), device=self.config.device)
+        elif self.stream_config.punctuate:
+            logger.warning(f"标点模型不存在，流式结果不加标点: {punc_path}")
+
+    def transcribe(self, audio_path: str) -> list[Utterance]:
+        return list(self.transcribe_stream(audio_path, follow=False))
+
+    def transcribe_stream(
+        self, audio_path: str, *, follow: bool = True, idle_seconds: float = 5.0
+    ) -> Iterator[Utterance]:
+        """转写 WAV 文件；follow=True 时持续读取新写入的数据，idle_seconds 内不再增长即结束。"""
+
+        blocks = read_wav_pcm(
+            Path(audio_path),
+            block_frames=self.chunk_samples,
+            follow=follow,
+            idle_seconds=idle_seconds,
+        )
+        return self.stream(blocks)
+
+    def stream(self, pcm_blocks: Iterable[bytes]) -> Iterator[Utterance]:
+        stride = self.chunk_samples * _SAMPLE_WIDTH
+        state = _StreamState()
+        buf = bytearray()
+        for block in pcm_blocks:
+            buf.extend(block)
+            while len(buf) >= stride:
+                chunk = bytes(buf[:stride])
+                del buf[:stride]
+                utt = self._feed(state, chunk, final=False)
+                if utt is not None:
+                    yield utt
+
+        utt = self._feed(state, bytes(buf), final=True)
+        if utt is not None:
+            yield utt
+
+    def _feed(self, state: _StreamState, chunk: bytes, *, final: bool) -> Optional[Utterance]:
+        samples = array("h")
+        samples.frombytes(chunk[: len(chunk) - len(chunk) % _SAMPLE_WIDTH])
+        chunk_start = state.pos_s
+        state.pos_s += len(samples) / _SAMPLE_RATE
+
+        if _rms(samples) <= self.stream_config.silence_rms_threshold:
+            state.silent_s += len(samples) / _SAMPLE_RATE
+        else:
+            state.silent_s = 0.0
+            state.voice_end_s = state.pos_s
+
+        cfg = self.stream_config
+        endpoint = final or (
+            state.start_s is not None
+            and (
+                state.silent_s >= cfg.endpoint_silence_s
+                or state.pos_s - state.start_s >= cfg.max_utterance_s
+            )
+        )
+        if not samples and not state.cache:
+            return self._take(state) if endpoint else None
+
+        text = self._generate(samples, state.cache, is_final=endpoint)
+        if text:
+            if state.start_s is None:
+                state.start_s = chunk_start
+            state.parts.append(text)
+        return self._take(state) if endpoint else None
+
+    def _take(self, state: _StreamState) -> Optional[Utterance]:
+        """结束当前 utterance 并重置解码缓存。"""
+
+        text = "".join(state.parts).strip()
+        start_s = state.start_s
+        state.parts = []
+        state.cache = {}
+        state.start_s = None
+        if not text or start_s is None:
+            return None
+        if self._punc_model is not None:
+            text = _first_text(self._punc_model.generate(input=text)) or text
+        return Utterance(
+            speaker=Speaker(id="SPEAKER_00"),
+            text=text,
+            start_time=start_s,
+            end_time=max(start_s, state.voice_end_s),
+        )
+
+    def _generate(self, samples: array, cache: dict, *, is_final: bool) -> str:
+        import numpy as np
+
+        speech = np.asarray(samples, dtype=np.float32) / 32768.0
+        if speech.size == 0:
+            # 结束时缓冲为空：送一小段静音让模型吐出剩余结果
+            speech = np.zeros(_SAMPLE_RATE // 100, dtype=np.float32)
+        chunk_ms = self.stream_config.chunk_ms
+        result = self._model.generate(
+            input=speech,
+            cache=cache,
+            is_final=is_final,
+            # [0, 当前块, 前瞻块]，单位 60ms
+            chunk_size=[0, chunk_ms // 60, chunk_ms // 120],
+            encoder_chunk_look_back=self.stream_config.encoder_look_back,
+            decoder_chunk_look_back=self.stream_config.decoder_look_back,
+        )
+        return _first_text(result)
+
+
+def read_wav_pcm(
+    path: Path,
+    *,
+    block_frames: int,
+    follow: bool = False,
+    idle_seconds: float = 5.0,
+    poll_interval: float = 0.2,
+) -> Iterator[bytes]:
+    """按块读取 WAV 的 PCM 数据（取第一声道），可跟随仍在写入的文件。
+
+    录音软件写入过程中 data 块长度字段通常为 0 或占位值，不可信；
+    这里只解析到 data 块起点，之后按文件实际长度读取。
+    """
+
+    with path.open("rb") as f:
+        header = _wait_header(f, follow=follow, idle_seconds=idle_seconds, poll=poll_interval)
+        data_offset, channels, sampwidth, rate = header
+        if sampwidth != _SAMPLE_WIDTH or rate != _SAMPLE_RATE:
+            raise ValueError(f"流式 ASR 需要 16kHz 16-bit WAV: {path}")
+
+        frame_bytes = channels * sampwidth
+        f.seek(data_offset)
+        pending = b""
+        idle = 0.0
+        while True:
+            data = f.read(block_frames * frame_bytes)
+            if data:
+                idle = 0.0
+                data = pending + data
+                usable = len(data) - len(data) % frame_bytes
+                pending = data[usable:]
+                yield _first_channel(data[:usable], channels)
+                continue
+            if not follow or idle >= idle_seconds:
+                return
+            time.sleep(poll_interval)
+            idle += poll_interval
+
+
+def _wait_header(
+    f: BinaryIO, *, follow: bool, idle_seconds: float, poll: float
+) -> tuple[int, int, int, int]:
+    waited = 0.0
+    while True:
+        f.seek(0)
+        header = _parse_wav_header(f)
+        if header is not None:
+            return header
+        if not follow or waited >= idle_seconds:
+            raise ValueError("无法解析 WAV 头")
+        time.sleep(poll)
+        waited += poll
+
+
+def _parse_wav_header(f: BinaryIO) -> Optional[tuple[int, int, int, int]]:
+    """返回 (data 起始偏移, 声道数, 采样宽度, 采样率)；头部尚未写完时返回 None。"""
+
+    riff = f.read(12)
+    if len(riff) < 12:
+        return None
+    if riff[:4] != b"RIFF" or riff[8:12] != b"WAVE":
+        raise ValueError("不是 WAV 文件")
+
+    fmt: Optional[tuple[int, int, int]] = None
+    while True:
+        chunk_header = f.read(8)
+        if len(chunk_header) < 8:
+            return None
+        chunk_id, size = chunk_header[:4], struct.unpack("<I", chunk_header[4:])[0]
+        if chunk_id == b"data":
+            if fmt is None:
+                raise ValueError("WAV 缺少 fmt 块")
+            return (f.tell(), *fmt)
+        body = f.read(size + (size & 1))
+        if len(body) < size:
+            return None
+        if chunk_id == b"fmt ":
+            channels, rate = struct.unpack("<HI", body[2:8])
+            bits = struct.unpack("<H", body[14:16])[0]
+            fmt = (channels, bits // 8, rate)
+
+
+def _first_channel(frames: bytes, channels: int) -> bytes:
+    if channels == 1:
+        return frames
+    samples = array("h")
+    samples.frombytes(frames)
+    return array("h", samples[0::channels]).tobytes()
+
+
+def _rms(samples: array) -> float:
+    if not samples:
+        return 0.0
+    return math.sqrt(sum(x * x for x in samples) / len(samples))
+
+
+def _first_text(result: Any) -> str:
+    if isinstance(result, list) and result and isinstance(result[0], dict):
+        return str(result[0].get("text", ""))
+    return ""
@@ -0,0 +1,191 @@
+"""受监管的 ASR 子进程：按 chunk 时长设置超时，卡死或崩溃时重启 worker 并重试。
+
+FunASR 的 generate 偶尔会在个别文件上卡住或被 OOM 杀掉；直接在主进程调用时
+整个 Pipeline.process（start 模式下还有 watchdog 回调线程）都会被无限期阻塞。
+这里把引擎放进单独的子进程，主进程只等待到截止时间为止。
+"""
+from __future__ import annotations
+
+import logging
+import multiprocessing
+import time
+from multiprocessing.connection import Connection
+from multiprocessing.process import BaseProcess
+from typing import Any, Callable, Optional
+
+from audio_journal.asr.base import ASREngine
+from audio_journal.models.schemas import Utterance
+from audio_journal.telemetry.asr import wav_duration_s
+
+logger = logging.getLogger(__name__)
+
+_POLL_INTERVAL = 0.2
+
+
+class ASRWorkerError(RuntimeError):
+    """ASR worker 超时或崩溃，且重试后仍失败。"""
+
+
+class _WorkerDied(Exception):
+    pass
+
+
+class SupervisedASREngine(ASREngine):
+    """在受监管子进程中运行 ASR 引擎。
+
+    - 截止时间 = max(min_deadline_s, 音频时长 × deadline_factor)
+    - 超时或 worker 退出时杀掉子进程，立即启动新 worker 预加载模型，再重试 retries 次
+    - 引擎自身抛出的异常（worker 仍存活）原样转为 RuntimeError，不重试
+
+    engine_factory 在子进程内调用，必须可 pickle（模块级函数或 functools.partial）。
+    """
+
+    def __init__(
+        self,
+        engine_factory: Callable[[], ASREngine],
+        *,
+        deadline_factor: float = 1.0,
+        min_deadline_s: float = 120.0,
+        load_timeout_s: float = 600.0,
+        retries: int = 1,
+    ) -> None:
+        self.engine_factory = engine_factory
+        self.deadline_factor = deadline_factor
+        self.min_deadline_s = min_deadline_s
+        self.load_timeout_s = load_timeout_s
+        self.retries = retries
+        self.restarts = 0
+        self._process: Optional[BaseProcess] = None
+        self._conn: Optional[Connection] = None
+        self._ready = False
+
+    def transcribe(self, audio_path: str) -> list[Utterance]:
+        return self._call("transcribe", audio_path, self.deadline_for([audio_path]))
+
+    def transcribe_many(self, audio_paths: list[str]) -> list[list[Utterance]]:
+        try:
+            return self._call(
+                "transcribe_many", audio_paths, self.deadline_for(audio_paths), retries=0
+            )
+        except ASRWorkerError:
+            # 整批失败时逐个重跑，让出问题的 chunk 单独超时
+            logger.warning(f"批量转写失败，改为逐个转写 {len(audio_paths)} 个 chunk")
+            return [self.transcribe(p) for p in audio_paths]
+
+    def deadline_for(self, audio_paths: list[str]) -> float:
+        # 无法读取时长时为 0，由 min_deadline_s 兜底
+        seconds = sum(wav_duration_s(p) for p in audio_paths)
+        return max(self.min_deadline_s, seconds * self.deadline_factor)
+
+    def close(self) -> None:
+        if self._conn is not None:
+            try:
+                self._conn.send(None)
+            except OSError:
+                pass
+        if self._process is not None:
+            self._process.join(timeout=5)
+        self._kill()
+
+    def _call(self, op: str, arg: Any, deadline: float, *, retries: Optional[int] = None) -> Any:
+        attempts = 1 + (self.retries if retries is None else retries)
+        for attempt in range(1, attempts + 1):
+            self._ensure_ready()
+            assert self._conn is not None
+            self._conn.send((op, arg))
+            try:
+                status, payload = self._recv(deadline)
+            except (TimeoutError, _WorkerDied) as e:
+                logger.error(f"ASR worker {e}（第 {attempt}/{attempts} 次）: {arg}")
+                self._restart()
+                continue
+            if status == "error":
+                raise RuntimeError(f"ASR 转写失败: {payload}")
+            return payload
+        raise ASRWorkerError(f"ASR 转写 {attempts} 次均超时或崩溃: {arg}")
+
+    def _recv(self, timeout: float) -> tuple[str, Any]:
+        assert self._conn is not None and self._process is not None
+        end = time.monotonic() + timeout
+        while True:
+            remaining = end - time.monotonic()
+            if remaining <= 0:
+                raise TimeoutError(f"超时（{timeout:.0f}s）")
+            if self._conn.poll(min(_POLL_INTERVAL, remaining)):
+                try:
+                    return self._conn.recv()
+                except EOFError as e:
+                    raise _WorkerDied(f"退出（exitcode={self._process.exitcode}）") from e
+            if not self._process.is_alive():
+                raise _WorkerDied(f"退出（exitcode={self._process.exitcode}）")
+
+    def _ensure_ready(self) -> None:
+        if self._process is None or not self._process.is_alive():
+            self._start()
+        if self._ready:
+            return
+        try:
+            status, payload = self._recv(self.load_timeout_s)
+        except (TimeoutError, _WorkerDied) as e:
+            self._kill()
+            raise ASRWorkerError(f"ASR worker 加载模型失败: {e}") from e
+        if status != "ready":
+            self._kill()
+            raise ASRWorkerError(f"ASR worker 加载模型失败: {payload}")
+        self._ready = True
+
+    def _start(self) -> None:
+        self._kill()
+        ctx = multiprocessing.get_context("spawn")
+        parent_conn, child_conn = ctx.Pipe()
+        process = ctx.Process(
+            target=_worker_main, args=(child_conn, self.engine_factory), daemon=True
+        )
+        process.start()
+        child_conn.close()
+        self._process = process
+        self._conn = parent_conn
+        self._ready = False
+
+    def _restart(self) -> None:
+        # 立即拉起新 worker，模型加载与后续调度重叠
+        self.restarts += 1
+        self._start()
+
+    def _kill(self) -> None:
+        if self._process is not None and self._process.is_alive():
+            self._process.kill()
+            self._process.join()
+        if self._conn is not None:
+            self._conn.close()
+        self._process = None
+        self._conn = None
+        self._ready = False
+
+
+def _worker_main(conn: Connection, engine_factory: Callable[[], ASREngine]) -> None:
+    try:
+        engine = engine_factory()
+    except Exception as e:  # noqa: BLE001 - 加载失败原因回传给主进程
+        conn.send(("error", repr(e)))
+        return
+    conn.send(("ready", None))
+
+    while True:
+        try:
+            request = conn.recv()
+        except EOFError:
+            return
+        if request is None:
+            return
+        op, arg = request
+        try:
+            if op == "transcribe_many":
+                result: Any = engine.transcribe_many(arg)
+            else:
+                result = engine.transcribe(arg)
+        except Exception as e:  # noqa: BLE001
+            conn.send(("error", repr(e)))
+            continue
+        conn.send(("ok", result))
+
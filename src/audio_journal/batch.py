@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import re
 import shutil
 import tempfile
 import wave
@@ -11,27 +10,9 @@ from datetime import date, datetime
 from pathlib import Path
 
 from audio_journal.config import AppConfig
-from audio_journal.models.schemas import AnalysisResult, DailyReport
+from audio_journal.models.schemas import AnalysisResult, DailyReport, RunStats
 from audio_journal.pipeline import Pipeline
-
-# 匹配 YYYYMMDDHHMMSS.WAV
-_FILENAME_RE = re.compile(
-    r"^(\d{4})(\d{2})(\d{2})(\d{2})(\d{2})(\d{2})\.wav$", re.IGNORECASE
-)
-
-
-def parse_recording_time(filename: str) -> datetime | None:
-    """从文件名解析录音时间戳，无法解析返回 None。"""
-    m = _FILENAME_RE.match(filename)
-    if not m:
-        return None
-    try:
-        return datetime(
-            int(m.group(1)), int(m.group(2)), int(m.group(3)),
-            int(m.group(4)), int(m.group(5)), int(m.group(6)),
-        )
-    except ValueError:
-        return None
+from audio_journal.recording import parse_recording_time
 
 
 def collect_files_by_date(
@@ -95,6 +76,9 @@ class DailyBatchProcessor:
         self.config = config
         self.pipeline = pipeline or Pipeline(config)
 
+    def close(self) -> None:
+        self.pipeline.close()
+
     async def process_date(self, target_date: date) -> DailyReport:
         """处理指定日期的所有录音文件。"""
         inbox = self.config.paths.inbox
@@ -131,6 +115,7 @@ class DailyBatchProcessor:
                 file_count=len(files),
                 results=results,
                 source_files=[f.name for f in files],
+                stats=getattr(self.pipeline, "last_stats", None) or RunStats(),
             )
         finally:
             # 无论成功失败，清理临时合并文件
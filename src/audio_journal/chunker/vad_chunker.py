@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import json
 import math
 from array import array
 from dataclasses import dataclass
@@ -16,6 +17,8 @@ class Chunk:
     start_time: float
     end_time: float
     duration: float
+    # 能量包络得到的语音区间（相对 chunk 起点，秒）；同时写入 chunk 旁的 .regions.json。
+    speech_regions: tuple[tuple[float, float], ...] = ()
 
 
 class VADChunker:
@@ -27,12 +30,25 @@ class VADChunker:
     def __init__(self, config: ChunkerConfig) -> None:
         self.config = config
         self._frame_ms: int = 30
+        # 流式模式每次读取的能量帧数（30ms * 2000 ≈ 1 分钟音频）。
+        self._stream_block_frames: int = 2000
+
+    def split(
+        self, audio_path: str | Path, output_dir: str | Path, *, low_memory: bool = False
+    ) -> list[Chunk]:
+        """切分 WAV。
+
+        low_memory=True 时按块流式扫描与写出，不把整段 PCM 读入内存，
+        结果与默认模式一致；用于长录音 + 内存预算受限的场景。
+        """
 
-    def split(self, audio_path: str | Path, output_dir: str | Path) -> list[Chunk]:
         src = Path(audio_path)
         out_dir = Path(output_dir)
         out_dir.mkdir(parents=True, exist_ok=True)
 
+        if low_memory:
+            return self._split_streaming(src, out_dir)
+
         with wave.open(str(src), "rb") as wf:
             nchannels = wf.getnchannels()
             sampwidth = wf.getsampwidth()
@@ -43,24 +59,133 @@ class VADChunker:
 
             frames = wf.readframes(nframes)
 
-        samples = array("h")
-        samples.frombytes(frames)
-        if nchannels > 1:
-            # MVP：仅取第一个声道，避免引入额外依赖。
-            samples = array("h", samples[0::nchannels])
-            nchannels = 1
+        # MVP：仅取第一个声道，避免引入额外依赖。
+        samples = _first_channel(frames, nchannels)
+        del frames
 
         total_frames = len(samples)
         frame_size = max(1, int(framerate * self._frame_ms / 1000))
-        frame_dur = frame_size / framerate
+        silent_frames = self._silent_flags(samples, frame_size)
+        cuts = self._compute_cuts(silent_frames, total_frames, frame_size, framerate)
+
+        chunks: list[Chunk] = []
+        for i, (start, end) in enumerate(zip(cuts[:-1], cuts[1:], strict=True), start=1):
+            chunk_path = out_dir / f"chunk_{i:03d}.wav"
+            with wave.open(str(chunk_path), "wb") as wf:
+                wf.setparams(_mono_params(framerate))
+                wf.writeframes(samples[start:end].tobytes())
+            regions = self._speech_regions(silent_frames, start, end, frame_size, framerate)
+            chunks.append(_make_chunk(chunk_path, start, end, framerate, regions))
+
+        return chunks
+
+    def estimate_memory(self, audio_path: str | Path) -> int:
+        """估算默认（整段读入）模式的峰值内存字节数。
+
+        原始帧 bytes + 解码后的 array；多声道时还有一份单声道拷贝。
+        """
+
+        with wave.open(str(audio_path), "rb") as wf:
+            pcm_bytes = wf.getnframes() * wf.getnchannels() * wf.getsampwidth()
+            nchannels = wf.getnchannels()
+        return pcm_bytes * 2 + (pcm_bytes // nchannels if nchannels > 1 else 0)
+
+    def _split_streaming(self, src: Path, out_dir: Path) -> list[Chunk]:
+        with wave.open(str(src), "rb") as wf:
+            nchannels = wf.getnchannels()
+            sampwidth = wf.getsampwidth()
+            framerate = wf.getframerate()
+            if sampwidth != 2:
+                raise ValueError("仅支持 16-bit PCM WAV")
+
+            frame_size = max(1, int(framerate * self._frame_ms / 1000))
+            # 块大小取 frame_size 的整数倍，保证能量帧边界与整段模式一致。
+            block = frame_size * self._stream_block_frames
+
+            silent_frames: list[bool] = []
+            total_frames = 0
+            while True:
+                data = wf.readframes(block)
+                if not data:
+                    break
+                samples = _first_channel(data, nchannels)
+                total_frames += len(samples)
+                silent_frames.extend(self._silent_flags(samples, frame_size))
+
+            cuts = self._compute_cuts(silent_frames, total_frames, frame_size, framerate)
+
+            chunks: list[Chunk] = []
+            for i, (start, end) in enumerate(zip(cuts[:-1], cuts[1:], strict=True), start=1):
+                chunk_path = out_dir / f"chunk_{i:03d}.wav"
+                wf.setpos(start)
+                with wave.open(str(chunk_path), "wb") as out:
+                    out.setparams(_mono_params(framerate))
+                    remaining = end - start
+                    while remaining > 0:
+                        data = wf.readframes(min(block, remaining))
+                        if not data:
+                            break
+                        samples = _first_channel(data, nchannels)
+                        out.writeframes(samples.tobytes())
+                        remaining -= len(samples)
+                regions = self._speech_regions(silent_frames, start, end, frame_size, framerate)
+                chunks.append(_make_chunk(chunk_path, start, end, framerate, regions))
+
+        return chunks
 
+    def _silent_flags(self, samples: array, frame_size: int) -> list[bool]:
         silent_frames: list[bool] = []
-        for i in range(0, total_frames, frame_size):
+        for i in range(0, len(samples), frame_size):
             frame = samples[i : i + frame_size]
             if not frame:
                 break
             rms = math.sqrt(sum(x * x for x in frame) / len(frame))
             silent_frames.append(rms <= self.config.silence_rms_threshold)
+        return silent_frames
+
+    def _speech_regions(
+        self, silent_frames: list[bool], start: int, end: int, frame_size: int, framerate: int
+    ) -> list[tuple[float, float]]:
+        """chunk [start, end) 内的非静音区间（秒，相对 chunk 起点）。
+
+        间隔小于 speech_merge_gap_s 的区间合并，两端各扩 speech_pad_s，
+        超过 max_speech_region_s 的区间等长切开，避免无 VAD 解码时输入过长。
+        """
+
+        cfg = self.config
+        frame_dur = frame_size / framerate
+        chunk_dur = (end - start) / framerate
+        first = start // frame_size
+        last = min(len(silent_frames), -(-end // frame_size))
+
+        raw: list[list[float]] = []
+        for idx in range(first, last):
+            if silent_frames[idx]:
+                continue
+            t0 = max(0.0, idx * frame_dur - start / framerate)
+            t1 = min(chunk_dur, (idx + 1) * frame_dur - start / framerate)
+            if raw and t0 - raw[-1][1] <= cfg.speech_merge_gap_s:
+                raw[-1][1] = t1
+            else:
+                raw.append([t0, t1])
+
+        regions: list[tuple[float, float]] = []
+        for t0, t1 in raw:
+            t0 = max(0.0, t0 - cfg.speech_pad_s)
+            t1 = min(chunk_dur, t1 + cfg.speech_pad_s)
+            if regions and t0 <= regions[-1][1]:
+                t0 = regions.pop()[0]
+            pieces = max(1, math.ceil((t1 - t0) / cfg.max_speech_region_s))
+            step = (t1 - t0) / pieces
+            regions.extend(
+                (round(t0 + k * step, 3), round(t0 + (k + 1) * step, 3)) for k in range(pieces)
+            )
+        return regions
+
+    def _compute_cuts(
+        self, silent_frames: list[bool], total_frames: int, frame_size: int, framerate: int
+    ) -> list[int]:
+        frame_dur = frame_size / framerate
 
         silence_cutpoints: list[int] = []
         run_start = None
@@ -97,24 +222,48 @@ class VADChunker:
         while len(cuts) > 2 and (cuts[-1] - cuts[-2]) < min_samples:
             cuts.pop(-2)
 
-        chunks: list[Chunk] = []
-        params = (nchannels, 2, framerate, 0, "NONE", "not compressed")
-        for i, (start, end) in enumerate(zip(cuts[:-1], cuts[1:], strict=True), start=1):
-            chunk_path = out_dir / f"chunk_{i:03d}.wav"
-            with wave.open(str(chunk_path), "wb") as wf:
-                wf.setparams(params)
-                data = samples[start:end]
-                wf.writeframes(data.tobytes())
-
-            start_time = start / framerate
-            end_time = end / framerate
-            chunks.append(
-                Chunk(
-                    path=chunk_path,
-                    start_time=start_time,
-                    end_time=end_time,
-                    duration=end_time - start_time,
-                )
-            )
+        return cuts
 
-        return chunks
+
+def _first_channel(frames: bytes, nchannels: int) -> array:
+    samples = array("h")
+    samples.frombytes(frames)
+    if nchannels > 1:
+        samples = array("h", samples[0::nchannels])
+    return samples
+
+
+def _mono_params(framerate: int) -> tuple:
+    return (1, 2, framerate, 0, "NONE", "not compressed")
+
+
+def _make_chunk(
+    path: Path, start: int, end: int, framerate: int, regions: list[tuple[float, float]]
+) -> Chunk:
+    start_time = start / framerate
+    end_time = end / framerate
+    write_speech_regions(path, regions)
+    return Chunk(
+        path=path,
+        start_time=start_time,
+        end_time=end_time,
+        duration=end_time - start_time,
+        speech_regions=tuple(regions),
+    )
+
+
+def speech_regions_path(chunk_path: str | Path) -> Path:
+    return Path(chunk_path).with_suffix(".regions.json")
+
+
+def write_speech_regions(chunk_path: str | Path, regions: list[tuple[float, float]]) -> None:
+    speech_regions_path(chunk_path).write_text(json.dumps(regions), encoding="utf-8")
+
+
+def read_speech_regions(chunk_path: str | Path) -> list[tuple[float, float]] | None:
+    """读取 chunk 的语音区间；没有 sidecar（非 chunker 产出的音频）时返回 None。"""
+
+    p = speech_regions_path(chunk_path)
+    if not p.exists():
+        return None
+    return [(float(a), float(b)) for a, b in json.loads(p.read_text(encoding="utf-8"))]
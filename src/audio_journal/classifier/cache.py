@@ -0,0 +1,131 @@
+"""场景分类结果缓存。
+
+SceneClassifier 只把片段前 N 条 utterance 的采样发给 LLM；重跑同一文件、或每天
+同一时间的例行录音，采样文本往往完全相同。缓存以 (完整 prompt, LLM 指纹) 的哈希为 key
+——prompt 已包含采样文本与模板，指纹包含模型与温度——命中时完全跳过 LLM 调用。
+
+每个条目一个 JSON 小文件：超过 ttl 视为过期；条目数超过 max_entries 时按最近使用时间
+（mtime，命中时刷新）一次淘汰到 90% 以下，之后的写入只增减内存计数、不再扫描目录。
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import time
+from pathlib import Path
+from typing import Any, Optional
+
+logger = logging.getLogger(__name__)
+
+# 条目格式版本；变化时递增，旧条目读取时视为未命中并被覆盖。
+_FORMAT_VERSION = 1
+# 超出 max_entries 时一次淘汰到该比例以下，满载后不必每次写入都扫描整个缓存目录
+_LOW_WATER = 0.9
+
+
+def llm_fingerprint(llm: object) -> str:
+    """影响分类输出的 LLM 参数；取不到的属性（如测试替身）记为空。"""
+
+    keys = {
+        "provider": getattr(llm, "provider", None),
+        "model": getattr(llm, "model", None),
+        "temperature": getattr(llm, "temperature", None),
+    }
+    return json.dumps(keys, sort_keys=True, default=str)
+
+
+class ClassificationCache:
+    """按 prompt 内容寻址的分类结果缓存（存放 LLM 返回并解析后的 JSON 对象）。"""
+
+    def __init__(
+        self,
+        cache_dir: str | Path,
+        *,
+        fingerprint: str,
+        ttl_s: float,
+        max_entries: int,
+    ) -> None:
+        self.cache_dir = Path(cache_dir)
+        self.fingerprint = fingerprint
+        self.ttl_s = ttl_s
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._count: Optional[int] = None
+
+    def key_for(self, prompt: str) -> str:
+        h = hashlib.sha256()
+        h.update(self.fingerprint.encode("utf-8"))
+        h.update(b"\0")
+        h.update(prompt.encode("utf-8"))
+        return h.hexdigest()
+
+    def get(self, key: str) -> Optional[dict[str, Any]]:
+        data = self._load(key)
+        if data is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return data
+
+    def put(self, key: str, data: dict[str, Any]) -> None:
+        path = self._path_for(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        existed = path.exists()
+        payload = {"v": _FORMAT_VERSION, "created": time.time(), "data": data}
+        tmp = path.with_suffix(".tmp")
+        tmp.write_text(json.dumps(payload, ensure_ascii=False), encoding="utf-8")
+        os.replace(tmp, path)
+
+        if self._count is not None and not existed:
+            self._count += 1
+        self._evict()
+
+    def _path_for(self, key: str) -> Path:
+        return self.cache_dir / key[:2] / f"{key}.json"
+
+    def _load(self, key: str) -> Optional[dict[str, Any]]:
+        path = self._path_for(key)
+        try:
+            payload = json.loads(path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logger.warning(f"分类缓存条目损坏，忽略: {path}: {e}")
+            self._drop(path)
+            return None
+
+        if not isinstance(payload, dict) or payload.get("v") != _FORMAT_VERSION:
+            return None
+        if time.time() - float(payload.get("created", 0)) > self.ttl_s:
+            self._drop(path)
+            return None
+        data = payload.get("data")
+        if not isinstance(data, dict):
+            return None
+        # 刷新 mtime，作为 LRU 的最近使用时间
+        os.utime(path)
+        return data
+
+    def _drop(self, path: Path) -> None:
+        path.unlink(missing_ok=True)
+        self._count = None
+
+    def _evict(self) -> None:
+        if self._count is None:
+            self._count = len(self._entries())
+        if self._count <= self.max_entries:
+            return
+
+        keep = max(1, int(self.max_entries * _LOW_WATER))
+        entries = sorted(self._entries(), key=lambda p: p.stat().st_mtime)
+        for path in entries[: max(0, len(entries) - keep)]:
+            path.unlink(missing_ok=True)
+        self._count = min(len(entries), keep)
+
+    def _entries(self) -> list[Path]:
+        if not self.cache_dir.exists():
+            return []
+        return list(self.cache_dir.glob("*/*.json"))
@@ -0,0 +1,63 @@
+"""分类 + 分析单次调用（fused 模式）。"""
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Mapping
+
+from audio_journal.analyzer.base import BaseAnalyzer, render_transcript
+from audio_journal.classifier.scene import SceneClassifier
+from audio_journal.llm.base import LLMProvider, parse_json_strict
+from audio_journal.models.schemas import AnalysisResult, ClassifiedSegment, SceneType, Segment
+
+
+class FusedClassifier(SceneClassifier):
+    """一次 LLM 调用同时返回 scene 与场景分析字段。
+
+    默认两段式流程里，分类与分析各发送一次转写；fused 模式只发送一次完整转写，
+    分析字段交给对应场景 analyzer 的 parse_result 解析，保证与两段式输出一致。
+    未配置 analyzer 的场景只返回分类结果，由调用方决定后续处理。
+    """
+
+    def __init__(
+        self,
+        *,
+        prompt_path: str | Path,
+        llm: LLMProvider,
+        analyzers: Mapping[SceneType, BaseAnalyzer],
+    ) -> None:
+        super().__init__(prompt_path=prompt_path, llm=llm)
+        self.analyzers = dict(analyzers)
+
+    async def classify_and_analyze(
+        self, segment: Segment
+    ) -> tuple[ClassifiedSegment, AnalysisResult | None]:
+        transcript = render_transcript(segment.utterances)
+        speakers = ", ".join(sorted({u.speaker.id for u in segment.utterances}))
+        analysis_scenes = ", ".join(s.value for s in self.analyzers) or "（无）"
+
+        prompt = self._prompt_template
+        prompt = prompt.replace("{{transcript}}", transcript)
+        prompt = prompt.replace("{{start_time}}", _format_mmss(segment.start_time))
+        prompt = prompt.replace("{{end_time}}", _format_mmss(segment.end_time))
+        prompt = prompt.replace("{{speakers}}", speakers)
+        prompt = prompt.replace("{{analysis_scenes}}", analysis_scenes)
+
+        text = await self.llm.complete(prompt, json_mode=True)
+        data = parse_json_strict(text)
+
+        classified = self._to_classified(segment, data)
+        analyzer = self.analyzers.get(classified.scene)
+        if analyzer is None:
+            return classified, None
+
+        analysis = data.get("analysis") or {}
+        if not isinstance(analysis, dict):
+            analysis = {}
+        return classified, analyzer.parse_result(classified, analysis, transcript)
+
+
+def _format_mmss(seconds: float) -> str:
+    sec = max(0, int(seconds))
+    m = sec // 60
+    s = sec % 60
+    return f"{m:02d}:{s:02d}"
@@ -0,0 +1,188 @@
+"""基于廉价特征的场景预分类，置信度足够时跳过 LLM。
+
+很多片段只看结构就能分出来：一个人自言自语多是 idea，两个人快速轮流说话像 phone，
+三人以上的长时间讨论多是 meeting。HeuristicClassifier 从片段提取说话人数、主说话人占比、
+轮换频率、时长、各场景关键词命中与录音时刻，给每个场景打分；CascadeClassifier 在
+最高分达到阈值时直接采用，否则交给 LLM 分类器。
+
+shadow 模式下仍然调用 LLM，只统计预分类与 LLM 的一致率，用于上线前校准阈值。
+"""
+from __future__ import annotations
+
+import logging
+from collections import Counter
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Optional
+
+from audio_journal.models.schemas import ClassifiedSegment, SceneType, Segment
+from audio_journal.recording import parse_recording_time
+
+logger = logging.getLogger(__name__)
+
+# 各场景的中文关键词（命中次数按片段内出现的不同关键词计）
+KEYWORDS: dict[SceneType, tuple[str, ...]] = {
+    SceneType.MEETING: (
+        "会议", "议程", "进度", "需求", "上线", "排期", "项目", "汇报", "复盘", "评审", "同步一下",
+    ),
+    SceneType.BUSINESS: ("合作", "报价", "合同", "客户", "渠道", "签约", "采购", "价格", "供应商"),
+    SceneType.IDEA: ("想法", "灵感", "记一下", "突然想到", "我觉得可以", "备忘", "提醒自己"),
+    SceneType.LEARNING: ("课程", "同学们", "这一节", "知识点", "老师", "视频", "章节", "讲解"),
+    SceneType.PHONE: ("喂", "听得到", "信号", "先挂了", "打给你", "回电话", "你那边"),
+    SceneType.CHAT: ("吃饭", "周末", "电影", "哈哈", "好玩", "旅游", "游戏", "聚一下"),
+}
+
+_WORK_HOURS = range(9, 19)
+
+
+@dataclass(frozen=True)
+class SegmentFeatures:
+    speakers: int
+    dominant_share: float  # 主说话人 utterance 占比
+    turns_per_min: float  # 说话人切换频率
+    duration_min: float
+    keyword_hits: dict[SceneType, int]
+    hour: Optional[int]  # 片段开始的录音时刻（小时）；文件名无时间戳时为 None
+
+
+@dataclass(frozen=True)
+class HeuristicPrediction:
+    scene: SceneType
+    confidence: float
+    scores: dict[SceneType, float]
+
+
+def extract_features(segment: Segment) -> SegmentFeatures:
+    utts = segment.utterances
+    counts = Counter(u.speaker.id for u in utts)
+    turns = sum(1 for a, b in zip(utts, utts[1:]) if a.speaker.id != b.speaker.id)
+    minutes = max(segment.duration, 1.0) / 60.0
+    text = "".join(u.text for u in utts)
+    hits = {scene: sum(1 for kw in kws if kw in text) for scene, kws in KEYWORDS.items()}
+    return SegmentFeatures(
+        speakers=len(counts),
+        dominant_share=max(counts.values()) / len(utts) if utts else 0.0,
+        turns_per_min=turns / minutes,
+        duration_min=segment.duration / 60.0,
+        keyword_hits=hits,
+        hour=_recording_hour(segment),
+    )
+
+
+class HeuristicClassifier:
+    """按特征给各场景打分（0-1），置信度 = 最高分，与次高分接近时打折。"""
+
+    def predict(self, segment: Segment) -> HeuristicPrediction:
+        return self.predict_features(extract_features(segment))
+
+    def predict_features(self, f: SegmentFeatures) -> HeuristicPrediction:
+        kw = {scene: min(n, 3) / 3 for scene, n in f.keyword_hits.items()}
+        work_time = f.hour is not None and f.hour in _WORK_HOURS
+        off_time = f.hour is not None and not work_time
+        solo = f.speakers == 1 or f.dominant_share >= 0.95
+        pair = f.speakers == 2 and f.dominant_share < 0.8
+
+        scores = {
+            SceneType.IDEA: (0.6 if solo and f.duration_min < 20 else 0.0)
+            + 0.35 * kw[SceneType.IDEA],
+            SceneType.LEARNING: (0.5 if solo and f.duration_min >= 15 else 0.0)
+            + 0.45 * kw[SceneType.LEARNING],
+            SceneType.PHONE: (0.55 if pair and f.turns_per_min >= 4 else 0.0)
+            + 0.35 * kw[SceneType.PHONE],
+            SceneType.MEETING: (0.55 if f.speakers >= 3 and f.duration_min >= 10 else 0.0)
+            + 0.3 * kw[SceneType.MEETING]
+            + (0.1 if work_time else 0.0),
+            SceneType.BUSINESS: (0.2 if 2 <= f.speakers <= 4 else 0.0)
+            + 0.6 * kw[SceneType.BUSINESS]
+            + (0.1 if work_time else 0.0),
+            SceneType.CHAT: (0.2 if f.speakers >= 2 else 0.0)
+            + 0.5 * kw[SceneType.CHAT]
+            + (0.15 if off_time else 0.0),
+        }
+        ranked = sorted(scores.items(), key=lambda kv: kv[1], reverse=True)
+        (scene, best), (_, second) = ranked[0], ranked[1]
+        confidence = min(best, 1.0)
+        if best - second < 0.15:
+            confidence *= 0.7
+        return HeuristicPrediction(scene=scene, confidence=round(confidence, 3), scores=scores)
+
+
+class CascadeClassifier:
+    """先预分类，置信度不低于 threshold 时直接采用，否则调用 LLM 分类器。
+
+    对外接口与 SceneClassifier 一致（classify / classify_many，cache 等属性透传），
+    pipeline 无需区分。
+    """
+
+    def __init__(
+        self,
+        heuristic: HeuristicClassifier,
+        classifier: Any,
+        *,
+        threshold: float = 0.8,
+        shadow: bool = False,
+    ) -> None:
+        self.heuristic = heuristic
+        self.classifier = classifier
+        self.threshold = threshold
+        self.shadow = shadow
+        self.checked = 0  # 经过预分类的片段数
+        self.decided = 0  # 置信度达到阈值的片段数（非 shadow 时即省下的 LLM 调用）
+        self.compared = 0  # 置信片段中同时拿到 LLM 结果的数量
+        self.agreed = 0
+
+    @property
+    def cache(self) -> Any:
+        return getattr(self.classifier, "cache", None)
+
+    @property
+    def batch_size(self) -> int:
+        return getattr(self.classifier, "batch_size", 1)
+
+    @property
+    def batch_fallbacks(self) -> int:
+        return getattr(self.classifier, "batch_fallbacks", 0)
+
+    async def classify(self, segment: Segment) -> ClassifiedSegment:
+        return (await self.classify_many([segment]))[0]
+
+    async def classify_many(self, segments: list[Segment]) -> list[ClassifiedSegment]:
+        out: list[Optional[ClassifiedSegment]] = [None] * len(segments)
+        confident: dict[int, HeuristicPrediction] = {}
+        for i, seg in enumerate(segments):
+            pred = self.heuristic.predict(seg)
+            self.checked += 1
+            if pred.confidence >= self.threshold:
+                self.decided += 1
+                confident[i] = pred
+                if not self.shadow:
+                    out[i] = ClassifiedSegment.from_segment(
+                        seg, scene=pred.scene, confidence=pred.confidence
+                    )
+
+        rest = [i for i in range(len(segments)) if out[i] is None]
+        if rest:
+            llm_out = await self._classify_llm([segments[i] for i in rest])
+            for i, cseg in zip(rest, llm_out):
+                out[i] = cseg
+                if i in confident:
+                    self.compared += 1
+                    self.agreed += confident[i].scene == cseg.scene
+                    if confident[i].scene != cseg.scene:
+                        logger.debug(
+                            f"预分类与 LLM 不一致: {cseg.id} "
+                            f"{confident[i].scene.value} vs {cseg.scene.value}"
+                        )
+        return [c for c in out if c is not None]
+
+    async def _classify_llm(self, segments: list[Segment]) -> list[ClassifiedSegment]:
+        if len(segments) > 1 and self.batch_size > 1:
+            return await self.classifier.classify_many(segments)
+        return [await self.classifier.classify(seg) for seg in segments]
+
+
+def _recording_hour(segment: Segment) -> Optional[int]:
+    started = parse_recording_time(Path(segment.source_file).name)
+    if started is None:
+        return None
+    return (started.hour + int((started.minute * 60 + segment.start_time) // 3600)) % 24
@@ -1,27 +1,137 @@
 from __future__ import annotations
 
+import logging
 from pathlib import Path
+from typing import Any, Optional
 
-from audio_journal.llm.base import LLMProvider, parse_json_strict
+from audio_journal.classifier.cache import ClassificationCache
+from audio_journal.llm.base import LLMError, LLMProvider, parse_json_strict
 from audio_journal.models.schemas import ClassifiedSegment, SceneType, Segment
 
+logger = logging.getLogger(__name__)
+
 
 class SceneClassifier:
     """场景分类器（Phase 1 仅做单层分类）。"""
 
-    def __init__(self, *, prompt_path: str | Path, llm: LLMProvider, max_utterances: int = 12) -> None:
+    def __init__(
+        self,
+        *,
+        prompt_path: str | Path,
+        llm: LLMProvider,
+        max_utterances: int = 12,
+        cache: Optional[ClassificationCache] = None,
+        batch_prompt_path: str | Path | None = None,
+        batch_size: int = 1,
+    ) -> None:
         self.prompt_path = Path(prompt_path)
         self.llm = llm
         self.max_utterances = max_utterances
+        self.cache = cache
+        self.batch_size = batch_size
+        self.batch_fallbacks = 0  # 批量结果缺失/无效、改为单独调用的片段数
         self._prompt_template = self.prompt_path.read_text(encoding="utf-8")
+        self._batch_template = (
+            Path(batch_prompt_path).read_text(encoding="utf-8") if batch_prompt_path else None
+        )
 
     async def classify(self, segment: Segment) -> ClassifiedSegment:
-        transcript = self._extract_sample(segment)
-        prompt = self._prompt_template.replace("{{transcript}}", transcript)
+        prompt = self._single_prompt(segment)
+        cached = self._cached(segment, prompt)
+        if cached is not None:
+            return cached
+        return await self._classify_one(segment, prompt)
+
+    async def classify_many(self, segments: list[Segment]) -> list[ClassifiedSegment]:
+        """批量分类：每 batch_size 个片段的采样合成一个 prompt，共用一份分类说明。
+
+        缓存命中的片段不进入批次；批量返回中缺失或无法解析的片段改为单独调用。
+        未配置批量模板或 batch_size <= 1 时逐个调用 classify。
+        """
+
+        if self._batch_template is None or self.batch_size <= 1:
+            return [await self.classify(seg) for seg in segments]
+
+        out: list[Optional[ClassifiedSegment]] = [None] * len(segments)
+        pending: list[tuple[int, str]] = []
+        for i, seg in enumerate(segments):
+            prompt = self._single_prompt(seg)
+            out[i] = self._cached(seg, prompt)
+            if out[i] is None:
+                pending.append((i, prompt))
+
+        for lo in range(0, len(pending), self.batch_size):
+            batch = pending[lo : lo + self.batch_size]
+            if len(batch) == 1:
+                i, prompt = batch[0]
+                out[i] = await self._classify_one(segments[i], prompt)
+                continue
+            items = await self._complete_batch([segments[i] for i, _ in batch])
+            for n, (i, prompt) in enumerate(batch):
+                classified = self._from_batch_item(segments[i], prompt, items.get(f"s{n + 1}"))
+                if classified is None:
+                    self.batch_fallbacks += 1
+                    classified = await self._classify_one(segments[i], prompt)
+                out[i] = classified
+        return [c for c in out if c is not None]
 
+    def _single_prompt(self, segment: Segment) -> str:
+        return self._prompt_template.replace("{{transcript}}", self._extract_sample(segment))
+
+    def _cached(self, segment: Segment, prompt: str) -> Optional[ClassifiedSegment]:
+        if self.cache is None:
+            return None
+        data = self.cache.get(self.cache.key_for(prompt))
+        return self._to_classified(segment, data) if data is not None else None
+
+    async def _classify_one(self, segment: Segment, prompt: str) -> ClassifiedSegment:
         text = await self.llm.complete(prompt, json_mode=True)
         data = parse_json_strict(text)
+        classified = self._to_classified(segment, data)
+        # 只缓存能成功解析为场景的结果
+        if self.cache is not None:
+            self.cache.put(self.cache.key_for(prompt), data)
+        return classified
+
+    async def _complete_batch(self, segments: list[Segment]) -> dict[str, dict[str, Any]]:
+        """发送一个批量 prompt，返回 {批内 id: 结果项}；整批失败时返回空字典。"""
+
+        assert self._batch_template is not None
+        # 批内用短 id（s1, s2, ...），省 token，也避免模型抄错长片段 id
+        blocks = [
+            f"### s{n}\n{self._extract_sample(seg)}" for n, seg in enumerate(segments, start=1)
+        ]
+        prompt = self._batch_template.replace("{{count}}", str(len(segments)))
+        prompt = prompt.replace("{{segments}}", "\n\n".join(blocks))
+        try:
+            data: Any = parse_json_strict(await self.llm.complete(prompt, json_mode=True))
+        except LLMError as e:
+            logger.warning(f"批量分类失败，{len(segments)} 个片段改为单独调用: {e}")
+            return {}
+        results = data.get("results") if isinstance(data, dict) else data
+        if not isinstance(results, list):
+            logger.warning(f"批量分类返回缺少 results 数组，{len(segments)} 个片段改为单独调用")
+            return {}
+        return {
+            str(item.get("id", "")).strip(): item for item in results if isinstance(item, dict)
+        }
+
+    def _from_batch_item(
+        self, segment: Segment, prompt: str, item: Optional[dict[str, Any]]
+    ) -> Optional[ClassifiedSegment]:
+        if item is None:
+            return None
+        data = {"scene": item.get("scene"), "confidence": item.get("confidence", 0.0)}
+        try:
+            classified = self._to_classified(segment, data)
+        except (TypeError, ValueError):
+            return None
+        if self.cache is not None:
+            # 与单独分类共用 key：两种模式下的结果可以互相命中
+            self.cache.put(self.cache.key_for(prompt), data)
+        return classified
 
+    def _to_classified(self, segment: Segment, data: dict[str, Any]) -> ClassifiedSegment:
         scene_str = str(data.get("scene", "")).strip()
         confidence = float(data.get("confidence", 0.0))
 
@@ -30,8 +140,8 @@ class SceneClassifier:
         except ValueError as e:
             raise ValueError(f"未知 scene: {scene_str!r}") from e
 
-        return ClassifiedSegment(
-            **segment.model_dump(),
+        return ClassifiedSegment.from_segment(
+            segment,
             scene=scene,
             confidence=confidence,
             # Phase 1：不做 chat 的价值检测
@@ -0,0 +1,87 @@
+"""chat 场景价值预筛。"""
+from __future__ import annotations
+
+import math
+from pathlib import Path
+
+from audio_journal.analyzer.base import render_transcript
+from audio_journal.llm.base import LLMProvider, estimate_tokens, parse_json_strict
+from audio_journal.models.schemas import ClassifiedSegment, MergedSegment, ValueDetection
+
+
+class ValueDetector:
+    """用 value_detector.txt 对 chat 片段做低成本价值打分。
+
+    只把按 token 预算采样的少量转写发给 LLM，
+    由调用方根据 value_score 决定是否进入完整 ChatAnalyzer 分析。
+    """
+
+    def __init__(
+        self, *, prompt_path: str | Path, llm: LLMProvider, sample_token_budget: int = 800
+    ) -> None:
+        self.prompt_path = Path(prompt_path)
+        self.llm = llm
+        self.sample_token_budget = sample_token_budget
+        self._prompt_template = self.prompt_path.read_text(encoding="utf-8")
+
+    async def detect(self, segment: ClassifiedSegment | MergedSegment) -> ValueDetection:
+        sample = self._extract_sample(segment)
+        prompt = self._prompt_template.replace("{{transcript}}", sample)
+
+        text = await self.llm.complete(prompt, json_mode=True)
+        data = parse_json_strict(text)
+
+        has_value = bool(data.get("has_value", False))
+        value_tags = [str(x) for x in (data.get("value_tags", []) or [])]
+        # 旧版 prompt 没有 value_score 字段，按 has_value 退化为 0/1。
+        raw_score = data.get("value_score", None)
+        value_score = float(raw_score) if raw_score is not None else float(has_value)
+
+        return ValueDetection(
+            segment_id=segment.id,
+            has_value=has_value,
+            value_score=value_score,
+            value_tags=value_tags,
+            sample_tokens=estimate_tokens(sample),
+            prompt_tokens=estimate_tokens(prompt),
+            completion_tokens=estimate_tokens(text),
+        )
+
+    def _extract_sample(self, segment: ClassifiedSegment | MergedSegment) -> str:
+        """在 token 预算内均匀抽取 utterances，覆盖片段首尾而不只看开头。"""
+
+        lines = render_transcript(segment.utterances).splitlines()
+        costs = [estimate_tokens(line) + 1 for line in lines]
+        total = sum(costs)
+        if total <= self.sample_token_budget:
+            return "\n".join(lines)
+
+        step = max(1, math.ceil(total / self.sample_token_budget))
+        # 单条超长 utterance 截断到平均份额，不挤占后续采样点，也不会让采样为空
+        share = max(1, self.sample_token_budget // math.ceil(len(lines) / step))
+        picked: list[str] = []
+        used = 0
+        for i in range(0, len(lines), step):
+            line, cost = lines[i], costs[i]
+            remaining = self.sample_token_budget - used
+            if cost > remaining:
+                line = _truncate_to_tokens(line, min(remaining, share) - 1)
+                if not line:
+                    continue
+                cost = estimate_tokens(line) + 1
+            picked.append(line)
+            used += cost
+        return "\n".join(picked)
+
+
+def _truncate_to_tokens(text: str, max_tokens: int) -> str:
+    """保留 estimate_tokens 不超过 max_tokens 的最长前缀。"""
+
+    lo, hi = 0, len(text)
+    while lo < hi:
+        mid = (lo + hi + 1) // 2
+        if estimate_tokens(text[:mid]) <= max_tokens:
+            lo = mid
+        else:
+            hi = mid - 1
+    return text[:lo]
@@ -9,8 +9,9 @@ import click
 
 from audio_journal.batch import DailyBatchProcessor, collect_files_by_date
 from audio_journal.config import AppConfig, load_config
-from audio_journal.models.schemas import SceneType
+from audio_journal.models.schemas import RunStats, SceneType
 from audio_journal.pipeline import Pipeline
+from audio_journal.storage.deep_queue import JSONLDeepAnalysisQueue
 from audio_journal.storage.index import JSONLArchiveIndex
 from audio_journal.watcher.file_watcher import FileWatcher
 
@@ -47,8 +48,70 @@ def process(obj: dict, wav_path: Path) -> None:
 
     cfg: AppConfig = obj["config"]
     pipe = create_pipeline(cfg)
-    results = asyncio.run(pipe.process(wav_path))
+    try:
+        results = asyncio.run(pipe.process(wav_path))
+    finally:
+        pipe.close()
     click.echo(f"\u2705 已归档 {len(results)} 条")
+    _echo_stats(getattr(pipe, "last_stats", None) or RunStats())
+
+
+def _echo_asr_load(engine: object) -> None:
+    # 缓存包装器的实际引擎在 .engine 上
+    engine = getattr(engine, "engine", engine)
+    seconds = getattr(engine, "load_seconds", None)
+    if seconds is not None:
+        click.echo(f"  ASR 模型加载: {seconds:.1f}s（{getattr(engine, 'load_source', 'cold')}）")
+
+
+def _echo_stats(stats: RunStats) -> None:
+    if stats.stage_peak_rss_mb:
+        peaks = " ".join(f"{k}({v:.0f}MB)" for k, v in stats.stage_peak_rss_mb.items())
+        click.echo(f"  阶段峰值 RSS: {peaks}")
+    if stats.asr_cache_hits or stats.asr_cache_misses:
+        click.echo(
+            f"  ASR 缓存: 命中 {stats.asr_cache_hits}/{stats.asr_cache_hits + stats.asr_cache_misses}"
+            f"（{stats.asr_cache_hit_rate:.0%}）"
+        )
+    if stats.classifier_cache_hits or stats.classifier_cache_misses:
+        total = stats.classifier_cache_hits + stats.classifier_cache_misses
+        click.echo(f"  分类缓存: 命中 {stats.classifier_cache_hits}/{total}")
+    if stats.heuristic_checked:
+        line = (
+            f"  预分类: {stats.heuristic_decided}/{stats.heuristic_checked} 个片段达到阈值"
+            f"（{stats.heuristic_decided_rate:.0%}）"
+        )
+        if stats.heuristic_compared:
+            line += (
+                f"，与 LLM 一致 {stats.heuristic_agreed}/{stats.heuristic_compared}"
+                f"（{stats.heuristic_agreement:.0%}）"
+            )
+        click.echo(line)
+    if stats.classifier_batch_fallbacks:
+        click.echo(f"  批量分类: {stats.classifier_batch_fallbacks} 个片段改为单独调用")
+    if stats.asr_audio_s:
+        click.echo(
+            f"  ASR: {stats.asr_chunks} 个 chunk，音频 {stats.asr_audio_s:.0f}s，"
+            f"耗时 {stats.asr_wall_s:.1f}s，RTF {stats.asr_rtf:.3f}（p95 {stats.asr_rtf_p95:.3f}）"
+        )
+        if stats.asr_diarization_fallbacks:
+            click.echo(f"  说话人分离降级: {stats.asr_diarization_fallbacks} 个 chunk")
+    if stats.asr_failed_chunks:
+        click.echo(f"  ⚠️ ASR 超时/崩溃跳过 {stats.asr_failed_chunks} 个 chunk")
+    if stats.diarization_regions:
+        click.echo(
+            f"  全局说话人分离: {stats.diarization_regions} 段聚为 "
+            f"{stats.diarization_speakers} 位说话人"
+        )
+    if stats.low_memory_chunking:
+        click.echo("  内存预算: 已切换为流式切分")
+    if stats.deep_queued:
+        click.echo(f"  预览归档: {stats.preview_archived} 条，深度分析已入队 {stats.deep_queued} 条")
+    if stats.value_filter_checked:
+        click.echo(
+            f"  价值预筛: {stats.value_filter_passed}/{stats.value_filter_checked} 条进入完整分析，"
+            f"净节省约 {stats.value_filter_net_tokens_saved} tokens"
+        )
 
 
 @main.command()
@@ -63,17 +126,45 @@ def start(obj: dict) -> None:
         watch_dir=cfg.watcher.watch_dir,
         patterns=cfg.watcher.patterns,
         stable_seconds=cfg.watcher.stable_seconds,
+        wait_for_stable=not cfg.watcher.streaming,
     )
 
     def _on_audio_ready(p: Path) -> None:
         # 已知限制：这里在 watchdog 的回调线程里直接 asyncio.run，会为每个文件创建新 event loop。
         # 如果单次处理耗时较长且新文件持续进入，回调线程会被阻塞（MVP 阶段先接受，后续应改为队列+后台 worker）。
-        asyncio.run(pipe.process(p))
+        if cfg.watcher.streaming:
+            asyncio.run(pipe.process_stream(p))
+        else:
+            asyncio.run(pipe.process(p))
 
     click.echo("\U0001F399\ufe0f Audio Journal 服务启动")
+    _echo_asr_load(getattr(pipe, "asr", None))
     click.echo(f"  监听目录: {cfg.watcher.watch_dir}")
     click.echo("  等待新录音文件...\n")
-    watcher.start(_on_audio_ready)
+    try:
+        watcher.start(_on_audio_ready)
+    finally:
+        pipe.close()
+
+
+@main.command(name="asr-server")
+@click.pass_obj
+def asr_server(obj: dict) -> None:
+    """前台启动常驻 ASR 服务（模型只加载一次，供其他命令复用）。"""
+    from audio_journal.asr.server import ASRServer
+    from audio_journal.pipeline import create_local_asr
+
+    cfg: AppConfig = obj["config"]
+    click.echo("⏳ 加载 ASR 模型...")
+    engine = create_local_asr(cfg)
+    _echo_asr_load(engine)
+    server = ASRServer(engine, cfg.asr.server_socket)
+    click.echo(f"\U0001F399\ufe0f ASR 服务启动: {cfg.asr.server_socket}")
+    click.echo("  在 config.yaml 中设置 asr.use_server: true 以复用该服务\n")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
 
 
 @main.command()
@@ -89,12 +180,21 @@ def status(obj: dict) -> None:
 
     click.echo("\U0001F4CA Audio Journal 状态\n")
     click.echo("  服务: ○ 未实现 daemon（Phase 1）")
+    if cfg.asr.use_server:
+        from audio_journal.asr.server import RemoteASREngine
+
+        running = RemoteASREngine(cfg.asr.server_socket).is_available()
+        click.echo(f"  ASR 服务: {'● 运行中' if running else '○ 未运行'}")
     click.echo(f"  今日归档: {len(entries)} 条")
 
     dist = Counter(e.scene.value for e in entries)
     if dist:
         click.echo("  场景分布: " + " ".join(f"{k}({v})" for k, v in sorted(dist.items())))
 
+    pending = len(JSONLDeepAnalysisQueue(cfg.preview.queue_path))
+    if pending:
+        click.echo(f"  待深度分析: {pending} 条")
+
 
 @main.command(name="list")
 @click.option("--date", "date_filter", type=str, default=None)
@@ -110,7 +210,8 @@ def list_entries(obj: dict, date_filter: str | None, scene_filter: str | None) -
     entries = idx.list(date=date_filter, scene=scene)
 
     for e in entries:
-        click.echo(f"{e.id}\t{e.date}\t{e.scene.value}\t{e.title}")
+        suffix = "\t(preview)" if e.tier == "preview" else ""
+        click.echo(f"{e.id}\t{e.date}\t{e.scene.value}\t{e.title}{suffix}")
 
 
 @main.command()
@@ -140,6 +241,28 @@ def show(obj: dict, entry_id: str) -> None:
         click.echo("(归档文件不存在)")
 
 
+@main.command()
+@click.option("--limit", type=int, default=None, help="最多处理条数")
+@click.option("--force", is_flag=True, default=False, help="忽略 preview.deep_hours 时段限制")
+@click.pass_obj
+def deep(obj: dict, limit: int | None, force: bool) -> None:
+    """执行排队中的深度分析，并原地升级 preview 归档。"""
+    from datetime import datetime
+
+    cfg: AppConfig = obj["config"]
+    hours = cfg.preview.deep_hours
+    if hours and not force and datetime.now().hour not in hours:
+        click.echo(f"⏸️  当前不在深度分析时段 {sorted(hours)}，使用 --force 立即执行")
+        return
+
+    pipe = create_pipeline(cfg)
+    try:
+        upgraded = asyncio.run(pipe.run_deep_queue(limit=limit))
+    finally:
+        pipe.close()
+    click.echo(f"\u2705 已升级 {len(upgraded)} 条归档")
+
+
 @main.command()
 @click.option(
     "--date",
@@ -179,13 +302,17 @@ def batch(obj: dict, target_date: str | None) -> None:
     # 处理
     processor = DailyBatchProcessor(cfg)
     click.echo(f"\n⏳ 合并音频并处理...")
-    report = asyncio.run(processor.process_date(d))
+    try:
+        report = asyncio.run(processor.process_date(d))
+    finally:
+        processor.close()
 
     click.echo(f"\n✅ 处理完成")
     click.echo(f"  文件数: {report.file_count}")
     click.echo(f"  片段数: {report.segment_count}")
     if report.scene_distribution:
         click.echo(f"  场景分布: {report.scene_distribution}")
+    _echo_stats(report.stats)
 
 
 @main.command(name="batch-all")
@@ -202,11 +329,14 @@ def batch_all(obj: dict) -> None:
     click.echo(f"📅 发现 {len(all_groups)} 个日期待处理\n")
 
     processor = DailyBatchProcessor(cfg)
-    for d in sorted(all_groups.keys()):
-        files = all_groups[d]
-        click.echo(f"处理 {d.isoformat()} ({len(files)} 个文件)...")
-        report = asyncio.run(processor.process_date(d))
-        click.echo(f"  ✅ {report.segment_count} 个片段")
+    try:
+        for d in sorted(all_groups.keys()):
+            files = all_groups[d]
+            click.echo(f"处理 {d.isoformat()} ({len(files)} 个文件)...")
+            report = asyncio.run(processor.process_date(d))
+            click.echo(f"  ✅ {report.segment_count} 个片段")
+    finally:
+        processor.close()
 
     click.echo(f"\n🎉 全部完成")
 
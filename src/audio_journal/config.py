@@ -5,7 +5,53 @@ from pathlib import Path
 from typing import Any, Literal, Optional
 
 import yaml
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, field_validator
+
+
+class ASRCacheConfig(BaseModel):
+    """ASR 结果缓存（按 chunk PCM 内容 + 模型配置寻址）。"""
+
+    enabled: bool = False
+    dir: Path = Path("./data/asr_cache")
+    max_mb: float = 2048.0  # 超出后按最近使用时间淘汰
+
+
+class ASRMetricsConfig(BaseModel):
+    """逐 chunk ASR 遥测（音频时长、耗时、RTF 等）的 JSONL 指标文件。"""
+
+    enabled: bool = False
+    path: Path = Path("./data/metrics/asr.jsonl")
+
+
+class ASRSupervisorConfig(BaseModel):
+    """ASR 子进程监管：按 chunk 时长设置超时，卡死/崩溃时重启 worker 并重试。"""
+
+    enabled: bool = False
+    deadline_factor: float = 1.0  # 截止时间 = 音频时长 × 该系数
+    min_deadline_s: float = 120.0
+    load_timeout_s: float = 600.0  # worker 加载模型的超时
+    retries: int = 1
+
+
+class ASRStreamingConfig(BaseModel):
+    """流式 ASR（engine: funasr-streaming）配置。"""
+
+    model: str = "paraformer-zh-streaming"
+    chunk_ms: int = 600  # 每次送入模型的音频时长，需为 60 的倍数
+    encoder_look_back: int = 4
+    decoder_look_back: int = 1
+    # 能量端点检测：连续静音超过 endpoint_silence_s 或 utterance 过长时结束当前句。
+    silence_rms_threshold: float = 200.0
+    endpoint_silence_s: float = 0.8
+    max_utterance_s: float = 20.0
+    punctuate: bool = True  # 每条 utterance 结束时用 punc_model 补标点
+
+
+class ASROnnxConfig(BaseModel):
+    """ONNX 后端（engine: funasr-onnx）配置。"""
+
+    quantize: bool = True  # 使用 int8 量化模型（model_quant.onnx）
+    intra_op_num_threads: int = 4
 
 
 class ASRConfig(BaseModel):
@@ -17,9 +63,27 @@ class ASRConfig(BaseModel):
     spk_model: str = "cam++"
     device: str = "mps"
     batch_size: int = 4
+    # 每次 ASR 调用合并转写的 chunk 数；>1 时 pipeline 使用 transcribe_many 跨 chunk 批处理。
+    chunks_per_call: int = 1
+    # 多进程 CPU 转写：>1 时启动 workers 个进程各自常驻模型，chunk 按时长从长到短分派。
+    workers: int = 1
+    threads_per_worker: int = 0  # 每个 worker 的 torch 线程数；0 表示按 CPU 核数均分
     language: str = "zh"
     model_dir: Path = Path("./models")  # 模型存储目录
+    # 模型快照：首次冷启动后把初始化好的模型写入 model_dir/.snapshots，之后 mmap 载入
+    model_snapshot: bool = False
     enable_speaker_diarization: bool = True  # 是否启用说话人分离（可能在某些音频上失败）
+    # 语音区间来源：model = FunASR 内置 fsmn-vad；chunker = 复用切分时的能量包络，
+    # 只解码语音区间、跳过模型 VAD（该路径不做说话人分离）。
+    vad_source: Literal["model", "chunker"] = "model"
+    # 常驻 ASR 服务：启用后优先连接 `audio-journal asr-server`，不可用时回退本地加载。
+    use_server: bool = False
+    server_socket: Path = Path("./data/asr.sock")
+    cache: ASRCacheConfig = Field(default_factory=ASRCacheConfig)
+    supervisor: ASRSupervisorConfig = Field(default_factory=ASRSupervisorConfig)
+    metrics: ASRMetricsConfig = Field(default_factory=ASRMetricsConfig)
+    streaming: ASRStreamingConfig = Field(default_factory=ASRStreamingConfig)
+    onnx: ASROnnxConfig = Field(default_factory=ASROnnxConfig)
 
 
 class ChunkerConfig(BaseModel):
@@ -31,6 +95,10 @@ class ChunkerConfig(BaseModel):
     min_chunk_duration: float = 60.0
     parallel: bool = True
     max_workers: int = 4
+    # 语音区间（供 asr.vad_source: chunker 跳过模型 VAD）：合并间隔、两端留白、单段上限
+    speech_merge_gap_s: float = 0.5
+    speech_pad_s: float = 0.2
+    max_speech_region_s: float = 30.0
 
 
 class SegmenterConfig(BaseModel):
@@ -39,6 +107,34 @@ class SegmenterConfig(BaseModel):
     min_segment_duration: float = 10.0
 
 
+class ClassifierCacheConfig(BaseModel):
+    """场景分类结果缓存（按 prompt 采样 + 模型/温度寻址）。"""
+
+    enabled: bool = False
+    dir: Path = Path("./data/classifier_cache")
+    ttl_days: float = 30.0
+    max_entries: int = 10000  # 超出后按最近使用时间淘汰
+
+
+class ClassifierHeuristicConfig(BaseModel):
+    """LLM 之前的特征预分类（说话人数、轮换频率、时长、关键词、录音时刻）。"""
+
+    enabled: bool = False
+    threshold: float = 0.8  # 预分类置信度达到该值时跳过 LLM
+    shadow: bool = False  # 仍调用 LLM，只统计与 LLM 结果的一致率
+
+
+class ClassifierConfig(BaseModel):
+    """场景分类配置。"""
+
+    # fused 模式：分类与场景分析合并为一次 LLM 调用（发送完整转写）。
+    fused: bool = False
+    # 批量分类：>1 时把多个片段的采样合入一个 prompt（classifier_batch.txt），共用分类说明。
+    batch_size: int = 1
+    cache: ClassifierCacheConfig = Field(default_factory=ClassifierCacheConfig)
+    heuristic: ClassifierHeuristicConfig = Field(default_factory=ClassifierHeuristicConfig)
+
+
 class LLMStageOverride(BaseModel):
     provider: str
     model: str
@@ -100,6 +196,9 @@ class WatcherConfig(BaseModel):
     patterns: list[str] = Field(default_factory=lambda: ["*.wav"])
     stable_seconds: int = 5
     daemon: bool = False
+    # 边录边转：新文件出现即开始流式转写（需 asr.engine: funasr-streaming），
+    # 文件 stable_seconds 内不再增长视为录音结束。
+    streaming: bool = False
 
 
 class BatchConfig(BaseModel):
@@ -119,10 +218,69 @@ class MergerConfig(BaseModel):
     )
 
 
+class ValueFilterConfig(BaseModel):
+    """chat 场景价值预筛配置。
+
+    启用后，chat 片段先用 value_detector 对少量采样文本打分，
+    仅分数达到阈值的片段才进入完整的 ChatAnalyzer 分析。
+    """
+
+    enabled: bool = False
+    threshold: float = 0.5  # 0-1，低于该分数的片段走 passthrough 归档
+    sample_token_budget: int = 800  # 采样文本的估算 token 上限
+
+
+class DiarizationConfig(BaseModel):
+    """日级全局说话人分离配置。
+
+    启用后 ASR 不再逐 chunk 运行 cam++，改为对整次运行的 utterance 统一提取
+    embedding 并聚类，同一天内 SPEAKER_xx 编号一致。
+    """
+
+    enabled: bool = False
+    threshold: float = 0.6  # 余弦相似度阈值，越高分出的人越多
+    min_region_s: float = 0.5  # 短于此的 utterance 不提 embedding，按时间就近归属
+    refine_iters: int = 5
+    batch_size: int = 16
+
+
+class PreviewConfig(BaseModel):
+    """两级归档配置。
+
+    启用后，需要 LLM 深度分析的片段先以 preview（转写 + 分类）立即归档，
+    深度分析写入队列，由 `audio-journal deep` 稍后执行并原地升级归档。
+    """
+
+    enabled: bool = False
+    queue_path: Path = Path("./data/deep_queue.jsonl")
+    # 允许执行深度分析的小时（0-23），用于把 LLM 调用安排到低价时段；空表示不限。
+    deep_hours: list[int] = Field(default_factory=list)
+
+    @field_validator("deep_hours")
+    @classmethod
+    def _check_deep_hours(cls, hours: list[int]) -> list[int]:
+        invalid = [h for h in hours if not 0 <= h <= 23]
+        if invalid:
+            raise ValueError(f"deep_hours 只能包含 0-23 的小时，收到: {invalid}")
+        return hours
+
+
+class MemoryConfig(BaseModel):
+    """分阶段内存监控，以及 chunker 流式切分阈值。"""
+
+    enabled: bool = False  # 采样并报告各阶段 RSS 峰值
+    tracemalloc: bool = False  # 额外记录 Python 堆分配峰值（有明显性能开销）
+    sample_interval: float = 0.05  # 秒
+    # chunker 流式切分阈值（MB）：切分前预计 RSS 将超出时改为流式切分，不把整段 PCM
+    # 读入内存。只影响切分方式，不限制 ASR/分析阶段的内存占用。
+    budget_mb: Optional[float] = None
+
+
 class AppConfig(BaseModel):
     asr: ASRConfig = Field(default_factory=ASRConfig)
     chunker: ChunkerConfig = Field(default_factory=ChunkerConfig)
     segmenter: SegmenterConfig = Field(default_factory=SegmenterConfig)
+    classifier: ClassifierConfig = Field(default_factory=ClassifierConfig)
     llm: LLMConfig = Field(default_factory=LLMConfig)
 
     scenes: list[str] = Field(
@@ -134,6 +292,10 @@ class AppConfig(BaseModel):
     watcher: WatcherConfig = Field(default_factory=WatcherConfig)
     batch: BatchConfig = Field(default_factory=BatchConfig)
     merger: MergerConfig = Field(default_factory=MergerConfig)
+    value_filter: ValueFilterConfig = Field(default_factory=ValueFilterConfig)
+    preview: PreviewConfig = Field(default_factory=PreviewConfig)
+    memory: MemoryConfig = Field(default_factory=MemoryConfig)
+    diarization: DiarizationConfig = Field(default_factory=DiarizationConfig)
 
     def resolve_paths(self, base_dir: Path) -> "AppConfig":
         """将配置中的相对路径基于 base_dir 展开为绝对路径。"""
@@ -145,6 +307,12 @@ class AppConfig(BaseModel):
 
         # asr
         data["asr"]["model_dir"] = _abs(Path(data["asr"]["model_dir"]))
+        data["asr"]["server_socket"] = _abs(Path(data["asr"]["server_socket"]))
+        data["asr"]["cache"]["dir"] = _abs(Path(data["asr"]["cache"]["dir"]))
+        data["asr"]["metrics"]["path"] = _abs(Path(data["asr"]["metrics"]["path"]))
+
+        # classifier
+        data["classifier"]["cache"]["dir"] = _abs(Path(data["classifier"]["cache"]["dir"]))
 
         # paths
         data["paths"]["inbox"] = _abs(Path(data["paths"]["inbox"]))
@@ -165,6 +333,9 @@ class AppConfig(BaseModel):
         # batch
         data["batch"]["processed_dir"] = _abs(Path(data["batch"]["processed_dir"]))
 
+        # preview
+        data["preview"]["queue_path"] = _abs(Path(data["preview"]["queue_path"]))
+
         return AppConfig.model_validate(data)
 
 
@@ -0,0 +1 @@
+"""说话人分离。"""
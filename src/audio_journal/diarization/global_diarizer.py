@@ -0,0 +1,278 @@
+"""日级全局说话人分离。
+
+默认由 FunASR 在每个 chunk 的 generate 里各自跑 cam++：同一天不同 chunk 的
+SPEAKER_xx 编号互不对应，且每个 chunk 都要重新聚类。这里改为：
+
+1. ASR 阶段不加载说话人模型，只产出带时间戳的 utterance；
+2. 对一天内所有 utterance（语音区间）各提取一次 cam++ embedding；
+3. 在整天的 embedding 矩阵上做向量化聚类，统一重新标注说话人。
+"""
+from __future__ import annotations
+
+import logging
+import wave
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Any, Sequence
+
+import numpy as np
+
+from audio_journal.models.schemas import Speaker, Utterance
+
+logger = logging.getLogger(__name__)
+
+
+class SpeakerEmbedder(ABC):
+    """说话人 embedding 提取抽象。"""
+
+    @abstractmethod
+    def embed(self, clips: Sequence[np.ndarray], sample_rate: int) -> np.ndarray:
+        """对一批单声道 float32 片段提取 embedding，返回 (len(clips), dim)。"""
+
+        raise NotImplementedError
+
+
+class CamPPEmbedder(SpeakerEmbedder):
+    """基于 FunASR cam++ 模型的 embedding 提取。"""
+
+    def __init__(
+        self, model_path: str | Path, *, device: str = "cpu", batch_size: int = 16
+    ) -> None:
+        try:
+            from funasr import AutoModel
+        except ImportError as e:
+            raise RuntimeError("FunASR 未安装。请运行: pip install funasr modelscope") from e
+
+        model_path = Path(model_path)
+        if not model_path.exists():
+            raise RuntimeError(f"模型文件缺失:\n  - 说话人分离 ({model_path})")
+        logger.info(f"加载说话人 embedding 模型: {model_path}")
+        self._model: Any = AutoModel(model=str(model_path), device=device)
+        self.batch_size = batch_size
+
+    def embed(self, clips: Sequence[np.ndarray], sample_rate: int) -> np.ndarray:
+        out: list[np.ndarray] = []
+        for i in range(0, len(clips), self.batch_size):
+            batch = list(clips[i : i + self.batch_size])
+            result = self._model.generate(input=batch, fs=sample_rate)
+            for item in result:
+                emb = item["spk_embedding"]
+                if hasattr(emb, "cpu"):
+                    emb = emb.cpu().numpy()
+                out.append(np.asarray(emb, dtype=np.float32).reshape(-1))
+        return np.stack(out) if out else np.zeros((0, 0), dtype=np.float32)
+
+
+class GlobalDiarizer:
+    """整天（单次 Pipeline 运行）范围的说话人聚类与重新标注。"""
+
+    def __init__(
+        self,
+        embedder: SpeakerEmbedder,
+        *,
+        threshold: float = 0.6,
+        min_region_s: float = 0.5,
+        refine_iters: int = 5,
+    ) -> None:
+        self.embedder = embedder
+        self.threshold = threshold
+        self.min_region_s = min_region_s
+        self.refine_iters = refine_iters
+        # 最近一次 diarize 的统计
+        self.last_regions = 0
+        self.last_speakers = 0
+
+    def diarize(
+        self, transcripts: Sequence[tuple[str | Path, list[Utterance]]]
+    ) -> list[list[Utterance]]:
+        """对 (chunk 音频路径, 该 chunk 的 utterances) 列表统一标注说话人，按输入顺序返回。
+
+        utterance 时间以所在 chunk 为基准。过短的区间 embedding 不可靠，
+        不参与聚类，事后归到同 chunk 内时间上最近的已标注 utterance。
+        """
+
+        refs: list[tuple[int, int]] = []  # (transcript 下标, utterance 下标)
+        embeddings: list[np.ndarray] = []
+        for t_idx, (audio_path, utterances) in enumerate(transcripts):
+            picked = [
+                u_idx
+                for u_idx, u in enumerate(utterances)
+                if u.end_time - u.start_time >= self.min_region_s
+            ]
+            if not picked:
+                continue
+            pcm, rate = _read_mono(Path(audio_path))
+            clips = [
+                pcm[int(utterances[i].start_time * rate) : int(utterances[i].end_time * rate)]
+                for i in picked
+            ]
+            embeddings.append(self.embedder.embed(clips, rate))
+            refs.extend((t_idx, i) for i in picked)
+
+        labels_by_ref: dict[tuple[int, int], int] = {}
+        if refs:
+            labels = cluster_embeddings(
+                np.concatenate(embeddings),
+                threshold=self.threshold,
+                refine_iters=self.refine_iters,
+            )
+            labels_by_ref = dict(zip(refs, labels.tolist()))
+        self.last_regions = len(refs)
+        self.last_speakers = len(set(labels_by_ref.values()))
+        logger.info(f"全局说话人聚类: {self.last_regions} 个区间 → {self.last_speakers} 人")
+
+        out: list[list[Utterance]] = []
+        for t_idx, (_, utterances) in enumerate(transcripts):
+            known = {
+                i: labels_by_ref[(t_idx, i)]
+                for i in range(len(utterances))
+                if (t_idx, i) in labels_by_ref
+            }
+            relabeled: list[Utterance] = []
+            for u, label in zip(utterances, _fill_labels(utterances, known)):
+                if label is None:
+                    relabeled.append(u)
+                    continue
+                speaker = Speaker(id=f"SPEAKER_{label:02d}")
+                relabeled.append(u.model_copy(update={"speaker": speaker}))
+            out.append(relabeled)
+        return out
+
+
+def cluster_embeddings(
+    embeddings: np.ndarray, *, threshold: float, refine_iters: int = 5
+) -> np.ndarray:
+    """余弦相似度聚类，返回每行的簇编号（按首次出现顺序从 0 编号）。
+
+    1. leader 聚类：依次把向量分给相似度最高且超过阈值的簇，否则新建簇（O(N·K)）；
+    2. 球面 k-means 细化：整体矩阵乘重新分配、重算质心；
+    3. 质心相似度超过阈值的簇合并。
+    """
+
+    n = embeddings.shape[0]
+    if n == 0:
+        return np.zeros(0, dtype=np.int64)
+
+    x = embeddings / np.maximum(np.linalg.norm(embeddings, axis=1, keepdims=True), 1e-12)
+
+    # 质心矩阵按最多 n 个簇预分配，前 k 行有效；避免每步把质心列表重新堆成矩阵
+    centroids = np.empty_like(x)
+    sums = np.empty_like(x)
+    centroids[0] = sums[0] = x[0]
+    k = 1
+    labels = np.zeros(n, dtype=np.int64)
+    for i in range(1, n):
+        sims = centroids[:k] @ x[i]
+        best = int(np.argmax(sims))
+        if sims[best] >= threshold:
+            labels[i] = best
+            sums[best] += x[i]
+            centroids[best] = sums[best] / np.linalg.norm(sums[best])
+        else:
+            labels[i] = k
+            centroids[k] = sums[k] = x[i]
+            k += 1
+
+    c = centroids[:k]
+    live = np.ones(k, dtype=bool)
+    for _ in range(refine_iters):
+        new_labels = _assign(x, c, live)
+        c = _centroids(x, new_labels, k)
+        live = np.bincount(new_labels, minlength=k) > 0
+        if np.array_equal(new_labels, labels):
+            break
+        labels = new_labels
+
+    labels = _merge_close_clusters(x, labels, threshold)
+    return _renumber(labels)
+
+
+def _assign(x: np.ndarray, c: np.ndarray, live: np.ndarray) -> np.ndarray:
+    """把每行分给相似度最高的非空簇。
+
+    空簇的质心是零向量，相似度恒为 0；所有相似度都为负时它会胜出，因此显式排除。
+    """
+
+    sims = x @ c.T
+    sims[:, ~live] = -np.inf
+    return np.argmax(sims, axis=1)
+
+
+def _centroids(x: np.ndarray, labels: np.ndarray, k: int) -> np.ndarray:
+    sums = np.zeros((k, x.shape[1]), dtype=x.dtype)
+    np.add.at(sums, labels, x)
+    norms = np.linalg.norm(sums, axis=1, keepdims=True)
+    # 空簇的质心置零；分配时由 _assign 排除
+    return np.where(norms > 0, sums / np.maximum(norms, 1e-12), 0.0)
+
+
+def _merge_close_clusters(x: np.ndarray, labels: np.ndarray, threshold: float) -> np.ndarray:
+    while True:
+        ids = np.unique(labels)
+        if len(ids) < 2:
+            return labels
+        remap = np.full(labels.max() + 1, -1, dtype=np.int64)
+        remap[ids] = np.arange(len(ids))
+        compact = remap[labels]
+        c = _centroids(x, compact, len(ids))
+        sims = c @ c.T
+        np.fill_diagonal(sims, -np.inf)
+        a, b = np.unravel_index(int(np.argmax(sims)), sims.shape)
+        if sims[a, b] < threshold:
+            return compact
+        compact[compact == b] = a
+        labels = compact
+
+
+def _renumber(labels: np.ndarray) -> np.ndarray:
+    _, first_idx = np.unique(labels, return_index=True)
+    order = np.argsort(first_idx)
+    remap = np.empty(labels.max() + 1, dtype=np.int64)
+    remap[np.unique(labels)[order]] = np.arange(len(order))
+    return remap[labels]
+
+
+def _fill_labels(utterances: list[Utterance], known: dict[int, int]) -> list[int | None]:
+    """未参与聚类的 utterance 取时间上最近（按中点距离）的已聚类 utterance 的标签。
+
+    按中点排序后前向、后向各扫一遍，得到两侧最近的已聚类邻居，整体 O(n log n)。
+    """
+
+    n = len(utterances)
+    if not known:
+        return [None] * n
+    mids = [(u.start_time + u.end_time) / 2 for u in utterances]
+    order = sorted(range(n), key=mids.__getitem__)
+
+    prev: list[int | None] = [None] * n
+    last: int | None = None
+    for i in order:
+        if i in known:
+            last = i
+        prev[i] = last
+
+    out: list[int | None] = [None] * n
+    nxt: int | None = None
+    for i in reversed(order):
+        if i in known:
+            nxt = i
+            out[i] = known[i]
+            continue
+        p = prev[i]
+        # 两侧距离相等时取前一个
+        if nxt is None or (p is not None and mids[i] - mids[p] <= mids[nxt] - mids[i]):
+            out[i] = known[p] if p is not None else None
+        else:
+            out[i] = known[nxt]
+    return out
+
+
+def _read_mono(path: Path) -> tuple[np.ndarray, int]:
+    with wave.open(str(path), "rb") as wf:
+        rate = wf.getframerate()
+        channels = wf.getnchannels()
+        if wf.getsampwidth() != 2:
+            raise ValueError(f"仅支持 16-bit PCM WAV: {path}")
+        frames = wf.readframes(wf.getnframes())
+    pcm = np.frombuffer(frames, dtype="<i2")[::channels].astype(np.float32) / 32768.0
+    return pcm, rate
@@ -46,6 +46,22 @@ def parse_json_strict(text: str) -> dict[str, Any]:
             raise LLMError(f"无法解析 JSON: {text!r}") from e
 
 
+def estimate_tokens(text: str) -> int:
+    """粗略估算文本 token 数（不依赖 tokenizer）。
+
+    中日韩字符按 1 字 1 token 计，其余字符按 4 字符 1 token 计。
+    仅用于预算控制与节省量统计，不追求精确。
+    """
+
+    cjk = sum(1 for ch in text if _is_cjk(ch))
+    other = len(text) - cjk
+    return cjk + (other + 3) // 4
+
+
+def _is_cjk(ch: str) -> bool:
+    return "\u2e80" <= ch <= "\u9fff" or "\uf900" <= ch <= "\ufaff" or "\uff00" <= ch <= "\uffef"
+
+
 class LLMFactory:
     """根据配置创建 Provider，并支持按 stage 覆盖。"""
 
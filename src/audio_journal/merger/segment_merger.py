@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import heapq
+
 from audio_journal.config import MergerConfig
 from audio_journal.models.schemas import ClassifiedSegment, MergedSegment, Utterance
 
@@ -84,13 +86,7 @@ class SegmentMerger:
     def _create_merged_segment(self, segments: list[ClassifiedSegment]) -> MergedSegment:
         """创建合并后的 MergedSegment。"""
 
-        # 合并所有 utterances
-        all_utterances: list[Utterance] = []
-        for seg in segments:
-            all_utterances.extend(seg.utterances)
-
-        # 按时间排序
-        all_utterances.sort(key=lambda u: u.start_time)
+        all_utterances = merge_utterances([seg.utterances for seg in segments])
 
         # 计算间隔
         gap_durations: list[float] = []
@@ -110,7 +106,8 @@ class SegmentMerger:
         # 生成合并 ID
         merged_id = "merged-" + "-".join(seg.id for seg in segments)
 
-        return MergedSegment(
+        # 字段均来自已校验的 ClassifiedSegment；跳过校验，避免 pydantic 再复制一遍 utterance 列表
+        return MergedSegment.model_construct(
             id=merged_id,
             scene=segments[0].scene,
             utterances=all_utterances,
@@ -123,3 +120,20 @@ class SegmentMerger:
             confidence=avg_confidence,
             value_tags=unique_value_tags,
         )
+
+
+def merge_utterances(runs: list[list[Utterance]]) -> list[Utterance]:
+    """把多个片段的 utterance 列表合并为按 start_time 排序的一个列表（只复制引用）。
+
+    依赖 Segment.utterances 已按时间排序的约定（分段器保证）。片段首尾不重叠时
+    （常见情况）只需检查 k 个边界后顺序拼接，O(n)；有重叠时做 k 路归并，O(n log k)。
+    start_time 相同的 utterance 保持片段顺序，与稳定排序结果一致。
+    """
+
+    runs = [r for r in runs if r]
+    if any(a[-1].start_time > b[0].start_time for a, b in zip(runs, runs[1:])):
+        return list(heapq.merge(*runs, key=lambda u: u.start_time))
+    merged: list[Utterance] = []
+    for r in runs:
+        merged += r
+    return merged
@@ -32,7 +32,7 @@ class Utterance(BaseModel):
 
 
 class Segment(BaseModel):
-    """分段后的一个片段。"""
+    """分段后的一个片段。utterances 按 start_time 升序排列（分段器保证，合并器依赖）。"""
 
     id: str
     utterances: list[Utterance]
@@ -49,6 +49,33 @@ class ClassifiedSegment(Segment):
     confidence: float
     value_tags: list[str] = Field(default_factory=list)
 
+    @classmethod
+    def from_segment(
+        cls,
+        segment: Segment,
+        *,
+        scene: SceneType,
+        confidence: float,
+        value_tags: Optional[list[str]] = None,
+    ) -> "ClassifiedSegment":
+        """由已校验的 Segment 提升为 ClassifiedSegment，共享 utterances 列表。
+
+        不走 model_dump + 重新校验：后者会把每条 utterance 展开成 dict 再重建对象，
+        一天上万条 utterance 时是分类阶段最大的分配来源。
+        """
+
+        return cls.model_construct(
+            id=segment.id,
+            utterances=segment.utterances,
+            start_time=segment.start_time,
+            end_time=segment.end_time,
+            duration=segment.duration,
+            source_file=segment.source_file,
+            scene=SceneType(scene),
+            confidence=float(confidence),
+            value_tags=list(value_tags or []),
+        )
+
 
 class MergedSegment(BaseModel):
     """合并后的 Segment，保留原始 Segment 信息以便追溯。"""
@@ -89,6 +116,93 @@ class AnalysisResult(BaseModel):
     metadata: dict[str, Any] = Field(default_factory=dict)
 
 
+class ValueDetection(BaseModel):
+    """chat 片段价值预筛结果。"""
+
+    segment_id: str
+    has_value: bool
+    value_score: float
+    value_tags: list[str] = Field(default_factory=list)
+    sample_tokens: int = 0  # 预筛 prompt 中转写采样的估算 token 数
+    prompt_tokens: int = 0  # 完整预筛 prompt（指令模板 + 采样）的估算 token 数
+    completion_tokens: int = 0  # LLM 返回内容的估算 token 数
+
+    @property
+    def tokens_spent(self) -> int:
+        return self.prompt_tokens + self.completion_tokens
+
+
+class RunStats(BaseModel):
+    """单次 Pipeline 运行统计。"""
+
+    # chat 价值预筛
+    value_filter_checked: int = 0
+    value_filter_passed: int = 0
+    value_filter_tokens_spent: int = 0  # 预筛调用消耗的估算 token（完整 prompt + 返回）
+    value_filter_tokens_saved: int = 0  # 被过滤片段省下的完整转写 token
+
+    # fused 分类+分析
+    fused_calls: int = 0
+    fused_reanalyzed: int = 0  # 因合并而需要重新分析的片段数
+
+    # 两级归档
+    preview_archived: int = 0
+    deep_queued: int = 0
+
+    # ASR 结果缓存（按 chunk 计）
+    asr_cache_hits: int = 0
+    asr_cache_misses: int = 0
+    asr_failed_chunks: int = 0  # 超时/崩溃且重试后仍失败而跳过的 chunk
+
+    # 场景分类结果缓存
+    classifier_cache_hits: int = 0
+    classifier_cache_misses: int = 0
+    classifier_batch_fallbacks: int = 0  # 批量分类结果缺失/无效而单独重试的片段
+
+    # 特征预分类（shadow 模式下 decided 为"本可跳过"的片段）
+    heuristic_checked: int = 0
+    heuristic_decided: int = 0
+    heuristic_compared: int = 0  # 置信片段中同时有 LLM 结果的数量
+    heuristic_agreed: int = 0
+
+    # ASR 遥测（不含缓存命中的 chunk）
+    asr_chunks: int = 0
+    asr_audio_s: float = 0.0
+    asr_wall_s: float = 0.0
+    asr_rtf_p95: float = 0.0
+    asr_diarization_fallbacks: int = 0
+
+    # 全局说话人分离
+    diarization_regions: int = 0
+    diarization_speakers: int = 0
+
+    # 内存（MB）
+    stage_peak_rss_mb: dict[str, float] = Field(default_factory=dict)
+    stage_peak_traced_mb: dict[str, float] = Field(default_factory=dict)
+    low_memory_chunking: bool = False
+
+    @property
+    def value_filter_net_tokens_saved(self) -> int:
+        return self.value_filter_tokens_saved - self.value_filter_tokens_spent
+
+    @property
+    def asr_cache_hit_rate(self) -> float:
+        total = self.asr_cache_hits + self.asr_cache_misses
+        return self.asr_cache_hits / total if total else 0.0
+
+    @property
+    def heuristic_decided_rate(self) -> float:
+        return self.heuristic_decided / self.heuristic_checked if self.heuristic_checked else 0.0
+
+    @property
+    def heuristic_agreement(self) -> float:
+        return self.heuristic_agreed / self.heuristic_compared if self.heuristic_compared else 0.0
+
+    @property
+    def asr_rtf(self) -> float:
+        return self.asr_wall_s / self.asr_audio_s if self.asr_audio_s else 0.0
+
+
 class ReviewDecision(str, Enum):
     ACCEPT = "accept"
     EDIT = "edit"
@@ -108,6 +222,7 @@ class DailyReport(BaseModel):
     file_count: int
     results: list[AnalysisResult]
     source_files: list[str]
+    stats: RunStats = Field(default_factory=RunStats)
 
     @property
     def segment_count(self) -> int:
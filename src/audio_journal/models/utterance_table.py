@@ -0,0 +1,88 @@
+"""列式 utterance 表：storage.binary（.ajt）在内存中的表示。
+
+一天的录音可产生 10 万条以上 utterance；落盘与读回时逐条处理 pydantic 对象的字段
+代价很高。这里把它们存成并列数组，二进制格式直接整块写入/载入各列：
+
+- starts / ends: array("d")
+- speaker_idx: array("i")，指向去重后的说话人列表（相同说话人只保留一个 Speaker 实例）
+- 全部文本拼接为一个字符串 buffer，buffer[offsets[i]:offsets[i + 1]] 为第 i 条的文本
+
+分段、渲染等处理仍直接使用 Utterance 列表；to_utterances() 在读回后物化
+（复用 Speaker 实例）。
+"""
+from __future__ import annotations
+
+from array import array
+from typing import Iterable
+
+from audio_journal.models.schemas import Speaker, Utterance
+
+
+class UtteranceTable:
+    """不可变的列式 utterance 集合。"""
+
+    __slots__ = ("starts", "ends", "speaker_idx", "speakers", "offsets", "buffer")
+
+    def __init__(
+        self,
+        starts: array,
+        ends: array,
+        speaker_idx: array,
+        speakers: list[Speaker],
+        offsets: array,
+        text: str,
+    ) -> None:
+        self.starts = starts
+        self.ends = ends
+        self.speaker_idx = speaker_idx
+        self.speakers = speakers
+        self.offsets = offsets
+        self.buffer = text
+
+    @classmethod
+    def from_utterances(cls, utterances: Iterable[Utterance]) -> "UtteranceTable":
+        starts = array("d")
+        ends = array("d")
+        speaker_idx = array("i")
+        speakers: list[Speaker] = []
+        interned: dict[tuple[str, str | None], int] = {}
+        offsets = array("q", [0])
+        parts: list[str] = []
+        pos = 0
+        for u in utterances:
+            starts.append(u.start_time)
+            ends.append(u.end_time)
+            key = (u.speaker.id, u.speaker.label)
+            idx = interned.get(key)
+            if idx is None:
+                idx = interned[key] = len(speakers)
+                speakers.append(u.speaker)
+            speaker_idx.append(idx)
+            parts.append(u.text)
+            pos += len(u.text)
+            offsets.append(pos)
+        return cls(starts, ends, speaker_idx, speakers, offsets, "".join(parts))
+
+    def __len__(self) -> int:
+        return len(self.starts)
+
+    def to_utterances(self, start: int = 0, stop: int | None = None) -> list[Utterance]:
+        """物化 [start, stop) 区间为 Utterance 列表（复用 Speaker 实例）。
+
+        直接调用构造函数：校验在 pydantic-core 中完成，比纯 Python 的 model_construct
+        更快；Speaker 实例原样通过校验，不会被复制。
+        """
+
+        stop = len(self) if stop is None else stop
+        speakers, idx = self.speakers, self.speaker_idx
+        text, off = self.buffer, self.offsets
+        starts, ends = self.starts, self.ends
+        return [
+            Utterance(
+                speaker=speakers[idx[i]],
+                text=text[off[i] : off[i + 1]],
+                start_time=starts[i],
+                end_time=ends[i],
+            )
+            for i in range(start, stop)
+        ]
@@ -1,26 +1,54 @@
 from __future__ import annotations
 
+import asyncio
+import functools
+import logging
 import os
+import time
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
 from audio_journal.analyzer.base import render_transcript
+from audio_journal.analyzer.chat import ChatAnalyzer
 from audio_journal.analyzer.meeting import MeetingAnalyzer
 from audio_journal.archiver.local import LocalArchiver
 from audio_journal.asr.base import ASREngine
+from audio_journal.asr.cache import CachedASREngine, asr_config_fingerprint
 from audio_journal.asr.mock import MockASREngine
+from audio_journal.asr.supervisor import ASRWorkerError
 from audio_journal.chunker.vad_chunker import VADChunker
+from audio_journal.classifier.cache import ClassificationCache, llm_fingerprint
+from audio_journal.classifier.fused import FusedClassifier
+from audio_journal.classifier.heuristic import CascadeClassifier, HeuristicClassifier
 from audio_journal.classifier.scene import SceneClassifier
-from audio_journal.config import AppConfig
-from audio_journal.llm.base import LLMFactory
+from audio_journal.classifier.value_detector import ValueDetector
+from audio_journal.config import AppConfig, ASRConfig
+from audio_journal.llm.base import LLMFactory, estimate_tokens
 from audio_journal.merger.segment_merger import SegmentMerger
 from audio_journal.models.schemas import (
     AnalysisResult,
     ClassifiedSegment,
     MergedSegment,
+    RunStats,
     SceneType,
+    Segment,
+    Utterance,
 )
 from audio_journal.segmenter.silence import SilenceSegmenter
+from audio_journal.storage.deep_queue import DeepAnalysisJob, JSONLDeepAnalysisQueue
+from audio_journal.storage.index import ArchiveEntry
+from audio_journal.telemetry.asr import (
+    ASRChunkMetrics,
+    JSONLMetricsSink,
+    group_metrics,
+    percentile,
+)
+from audio_journal.telemetry.memory import MemoryMonitor
+
+if TYPE_CHECKING:
+    from audio_journal.diarization.global_diarizer import GlobalDiarizer
+
+logger = logging.getLogger(__name__)
 
 
 class PassthroughAnalyzer:
@@ -48,14 +76,20 @@ class Pipeline:
         chunker: Optional[VADChunker] = None,
         asr: Optional[ASREngine] = None,
         segmenter: Optional[SilenceSegmenter] = None,
-        classifier: Optional[SceneClassifier] = None,
+        classifier: Optional[SceneClassifier | CascadeClassifier] = None,
         merger: Optional[SegmentMerger] = None,
         meeting_analyzer: Optional[MeetingAnalyzer] = None,
         archiver: Optional[LocalArchiver] = None,
+        value_detector: Optional[ValueDetector] = None,
+        chat_analyzer: Optional[ChatAnalyzer] = None,
+        fused_classifier: Optional[FusedClassifier] = None,
+        deep_queue: Optional[JSONLDeepAnalysisQueue] = None,
+        diarizer: Optional["GlobalDiarizer"] = None,
     ) -> None:
         self.config = config
         self.chunker = chunker or VADChunker(config.chunker)
-        self.asr = asr or _default_asr(config)
+        # ASR 与日级说话人分离需要加载模型，首次使用时才构建（deep 等命令用不到）
+        self._asr = asr
         self.segmenter = segmenter or SilenceSegmenter(config.segmenter)
         self.classifier = classifier or _default_classifier(config)
         self.merger = merger or SegmentMerger(config.merger)
@@ -63,49 +97,469 @@ class Pipeline:
         self.passthrough_analyzer = PassthroughAnalyzer()
         self.archiver = archiver or LocalArchiver(base_dir=config.archive.local.base_dir)
 
+        # chat 价值预筛：仅在启用时构建，未启用时 chat 仍走 passthrough。
+        if value_detector is None and config.value_filter.enabled:
+            value_detector = _default_value_detector(config)
+        self.value_detector = value_detector
+        if self.value_detector is not None and chat_analyzer is None:
+            chat_analyzer = _default_chat_analyzer(config)
+        self.chat_analyzer = chat_analyzer
+
+        # fused 模式：显式注入或配置启用时生效，替代 classifier + 首次分析。
+        if fused_classifier is None and config.classifier.fused:
+            fused_classifier = _default_fused_classifier(config, self.meeting_analyzer)
+        self.fused_classifier = fused_classifier
+
+        self.deep_queue = deep_queue or JSONLDeepAnalysisQueue(config.preview.queue_path)
+
+        # 日级说话人分离：ASR 全部完成后统一聚类，再进入分段。
+        self._diarizer = diarizer
+        # 常驻服务不支持流式转写时，process_stream 在本进程按需加载的流式引擎
+        self._stream_asr: Optional[ASREngine] = None
+
+        mem = config.memory
+        self.memory = MemoryMonitor(
+            enabled=mem.enabled,
+            trace=mem.tracemalloc,
+            sample_interval=mem.sample_interval,
+            budget_bytes=int(mem.budget_mb * 1024 * 1024) if mem.budget_mb is not None else None,
+        )
+
+        self.last_stats = RunStats()
+        self.asr_metrics_sink = (
+            JSONLMetricsSink(config.asr.metrics.path) if config.asr.metrics.enabled else None
+        )
+        self._asr_metrics: list[ASRChunkMetrics] = []
+
     async def process(self, audio_path: str | Path) -> list[AnalysisResult]:
+        self.last_stats = RunStats()
+        cache = self.asr if isinstance(self.asr, CachedASREngine) else None
+        hits_before, misses_before = (cache.hits, cache.misses) if cache else (0, 0)
+        self._asr_metrics = []
+        with self.memory.running():
+            results = await self._process(Path(audio_path))
+        _summarize_asr_metrics(self._asr_metrics, self.last_stats)
+        if self.asr_metrics_sink is not None:
+            self.asr_metrics_sink.emit(self._asr_metrics)
+        if cache is not None:
+            self.last_stats.asr_cache_hits = cache.hits - hits_before
+            self.last_stats.asr_cache_misses = cache.misses - misses_before
+        self.last_stats.stage_peak_rss_mb = self.memory.peaks_mb()
+        self.last_stats.stage_peak_traced_mb = self.memory.traced_peaks_mb()
+        return results
+
+    @property
+    def asr(self) -> ASREngine:
+        if self._asr is None:
+            self._asr = _default_asr(self.config)
+        return self._asr
+
+    def close(self) -> None:
+        """关闭 ASR 引擎持有的子进程（进程池 / 受监管 worker）；未构建的引擎不触发加载。"""
+
+        for engine in (self._asr, self._stream_asr):
+            while isinstance(engine, CachedASREngine):
+                engine = engine.engine
+            close = getattr(engine, "close", None)
+            if close is not None:
+                close()
+
+    @property
+    def diarizer(self) -> Optional["GlobalDiarizer"]:
+        if self._diarizer is None and self.config.diarization.enabled:
+            self._diarizer = _default_diarizer(self.config)
+        return self._diarizer
+
+    async def process_stream(self, audio_path: str | Path) -> list[AnalysisResult]:
+        """边录边转：跟随仍在写入的文件做流式 ASR，录音结束前即开始分段与分析。
+
+        utterance 推送给增量分段器，片段一闭合就立即分类；与上一片段的间隔超过
+        合并器允许的最大间隔时，之前的片段不可能再与后续合并，随即合并、分析并归档。
+        """
+
+        engine = self._stream_engine()
+        if engine is None:
+            raise RuntimeError("当前 ASR 引擎不支持流式转写（需 asr.engine: funasr-streaming）")
+
         src = Path(audio_path)
+        self.last_stats = RunStats()
+        merger = self.config.merger
+        # 合并关闭时每个片段分类后即可分析
+        merge_gap = merger.max_gap_between_segments if merger.enabled else -1.0
+        segmenter = self.segmenter.incremental(str(src.name))
+        results: list[AnalysisResult] = []
+        classified: list[ClassifiedSegment] = []
+        fused_results: dict[str, AnalysisResult] = {}
+
+        async def _on_closed(segments: list[Segment]) -> None:
+            nonlocal classified, fused_results
+            for seg in segments:
+                if classified and seg.start_time - classified[-1].end_time > merge_gap:
+                    results.extend(await self._merge_and_analyze(classified, fused_results, src))
+                    classified, fused_results = [], {}
+                more, fused = await self._classify_segments([seg])
+                classified.extend(more)
+                fused_results.update(fused)
+
+        with self.memory.running():
+            stream = engine.transcribe_stream(
+                str(src), follow=True, idle_seconds=self.config.watcher.stable_seconds
+            )
+            # 生成器内部阻塞等待文件增长与模型推理，放到线程里逐条取，避免卡住事件循环
+            while (utt := await asyncio.to_thread(next, stream, None)) is not None:
+                with self.memory.stage("segment"):
+                    closed = segmenter.feed([utt])
+                await _on_closed(closed)
+            await _on_closed(segmenter.flush())
+            if segmenter.late:
+                logger.warning(f"{len(segmenter.late)} 条迟到的 utterance 落在已闭合片段内，未归入片段")
+            if classified:
+                results.extend(await self._merge_and_analyze(classified, fused_results, src))
+
+            if not self.config.preview.enabled:
+                with self.memory.stage("archive"):
+                    self.archiver.archive_all(results, source_file=str(src.name))
+        self.last_stats.stage_peak_rss_mb = self.memory.peaks_mb()
+        self.last_stats.stage_peak_traced_mb = self.memory.traced_peaks_mb()
+        return results
+
+    def _stream_engine(self) -> Optional[ASREngine]:
+        # 录音仍在写入，内容无法作为缓存 key，直接使用被包装的引擎
+        engine = self.asr
+        while isinstance(engine, CachedASREngine):
+            engine = engine.engine
+        if hasattr(engine, "transcribe_stream"):
+            return engine
+        # 常驻 ASR 服务只提供整文件转写；配置为流式引擎时回退为本地加载
+        if self.config.asr.engine != "funasr-streaming":
+            return None
+        if self._stream_asr is None:
+            logger.info("ASR 服务不支持流式转写，本地加载流式引擎")
+            self._stream_asr = create_local_asr(self.config)
+        return self._stream_asr
+
+    async def _process(self, src: Path) -> list[AnalysisResult]:
         run_dir = (self.config.paths.processing / src.stem).resolve()
         chunks_dir = run_dir / "chunks"
         chunks_dir.mkdir(parents=True, exist_ok=True)
 
-        chunks = self.chunker.split(src, chunks_dir)
+        # 预计整段读入会超出内存预算时，改用流式切分（chunk 直接落盘）。
+        low_memory = self.memory.budget_bytes is not None and self.memory.would_exceed(
+            self.chunker.estimate_memory(src)
+        )
+        self.last_stats.low_memory_chunking = low_memory
+        with self.memory.stage("chunk"):
+            if low_memory:
+                chunks = self.chunker.split(src, chunks_dir, low_memory=True)
+            else:
+                chunks = self.chunker.split(src, chunks_dir)
 
         all_results: list[AnalysisResult] = []
-        for chunk in chunks:
-            utterances = self.asr.transcribe(str(chunk.path))
+        # 多个 chunk 已就绪时合并为一次 ASR 调用，让引擎跨 chunk 批处理。
+        # 多进程 ASR 需要一次拿到至少 workers 个 chunk 才能让所有 worker 同时工作。
+        per_call = max(1, self.config.asr.chunks_per_call, self.config.asr.workers)
+        pending: list[tuple[str, list[Utterance]]] = []
+        for i in range(0, len(chunks), per_call):
+            paths = [str(c.path) for c in chunks[i : i + per_call]]
+            with self.memory.stage("asr"):
+                transcripts = self._transcribe_group(paths, src)
+            if transcripts is None:
+                continue
+            if self.diarizer is not None:
+                pending.extend(zip(paths, transcripts))
+                continue
+            for utterances in transcripts:
+                all_results.extend(await self._process_transcript(utterances, src))
+
+        if self.diarizer is not None:
+            with self.memory.stage("diarize"):
+                relabeled = self.diarizer.diarize(pending)
+            self.last_stats.diarization_regions = self.diarizer.last_regions
+            self.last_stats.diarization_speakers = self.diarizer.last_speakers
+            for utterances in relabeled:
+                all_results.extend(await self._process_transcript(utterances, src))
+
+        # Phase 1：自动本地归档
+        if not self.config.preview.enabled:
+            with self.memory.stage("archive"):
+                self.archiver.archive_all(all_results, source_file=str(src.name))
+        return all_results
+
+    def _transcribe_group(self, paths: list[str], src: Path) -> Optional[list[list[Utterance]]]:
+        """转写一组 chunk 并记录逐 chunk 遥测；worker 超时/崩溃时返回 None。"""
+
+        cache = self.asr if isinstance(self.asr, CachedASREngine) else None
+        hits_before = cache.hits if cache else 0
+        t0 = time.perf_counter()
+        try:
+            if len(paths) == 1:
+                transcripts = [self.asr.transcribe(paths[0])]
+            else:
+                transcripts = self.asr.transcribe_many(paths)
+        except ASRWorkerError as e:
+            # 单个坏文件不阻塞整天：跳过该 chunk，继续处理其余部分
+            logger.error(f"跳过 ASR 失败的 chunk: {e}")
+            self.last_stats.asr_failed_chunks += len(paths)
+            return None
+
+        self._asr_metrics.extend(
+            group_metrics(
+                paths,
+                transcripts,
+                wall_s=time.perf_counter() - t0,
+                diarization=_diarization_status(self.asr),
+                device=self.config.asr.device,
+                engine=self.config.asr.engine,
+                cached=cache is not None and cache.hits - hits_before == len(paths),
+                source=src.name,
+            )
+        )
+        return transcripts
+
+    async def _process_transcript(
+        self, utterances: list[Utterance], src: Path
+    ) -> list[AnalysisResult]:
+        """单个 chunk 的 utterances → 分段 → 分类 → 合并 → 分析。"""
+
+        with self.memory.stage("segment"):
             # 归档侧需要知道原始音频文件名；不要传 chunk 文件名。
             segments = self.segmenter.segment(utterances, source_file=str(src.name))
 
-            classified: list[ClassifiedSegment] = []
+        classified, fused_results = await self._classify_segments(segments)
+        return await self._merge_and_analyze(classified, fused_results, src)
+
+    async def _classify_segments(
+        self, segments: list[Segment]
+    ) -> tuple[list[ClassifiedSegment], dict[str, AnalysisResult]]:
+        """分类；fused 模式下同时得到分析结果（按 segment id 索引）。"""
+
+        classified: list[ClassifiedSegment] = []
+        fused_results: dict[str, AnalysisResult] = {}
+        with self.memory.stage("classify"):
+            if self.fused_classifier is None:
+                return await self._classify(segments), fused_results
             for seg in segments:
-                classified.append(await self.classifier.classify(seg))
+                cseg, res = await self.fused_classifier.classify_and_analyze(seg)
+                self.last_stats.fused_calls += 1
+                if res is not None:
+                    fused_results[cseg.id] = res
+                classified.append(cseg)
+        return classified, fused_results
+
+    async def _classify(self, segments: list[Segment]) -> list[ClassifiedSegment]:
+        clf = self.classifier
+        cache = getattr(clf, "cache", None)
+        hits, misses = (cache.hits, cache.misses) if cache is not None else (0, 0)
+        fallbacks = getattr(clf, "batch_fallbacks", 0)
+        counters = ("checked", "decided", "compared", "agreed")
+        before = {name: getattr(clf, name, 0) for name in counters}
+        try:
+            if getattr(clf, "batch_size", 1) > 1 and len(segments) > 1:
+                return await clf.classify_many(segments)
+            return [await clf.classify(seg) for seg in segments]
+        finally:
+            if cache is not None:
+                self.last_stats.classifier_cache_hits += cache.hits - hits
+                self.last_stats.classifier_cache_misses += cache.misses - misses
+            self.last_stats.classifier_batch_fallbacks += (
+                getattr(clf, "batch_fallbacks", 0) - fallbacks
+            )
+            stats = self.last_stats
+            for name in counters:
+                field = f"heuristic_{name}"
+                setattr(stats, field, getattr(stats, field) + getattr(clf, name, 0) - before[name])
 
-            # 合并 (新增)
+    async def _merge_and_analyze(
+        self,
+        classified: list[ClassifiedSegment],
+        fused_results: dict[str, AnalysisResult],
+        src: Path,
+    ) -> list[AnalysisResult]:
+        # 合并 (新增)
+        with self.memory.stage("merge"):
             if self.config.merger.enabled:
                 merged_segments = self.merger.merge(classified)
             else:
                 merged_segments = classified
 
+        # deferred 中的片段只做 preview 归档，深度分析入队延后执行。
+        chunk_results: list[AnalysisResult] = []
+        deferred: dict[str, ClassifiedSegment | MergedSegment] = {}
+        with self.memory.stage("analyze"):
             for seg in merged_segments:
-                if seg.scene == SceneType.MEETING:
-                    res = await self.meeting_analyzer.analyze(seg)
-                else:
-                    res = await self.passthrough_analyzer.analyze(seg)
-                all_results.append(res)
+                # fused 结果按原始 segment id 命中；合并后的片段 id 不同，需重新分析。
+                res = fused_results.get(seg.id)
+                if res is None:
+                    if self.config.preview.enabled and self._needs_llm_analysis(seg):
+                        res = await self.passthrough_analyzer.analyze(seg)
+                        deferred[seg.id] = seg
+                    else:
+                        # 只统计本轮实际重新分析的合并片段；preview 延后的不计
+                        if isinstance(seg, MergedSegment) and self.fused_classifier is not None:
+                            self.last_stats.fused_reanalyzed += 1
+                        res = await self._analyze(seg)
+                chunk_results.append(res)
 
-        # Phase 1：自动本地归档
-        self.archiver.archive_all(all_results, source_file=str(src.name))
-        return all_results
+        if self.config.preview.enabled:
+            # preview 模式逐 chunk 立即归档，可搜索时间缩短到 ASR 完成时。
+            with self.memory.stage("archive"):
+                self._archive_preview(chunk_results, deferred, source_file=str(src.name))
+        return chunk_results
+
+    def _archive_preview(
+        self,
+        results: list[AnalysisResult],
+        deferred: dict[str, ClassifiedSegment | MergedSegment],
+        *,
+        source_file: str,
+    ) -> None:
+        for res in results:
+            seg = deferred.get(res.segment_id)
+            if seg is None:
+                self.archiver.archive(res, source_file=source_file)
+                continue
+            entry = self.archiver.archive(res, source_file=source_file, tier="preview")
+            self.deep_queue.push(DeepAnalysisJob(entry_id=entry.id, segment=seg))
+            self.last_stats.preview_archived += 1
+            self.last_stats.deep_queued += 1
+
+    async def run_deep_queue(self, limit: Optional[int] = None) -> list[ArchiveEntry]:
+        """消费深度分析队列，并把对应 preview 归档原地升级为 final。
+
+        已完成的任务在结束时（包括中途抛出异常时）一次性出队，不再每条重写队列文件；
+        进程被强杀时至多重复执行一遍升级，结果相同。归档条目已不存在的任务直接丢弃。
+        """
+
+        jobs = self.deep_queue.pending()
+        if limit is not None:
+            jobs = jobs[:limit]
+
+        upgraded: list[ArchiveEntry] = []
+        done: list[str] = []
+        try:
+            for job in jobs:
+                res = await self._analyze(job.segment)
+                try:
+                    upgraded.append(self.archiver.upgrade(job.entry_id, res))
+                except KeyError as e:
+                    logger.warning(f"深度分析任务对应的归档不存在，丢弃: {e}")
+                done.append(job.entry_id)
+        finally:
+            self.deep_queue.remove_many(done)
+        return upgraded
+
+    def _needs_llm_analysis(self, seg: ClassifiedSegment | MergedSegment) -> bool:
+        """与 _analyze 的路由保持一致：哪些片段会触发 LLM 深度分析。"""
+
+        if seg.scene == SceneType.MEETING:
+            return True
+        return seg.scene == SceneType.CHAT and self.value_detector is not None
+
+    async def _analyze(self, seg: ClassifiedSegment | MergedSegment) -> AnalysisResult:
+        if seg.scene == SceneType.MEETING:
+            return await self.meeting_analyzer.analyze(seg)
+        if seg.scene == SceneType.CHAT and self.value_detector is not None:
+            return await self._analyze_chat(seg)
+        return await self.passthrough_analyzer.analyze(seg)
+
+    async def _analyze_chat(self, seg: ClassifiedSegment | MergedSegment) -> AnalysisResult:
+        """先做低成本价值预筛，只有高价值 chat 才发送完整转写。"""
+
+        detection = await self.value_detector.detect(seg)
+        seg = seg.model_copy(update={"value_tags": detection.value_tags})
+
+        stats = self.last_stats
+        stats.value_filter_checked += 1
+        stats.value_filter_tokens_spent += detection.tokens_spent
+
+        if detection.value_score >= self.config.value_filter.threshold:
+            stats.value_filter_passed += 1
+            res = await self.chat_analyzer.analyze(seg)
+        else:
+            stats.value_filter_tokens_saved += estimate_tokens(render_transcript(seg.utterances))
+            res = await self.passthrough_analyzer.analyze(seg)
+            res.value_level = "low"
+            res.metadata["value_filtered"] = True
+
+        res.metadata["prefilter_score"] = detection.value_score
+        return res
 
 
 def _default_asr(config: AppConfig) -> ASREngine:
-    if config.asr.engine == "mock":
+    engine: Optional[ASREngine] = None
+    if config.asr.use_server:
+        from audio_journal.asr.server import RemoteASREngine
+
+        remote = RemoteASREngine(config.asr.server_socket)
+        if remote.is_available():
+            engine = remote
+        else:
+            logger.warning(f"ASR 服务不可用（{config.asr.server_socket}），回退为本地加载模型")
+    if engine is None:
+        engine = create_local_asr(config)
+
+    cache = config.asr.cache
+    if cache.enabled:
+        engine = CachedASREngine(
+            engine,
+            cache.dir,
+            fingerprint=asr_config_fingerprint(effective_asr_config(config)),
+            max_bytes=int(cache.max_mb * 1024 * 1024),
+        )
+    return engine
+
+
+def _diarization_status(engine: object) -> dict:
+    # 缓存包装器的实际引擎在 .engine 上；子进程/远程引擎无法取得状态，记为 unknown
+    while isinstance(engine, CachedASREngine):
+        engine = engine.engine
+    status = getattr(engine, "last_diarization", None)
+    return status if isinstance(status, dict) else {}
+
+
+def _summarize_asr_metrics(records: list[ASRChunkMetrics], stats: RunStats) -> None:
+    measured = [r for r in records if not r.cached]
+    stats.asr_chunks = len(measured)
+    stats.asr_audio_s = round(sum(r.audio_s for r in measured), 3)
+    stats.asr_wall_s = round(sum(r.wall_s for r in measured), 3)
+    stats.asr_rtf_p95 = round(percentile([r.rtf for r in measured if r.audio_s > 0], 95), 4)
+    stats.asr_diarization_fallbacks = sum(r.diarization == "fallback" for r in measured)
+
+
+def effective_asr_config(config: AppConfig) -> ASRConfig:
+    """启用日级说话人分离时，ASR 阶段不再加载 cam++。"""
+
+    if config.diarization.enabled and config.asr.enable_speaker_diarization:
+        return config.asr.model_copy(update={"enable_speaker_diarization": False})
+    return config.asr
+
+
+def create_local_asr(config: AppConfig) -> ASREngine:
+    """在当前进程内构建 ASR 引擎（asr-server 也用它加载常驻模型）。"""
+
+    asr_config = effective_asr_config(config)
+    supervisor = asr_config.supervisor
+    # 进程池与流式引擎自行管理进程/增量输出，不再套一层监管子进程
+    if supervisor.enabled and asr_config.workers <= 1 and asr_config.engine != "funasr-streaming":
+        from audio_journal.asr.supervisor import SupervisedASREngine
+
+        return SupervisedASREngine(
+            functools.partial(_build_local_asr, asr_config),
+            deadline_factor=supervisor.deadline_factor,
+            min_deadline_s=supervisor.min_deadline_s,
+            load_timeout_s=supervisor.load_timeout_s,
+            retries=supervisor.retries,
+        )
+    return _build_local_asr(asr_config)
+
+
+def _build_local_asr(asr_config: ASRConfig) -> ASREngine:
+    if asr_config.engine == "mock":
         fixture = Path(os.getenv("AUDIO_JOURNAL_MOCK_ASR_FIXTURE", ""))
         if not fixture.exists():
             raise RuntimeError("使用 mock ASR 时需要设置 AUDIO_JOURNAL_MOCK_ASR_FIXTURE")
         return MockASREngine(fixture)
-    elif config.asr.engine == "funasr":
+    elif asr_config.engine == "funasr":
         # 延迟导入，避免在 mock 模式下加载 FunASR 依赖
         try:
             from audio_journal.asr.funasr import FunASREngine
@@ -113,18 +567,106 @@ def _default_asr(config: AppConfig) -> ASREngine:
             raise RuntimeError(
                 "FunASR 引擎需要额外依赖。请运行: pip install funasr modelscope"
             ) from e
-        return FunASREngine(config.asr, model_dir=config.asr.model_dir)
+        if asr_config.workers > 1:
+            from audio_journal.asr.pool import ProcessPoolASREngine
+
+            return ProcessPoolASREngine(
+                functools.partial(FunASREngine, asr_config, model_dir=asr_config.model_dir),
+                workers=asr_config.workers,
+                threads_per_worker=asr_config.threads_per_worker,
+            )
+        return FunASREngine(asr_config, model_dir=asr_config.model_dir)
+    elif asr_config.engine == "funasr-streaming":
+        from audio_journal.asr.streaming import StreamingFunASREngine
+
+        return StreamingFunASREngine(asr_config, model_dir=asr_config.model_dir)
+    elif asr_config.engine == "funasr-onnx":
+        from audio_journal.asr.onnx import OnnxASREngine
+
+        return OnnxASREngine(asr_config, model_dir=asr_config.model_dir)
     else:
         raise NotImplementedError(
-            f"ASR engine '{config.asr.engine}' 未实现。支持的引擎: mock, funasr"
+            f"ASR engine '{asr_config.engine}' 未实现。"
+            "支持的引擎: mock, funasr, funasr-streaming, funasr-onnx"
         )
 
 
-def _default_classifier(config: AppConfig) -> SceneClassifier:
+def _default_diarizer(config: AppConfig) -> "GlobalDiarizer":
+    from audio_journal.diarization.global_diarizer import CamPPEmbedder, GlobalDiarizer
+
+    cfg = config.diarization
+    embedder = CamPPEmbedder(
+        config.asr.model_dir / config.asr.spk_model,
+        device=config.asr.device,
+        batch_size=cfg.batch_size,
+    )
+    return GlobalDiarizer(
+        embedder,
+        threshold=cfg.threshold,
+        min_region_s=cfg.min_region_s,
+        refine_iters=cfg.refine_iters,
+    )
+
+
+def _default_classifier(config: AppConfig) -> SceneClassifier | CascadeClassifier:
     llm = LLMFactory.create(config.llm, stage="classifier")
-    return SceneClassifier(prompt_path=config.paths.prompts / "classifier.txt", llm=llm)
+    batch_size = config.classifier.batch_size
+    cache_cfg = config.classifier.cache
+    cache = None
+    if cache_cfg.enabled:
+        cache = ClassificationCache(
+            cache_cfg.dir,
+            fingerprint=llm_fingerprint(llm),
+            ttl_s=cache_cfg.ttl_days * 86400,
+            max_entries=cache_cfg.max_entries,
+        )
+    classifier = SceneClassifier(
+        prompt_path=config.paths.prompts / "classifier.txt",
+        llm=llm,
+        cache=cache,
+        batch_prompt_path=(
+            config.paths.prompts / "classifier_batch.txt" if batch_size > 1 else None
+        ),
+        batch_size=batch_size,
+    )
+    heuristic = config.classifier.heuristic
+    if not heuristic.enabled:
+        return classifier
+    return CascadeClassifier(
+        HeuristicClassifier(),
+        classifier,
+        threshold=heuristic.threshold,
+        shadow=heuristic.shadow,
+    )
+
+
+def _default_fused_classifier(
+    config: AppConfig, meeting_analyzer: MeetingAnalyzer
+) -> FusedClassifier:
+    # 与两段式保持一致：只有 meeting 做深度分析，其余场景仍走原路由。
+    llm = LLMFactory.create(config.llm, stage="analyzer")
+    return FusedClassifier(
+        prompt_path=config.paths.prompts / "fused.txt",
+        llm=llm,
+        analyzers={SceneType.MEETING: meeting_analyzer},
+    )
 
 
 def _default_meeting_analyzer(config: AppConfig) -> MeetingAnalyzer:
     llm = LLMFactory.create(config.llm, stage="analyzer")
     return MeetingAnalyzer(llm=llm, prompt_path=config.paths.prompts / "meeting.txt")
+
+
+def _default_chat_analyzer(config: AppConfig) -> ChatAnalyzer:
+    llm = LLMFactory.create(config.llm, stage="analyzer")
+    return ChatAnalyzer(llm=llm, prompt_path=config.paths.prompts / "chat.txt")
+
+
+def _default_value_detector(config: AppConfig) -> ValueDetector:
+    # 预筛是轻量分类任务，复用 classifier stage 的模型配置。
+    llm = LLMFactory.create(config.llm, stage="classifier")
+    return ValueDetector(
+        prompt_path=config.paths.prompts / "value_detector.txt",
+        llm=llm,
+        sample_token_budget=config.value_filter.sample_token_budget,
+    )
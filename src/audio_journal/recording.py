@@ -0,0 +1,25 @@
+"""录音文件名约定：录音笔按开始时间命名（YYYYMMDDHHMMSS.WAV）。"""
+
+from __future__ import annotations
+
+import re
+from datetime import datetime
+
+# 匹配 YYYYMMDDHHMMSS.WAV
+_FILENAME_RE = re.compile(
+    r"^(\d{4})(\d{2})(\d{2})(\d{2})(\d{2})(\d{2})\.wav$", re.IGNORECASE
+)
+
+
+def parse_recording_time(filename: str) -> datetime | None:
+    """从文件名解析录音时间戳，无法解析返回 None。"""
+    m = _FILENAME_RE.match(filename)
+    if not m:
+        return None
+    try:
+        return datetime(
+            int(m.group(1)), int(m.group(2)), int(m.group(3)),
+            int(m.group(4)), int(m.group(5)), int(m.group(6)),
+        )
+    except ValueError:
+        return None
@@ -1,10 +1,15 @@
 from __future__ import annotations
 
+import bisect
+import logging
 from pathlib import Path
+from typing import Iterable, Optional, Sequence
 
 from audio_journal.config import SegmenterConfig
 from audio_journal.models.schemas import Segment, Utterance
 
+logger = logging.getLogger(__name__)
+
 
 class SilenceSegmenter:
     """基于静音间隔与最大时长的分段器。"""
@@ -12,74 +17,151 @@ class SilenceSegmenter:
     def __init__(self, config: SegmenterConfig) -> None:
         self.config = config
 
+    def incremental(self, source_file: str) -> "IncrementalSegmenter":
+        """创建推送式分段器：边接收 utterance 边产出已闭合的片段。"""
+
+        return IncrementalSegmenter(self.config, source_file)
+
     def segment(self, utterances: list[Utterance], source_file: str) -> list[Segment]:
+        """对 utterance 列表分段；片段直接切片复用输入对象，不做复制。"""
+
         if not utterances:
             return []
-
-        ordered = sorted(utterances, key=lambda u: (u.start_time, u.end_time))
+        ordered = utterances
+        if any(
+            (a.start_time, a.end_time) > (b.start_time, b.end_time)
+            for a, b in zip(utterances, utterances[1:])
+        ):
+            ordered = sorted(utterances, key=lambda u: (u.start_time, u.end_time))
+        starts = [u.start_time for u in ordered]
+        ends = [u.end_time for u in ordered]
         segments: list[Segment] = []
-
-        cur_utts: list[Utterance] = []
-        cur_start = ordered[0].start_time
-        cur_end = ordered[0].end_time
-
-        def _flush() -> None:
-            nonlocal cur_utts, cur_start, cur_end
-            if not cur_utts:
-                return
-            duration = cur_end - cur_start
-            if duration < self.config.min_segment_duration:
-                cur_utts = []
-                return
-            seg_id = self._make_segment_id(source_file, cur_start, cur_end)
+        for lo, hi, start, end in self._spans(starts, ends):
             segments.append(
                 Segment(
-                    id=seg_id,
-                    utterances=cur_utts,
-                    start_time=cur_start,
-                    end_time=cur_end,
-                    duration=duration,
+                    id=self._make_segment_id(source_file, start, end),
+                    utterances=ordered[lo:hi],
+                    start_time=start,
+                    end_time=end,
+                    duration=end - start,
                     source_file=source_file,
                 )
             )
-            cur_utts = []
-
-        prev = None
-        for utt in ordered:
-            if prev is None:
-                cur_utts = [utt]
-                cur_start = utt.start_time
-                cur_end = utt.end_time
-                prev = utt
-                continue
+        return segments
 
-            gap = max(0.0, utt.start_time - prev.end_time)
-            # 规则 1：长静音分段。
-            if gap > self.config.min_silence_gap:
-                _flush()
-                cur_utts = [utt]
-                cur_start = utt.start_time
-                cur_end = utt.end_time
-                prev = utt
-                continue
+    def _spans(
+        self, starts: Sequence[float], ends: Sequence[float]
+    ) -> list[tuple[int, int, float, float]]:
+        """对已按 (start, end) 排序的列返回各片段的 (lo, hi, start_time, end_time)。
 
-            # 规则 2：超过最大时长则强制切分（在 utterance 边界）。
-            if (utt.end_time - cur_start) > self.config.max_segment_duration and cur_utts:
-                _flush()
-                cur_utts = [utt]
-                cur_start = utt.start_time
-                cur_end = utt.end_time
-                prev = utt
-                continue
+        下标区间为 [lo, hi)；时长不足 min_segment_duration 的片段已剔除。
+        """
 
-            cur_utts.append(utt)
-            cur_end = max(cur_end, utt.end_time)
-            prev = utt
+        n = len(starts)
+        if n == 0:
+            return []
 
-        _flush()
-        return segments
+        min_gap = self.config.min_silence_gap
+        max_dur = self.config.max_segment_duration
+        min_dur = self.config.min_segment_duration
+        out: list[tuple[int, int, float, float]] = []
+
+        lo = 0
+        cur_start = starts[0]
+        cur_end = ends[0]
+        for i in range(1, n):
+            # 规则 1：长静音分段；规则 2：超过最大时长则强制切分（在 utterance 边界）。
+            gap = starts[i] - ends[i - 1]
+            if gap > min_gap or ends[i] - cur_start > max_dur:
+                if cur_end - cur_start >= min_dur:
+                    out.append((lo, i, cur_start, cur_end))
+                lo = i
+                cur_start = starts[i]
+                cur_end = ends[i]
+                continue
+            if ends[i] > cur_end:
+                cur_end = ends[i]
+
+        if cur_end - cur_start >= min_dur:
+            out.append((lo, n, cur_start, cur_end))
+        return out
 
     @staticmethod
     def _make_segment_id(source_file: str, start: float, end: float) -> str:
         stem = Path(source_file).stem
         return f"{stem}-{start:.2f}-{end:.2f}"
+
+
+class IncrementalSegmenter:
+    """推送式分段：feed() 遇到长静音或最大时长边界即产出已闭合片段，flush() 收尾。
+
+    规则与 SilenceSegmenter.segment 相同；按时间顺序喂入时两者输出一致。
+    每批内部会先排序；跨批迟到的 utterance 若落在当前片段内则按时间插入；
+    早于当前片段起点的属于已闭合片段，不改动任何片段，收集到 late 中由调用方处理。
+    """
+
+    def __init__(self, config: SegmenterConfig, source_file: str) -> None:
+        self.config = config
+        self.source_file = source_file
+        self.late: list[Utterance] = []
+        self._utts: list[Utterance] = []
+        self._start = 0.0
+        self._end = 0.0
+        self._prev_end = 0.0
+
+    def feed(self, utterances: Iterable[Utterance]) -> list[Segment]:
+        closed: list[Segment] = []
+        for utt in sorted(utterances, key=lambda u: (u.start_time, u.end_time)):
+            if not self._utts:
+                self._open(utt)
+                continue
+            if utt.start_time < self._start:
+                # 属于已闭合的片段：并入当前片段会篡改其时间范围
+                logger.warning(f"迟到的 utterance（{utt.start_time:.2f}s）落在已闭合片段内")
+                self.late.append(utt)
+                continue
+            if utt.start_time < self._utts[-1].start_time:
+                # 迟到但仍在当前片段内：按时间插入，保持 utterances 有序
+                logger.warning(f"迟到的 utterance（{utt.start_time:.2f}s）并入当前片段")
+                bisect.insort(self._utts, utt, key=lambda u: u.start_time)
+                self._end = max(self._end, utt.end_time)
+                self._prev_end = max(self._prev_end, utt.end_time)
+                continue
+            gap = utt.start_time - self._prev_end
+            if (
+                gap > self.config.min_silence_gap
+                or utt.end_time - self._start > self.config.max_segment_duration
+            ):
+                seg = self._close()
+                if seg is not None:
+                    closed.append(seg)
+                self._open(utt)
+                continue
+            self._utts.append(utt)
+            self._end = max(self._end, utt.end_time)
+            self._prev_end = utt.end_time
+        return closed
+
+    def flush(self) -> list[Segment]:
+        seg = self._close()
+        return [seg] if seg is not None else []
+
+    def _open(self, utt: Utterance) -> None:
+        self._utts = [utt]
+        self._start = utt.start_time
+        self._end = utt.end_time
+        self._prev_end = utt.end_time
+
+    def _close(self) -> Optional[Segment]:
+        utts, self._utts = self._utts, []
+        duration = self._end - self._start
+        if not utts or duration < self.config.min_segment_duration:
+            return None
+        return Segment(
+            id=SilenceSegmenter._make_segment_id(self.source_file, self._start, self._end),
+            utterances=utts,
+            start_time=self._start,
+            end_time=self._end,
+            duration=duration,
+            source_file=self.source_file,
+        )
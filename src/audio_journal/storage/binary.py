@@ -0,0 +1,298 @@
+"""转写中间结果的紧凑二进制格式（.ajt）。
+
+ASR utterance、分段与分类结果在重跑、缓存、断点续跑时需要落盘。逐条 JSON 要为每条
+utterance 重复写字段名与说话人，读回时还要逐个解析数字与字符串再过 pydantic 校验。
+这里直接序列化 UtteranceTable 的列：
+
+    头部   magic "AJTB" | u16 版本 | u8 类型（1=表，2=片段）| u8 标志 | u32 正文 CRC32
+    正文   u32 行数 | u32 说话人数 | 说话人 (id, label)
+           f64[n] starts | f64[n] ends | i32[n] speaker_idx | i64[n+1] offsets
+           u64 字节数 | UTF-8 文本
+    片段   （类型 2）u32 片段数，每个片段记录 [lo, hi) 行区间与元数据
+
+数值均为小端；字符串为 u32 长度前缀的 UTF-8（长度 0xFFFFFFFF 表示 None）。
+标志位 0 表示正文经过 zlib 压缩。读取时数组用 frombytes 整块载入，文本整块解码一次。
+格式变化时递增 FORMAT_VERSION；读到不认识的版本抛 FormatError，由调用方回退重算。
+"""
+from __future__ import annotations
+
+import os
+import struct
+import sys
+import zlib
+from array import array
+from pathlib import Path
+from typing import Sequence
+
+from audio_journal.models.schemas import (
+    ClassifiedSegment,
+    MergedSegment,
+    SceneType,
+    Segment,
+    Speaker,
+)
+from audio_journal.models.utterance_table import UtteranceTable
+
+MAGIC = b"AJTB"
+FORMAT_VERSION = 1
+
+KIND_TABLE = 1
+KIND_SEGMENTS = 2
+
+_FLAG_ZLIB = 0x01
+
+_HEADER = struct.Struct("<4sHBBI")
+_NONE = 0xFFFFFFFF
+
+# 片段记录的类型字节
+_SEG_PLAIN = 0
+_SEG_CLASSIFIED = 1
+_SEG_MERGED = 2
+
+_SEG_FIXED = struct.Struct("<BIIddd")
+
+
+class FormatError(ValueError):
+    """数据不是可识别的 .ajt 内容（magic/版本/校验和不符或被截断）。"""
+
+
+def dumps_table(table: UtteranceTable, *, compress: bool = False) -> bytes:
+    out = bytearray()
+    _write_table(out, table)
+    return _frame(KIND_TABLE, out, compress)
+
+
+def loads_table(data: bytes) -> UtteranceTable:
+    reader = _Reader(_unframe(data, KIND_TABLE))
+    table = _read_table(reader)
+    reader.expect_end()
+    return table
+
+
+def dumps_segments(
+    segments: Sequence[Segment | ClassifiedSegment | MergedSegment], *, compress: bool = False
+) -> bytes:
+    """把片段（含分类/合并元数据）连同其 utterance 写成一个表 + 片段记录。"""
+
+    rows = []
+    bounds: list[tuple[int, int]] = []
+    for seg in segments:
+        lo = len(rows)
+        rows.extend(seg.utterances)
+        bounds.append((lo, len(rows)))
+
+    out = bytearray()
+    _write_table(out, UtteranceTable.from_utterances(rows))
+    out += struct.pack("<I", len(segments))
+    for seg, (lo, hi) in zip(segments, bounds):
+        _write_segment(out, seg, lo, hi)
+    return _frame(KIND_SEGMENTS, out, compress)
+
+
+def loads_segments(data: bytes) -> list[Segment | ClassifiedSegment | MergedSegment]:
+    reader = _Reader(_unframe(data, KIND_SEGMENTS))
+    table = _read_table(reader)
+    (count,) = reader.unpack(struct.Struct("<I"))
+    segments = [_read_segment(reader, table) for _ in range(count)]
+    reader.expect_end()
+    return segments
+
+
+def write_bytes_atomic(path: str | Path, data: bytes) -> None:
+    """先写临时文件再替换，避免读到写了一半的缓存/断点文件。"""
+
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(path.name + ".tmp")
+    tmp.write_bytes(data)
+    os.replace(tmp, path)
+
+
+def _frame(kind: int, body: bytearray, compress: bool) -> bytes:
+    flags = 0
+    payload = bytes(body)
+    if compress:
+        payload = zlib.compress(payload, 6)
+        flags |= _FLAG_ZLIB
+    header = _HEADER.pack(MAGIC, FORMAT_VERSION, kind, flags, zlib.crc32(payload))
+    return header + payload
+
+
+def _unframe(data: bytes, kind: int) -> memoryview:
+    if len(data) < _HEADER.size:
+        raise FormatError("数据过短，缺少文件头")
+    magic, version, got_kind, flags, crc = _HEADER.unpack_from(data)
+    if magic != MAGIC:
+        raise FormatError(f"magic 不符: {magic!r}")
+    if version != FORMAT_VERSION:
+        raise FormatError(f"不支持的格式版本: {version}（当前 {FORMAT_VERSION}）")
+    if got_kind != kind:
+        raise FormatError(f"内容类型不符: {got_kind}（期望 {kind}）")
+    payload = memoryview(data)[_HEADER.size :]
+    if zlib.crc32(payload) != crc:
+        raise FormatError("CRC32 校验失败")
+    if flags & _FLAG_ZLIB:
+        try:
+            return memoryview(zlib.decompress(payload))
+        except zlib.error as e:
+            raise FormatError(f"解压失败: {e}") from e
+    return payload
+
+
+def _write_table(out: bytearray, table: UtteranceTable) -> None:
+    n = len(table)
+    out += struct.pack("<II", n, len(table.speakers))
+    for spk in table.speakers:
+        _write_str(out, spk.id)
+        _write_str(out, spk.label)
+    # 表内 offsets 按字符计；文本整体编码后读取端再整体解码，下标无需换算
+    out += _le(array("d", table.starts))
+    out += _le(array("d", table.ends))
+    out += _le(array("i", table.speaker_idx))
+    out += _le(array("q", table.offsets))
+    text = table.buffer.encode("utf-8")
+    out += struct.pack("<Q", len(text))
+    out += text
+
+
+def _read_table(reader: "_Reader") -> UtteranceTable:
+    n, n_speakers = reader.unpack(struct.Struct("<II"))
+    speakers = []
+    for _ in range(n_speakers):
+        spk_id = reader.read_str()
+        label = reader.read_str()
+        if spk_id is None:
+            raise FormatError("说话人 id 为空")
+        speakers.append(Speaker(id=spk_id, label=label))
+    starts = reader.read_array("d", n)
+    ends = reader.read_array("d", n)
+    speaker_idx = reader.read_array("i", n)
+    offsets = reader.read_array("q", n + 1)
+    (size,) = reader.unpack(struct.Struct("<Q"))
+    try:
+        text = str(reader.take(size), "utf-8")
+    except UnicodeDecodeError as e:
+        raise FormatError(f"文本不是合法 UTF-8: {e}") from e
+    if n and (offsets[-1] != len(text) or max(speaker_idx) >= n_speakers):
+        raise FormatError("offsets 或 speaker_idx 越界")
+    return UtteranceTable(starts, ends, speaker_idx, speakers, offsets, text)
+
+
+def _write_segment(out: bytearray, seg: Segment | MergedSegment, lo: int, hi: int) -> None:
+    if isinstance(seg, MergedSegment):
+        kind = _SEG_MERGED
+    elif isinstance(seg, ClassifiedSegment):
+        kind = _SEG_CLASSIFIED
+    else:
+        kind = _SEG_PLAIN
+    out += _SEG_FIXED.pack(kind, lo, hi, seg.start_time, seg.end_time, seg.duration)
+    _write_str(out, seg.id)
+    _write_str(out, seg.source_file)
+    if kind == _SEG_PLAIN:
+        return
+    _write_str(out, SceneType(seg.scene).value)
+    out += struct.pack("<d", seg.confidence)
+    _write_strs(out, seg.value_tags)
+    if kind == _SEG_MERGED:
+        _write_strs(out, seg.original_segment_ids)
+        out += struct.pack("<I", len(seg.gap_durations))
+        out += _le(array("d", seg.gap_durations))
+
+
+def _read_segment(
+    reader: "_Reader", table: UtteranceTable
+) -> Segment | ClassifiedSegment | MergedSegment:
+    kind, lo, hi, start, end, duration = reader.unpack(_SEG_FIXED)
+    if not lo <= hi <= len(table):
+        raise FormatError(f"片段行区间越界: [{lo}, {hi})")
+    fields = {
+        "id": reader.read_str(),
+        "utterances": table.to_utterances(lo, hi),
+        "start_time": start,
+        "end_time": end,
+        "duration": duration,
+        "source_file": reader.read_str(),
+    }
+    # 片段元数据写出前已校验过，读回时用 model_construct 跳过校验；
+    # utterances 已由 to_utterances 经构造函数校验生成
+    if kind == _SEG_PLAIN:
+        return Segment.model_construct(**fields)
+    if kind not in (_SEG_CLASSIFIED, _SEG_MERGED):
+        raise FormatError(f"未知片段类型: {kind}")
+    try:
+        fields["scene"] = SceneType(reader.read_str())
+    except ValueError as e:
+        raise FormatError(str(e)) from e
+    (fields["confidence"],) = reader.unpack(struct.Struct("<d"))
+    fields["value_tags"] = reader.read_strs()
+    if kind == _SEG_CLASSIFIED:
+        return ClassifiedSegment.model_construct(**fields)
+    fields["original_segment_ids"] = reader.read_strs()
+    (n_gaps,) = reader.unpack(struct.Struct("<I"))
+    fields["gap_durations"] = reader.read_array("d", n_gaps).tolist()
+    return MergedSegment.model_construct(**fields)
+
+
+def _write_str(out: bytearray, value: str | None) -> None:
+    if value is None:
+        out += struct.pack("<I", _NONE)
+        return
+    raw = value.encode("utf-8")
+    out += struct.pack("<I", len(raw))
+    out += raw
+
+
+def _write_strs(out: bytearray, values: list[str]) -> None:
+    out += struct.pack("<I", len(values))
+    for v in values:
+        _write_str(out, v)
+
+
+def _le(arr: array) -> bytes:
+    if sys.byteorder == "big":
+        arr = array(arr.typecode, arr)
+        arr.byteswap()
+    return arr.tobytes()
+
+
+class _Reader:
+    """在 memoryview 上顺序读取；越界统一抛 FormatError。"""
+
+    def __init__(self, data: memoryview) -> None:
+        self.data = data
+        self.pos = 0
+
+    def take(self, size: int) -> memoryview:
+        end = self.pos + size
+        if end > len(self.data):
+            raise FormatError("数据被截断")
+        view = self.data[self.pos : end]
+        self.pos = end
+        return view
+
+    def unpack(self, fmt: struct.Struct) -> tuple:
+        return fmt.unpack(self.take(fmt.size))
+
+    def read_array(self, typecode: str, count: int) -> array:
+        arr = array(typecode)
+        arr.frombytes(self.take(count * arr.itemsize))
+        if sys.byteorder == "big":
+            arr.byteswap()
+        return arr
+
+    def read_str(self) -> str | None:
+        (size,) = self.unpack(struct.Struct("<I"))
+        if size == _NONE:
+            return None
+        try:
+            return str(self.take(size), "utf-8")
+        except UnicodeDecodeError as e:
+            raise FormatError(f"字符串不是合法 UTF-8: {e}") from e
+
+    def read_strs(self) -> list[str]:
+        (count,) = self.unpack(struct.Struct("<I"))
+        return [s or "" for s in (self.read_str() for _ in range(count))]
+
+    def expect_end(self) -> None:
+        if self.pos != len(self.data):
+            raise FormatError(f"末尾有 {len(self.data) - self.pos} 字节多余数据")
@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+import fcntl
+import json
+import os
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterable, Iterator
+
+from pydantic import BaseModel, Field
+
+from audio_journal.models.schemas import ClassifiedSegment, MergedSegment
+
+
+class DeepAnalysisJob(BaseModel):
+    """待执行的深度分析任务：指向一条 preview 归档及其片段。"""
+
+    entry_id: str
+    # MergedSegment 字段更多，需先尝试；否则会被 ClassifiedSegment 吞掉合并元数据。
+    segment: MergedSegment | ClassifiedSegment = Field(union_mode="left_to_right")
+
+
+class JSONLDeepAnalysisQueue:
+    """基于 JSONL 文件的深度分析队列。
+
+    preview 归档时入队，由 `audio-journal deep` 在空闲/低价时段消费。
+    文件即队列，进程重启后任务不会丢失。
+
+    入队（pipeline 进程）与出队（deep 命令）可能并发：写操作都持有旁路 .lock 文件上的
+    排他锁。出队会原子替换队列文件，因此锁不能加在队列文件本身上。
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        self.path = Path(path)
+        self.lock_path = self.path.with_name(self.path.name + ".lock")
+
+    def push(self, job: DeepAnalysisJob) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self._locked(), self.path.open("a", encoding="utf-8") as f:
+            f.write(json.dumps(job.model_dump(mode="json"), ensure_ascii=False) + "\n")
+
+    def pending(self) -> list[DeepAnalysisJob]:
+        if not self.path.exists():
+            return []
+        out: list[DeepAnalysisJob] = []
+        for line in self.path.read_text(encoding="utf-8").splitlines():
+            line = line.strip()
+            if not line:
+                continue
+            out.append(DeepAnalysisJob.model_validate_json(line))
+        return out
+
+    def remove(self, entry_id: str) -> None:
+        self.remove_many([entry_id])
+
+    def remove_many(self, entry_ids: Iterable[str]) -> None:
+        """批量出队（整文件只重写一次，先写临时文件再原子替换）。"""
+
+        ids = set(entry_ids)
+        if not ids or not self.path.exists():
+            return
+        # 读取到替换全程持锁，否则期间追加的任务会随旧文件一起被覆盖
+        with self._locked():
+            remaining = [j for j in self.pending() if j.entry_id not in ids]
+            tmp = self.path.with_suffix(".jsonl.tmp")
+            with tmp.open("w", encoding="utf-8") as f:
+                for j in remaining:
+                    f.write(json.dumps(j.model_dump(mode="json"), ensure_ascii=False) + "\n")
+            os.replace(tmp, self.path)
+
+    def __len__(self) -> int:
+        return len(self.pending())
+
+    @contextmanager
+    def _locked(self) -> Iterator[None]:
+        with self.lock_path.open("a") as f:
+            fcntl.flock(f, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(f, fcntl.LOCK_UN)
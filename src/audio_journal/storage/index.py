@@ -1,8 +1,9 @@
 from __future__ import annotations
 
 import json
+import os
 from pathlib import Path
-from typing import Iterable, Optional
+from typing import Iterable, Literal, Optional
 
 from pydantic import BaseModel
 
@@ -18,6 +19,8 @@ class ArchiveEntry(BaseModel):
     archive_path: str
     source_file: str
     segment_id: str
+    # preview：仅含转写与分类，深度分析完成后原地升级为 final。
+    tier: Literal["preview", "final"] = "final"
 
 
 class JSONLArchiveIndex:
@@ -35,6 +38,21 @@ class JSONLArchiveIndex:
         with path.open("a", encoding="utf-8") as f:
             f.write(json.dumps(entry.model_dump(mode="json"), ensure_ascii=False) + "\n")
 
+    def replace(self, entry: ArchiveEntry) -> None:
+        """按 id 原地替换一条索引记录（整文件重写，先写临时文件再原子替换）。"""
+
+        path = self.index_path(entry.date)
+        entries = self._read_index(path)
+        if not any(e.id == entry.id for e in entries):
+            raise KeyError(f"索引中不存在: {entry.id}")
+
+        tmp = path.with_suffix(".jsonl.tmp")
+        with tmp.open("w", encoding="utf-8") as f:
+            for e in entries:
+                cur = entry if e.id == entry.id else e
+                f.write(json.dumps(cur.model_dump(mode="json"), ensure_ascii=False) + "\n")
+        os.replace(tmp, path)
+
     def list(
         self, *, date: Optional[str] = None, scene: Optional[SceneType] = None
     ) -> list[ArchiveEntry]:
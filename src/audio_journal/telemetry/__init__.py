@@ -0,0 +1 @@
+"""运行时遥测。"""
@@ -0,0 +1,32 @@
+"""ASR 准确率对比：以参考转写为基准计算字错误率（CER）。
+
+中文按字计算，忽略标点与空白；英文等同样按字符计算，作为 WER 的近似。
+供各 ASR 后端/VAD 方案的对比脚本共用。
+"""
+from __future__ import annotations
+
+import unicodedata
+
+
+def normalize_for_cer(text: str) -> str:
+    """去掉空白与标点，只保留参与比较的字符。"""
+
+    return "".join(
+        ch for ch in text if not ch.isspace() and not unicodedata.category(ch).startswith("P")
+    )
+
+
+def edit_distance(ref: str, hyp: str) -> int:
+    prev = list(range(len(hyp) + 1))
+    for i, r in enumerate(ref, 1):
+        cur = [i] + [0] * len(hyp)
+        for j, h in enumerate(hyp, 1):
+            cur[j] = min(prev[j] + 1, cur[j - 1] + 1, prev[j - 1] + (r != h))
+        prev = cur
+    return prev[-1]
+
+
+def char_error_rate(ref: str, hyp: str) -> float:
+    """ref/hyp 需先经 normalize_for_cer 处理；参考为空时按 1 个字计。"""
+
+    return edit_distance(ref, hyp) / max(1, len(ref))
@@ -0,0 +1,110 @@
+"""逐 chunk 的 ASR 遥测：音频时长、墙钟耗时、RTF、utterance 数、说话人分离状态。
+
+每次运行的记录追加写入 JSONL 指标文件（一行一个 chunk），便于跨版本对比 ASR 回归、
+按 RTF 估算机器容量；同时汇总进 RunStats 在命令行输出。
+"""
+from __future__ import annotations
+
+import json
+import math
+import time
+import wave
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Literal
+
+DiarizationStatus = Literal["ok", "fallback", "disabled", "unknown"]
+
+
+@dataclass
+class ASRChunkMetrics:
+    chunk: str
+    audio_s: float
+    wall_s: float
+    utterances: int
+    diarization: DiarizationStatus
+    device: str
+    engine: str
+    cached: bool = False  # 命中 ASR 结果缓存（不计入 RTF 汇总）
+    batch_size: int = 1  # 同一次调用转写的 chunk 数；>1 时 wall_s 按音频时长分摊
+    source: str = ""
+    ts: float = field(default_factory=time.time)
+
+    @property
+    def rtf(self) -> float:
+        return self.wall_s / self.audio_s if self.audio_s > 0 else 0.0
+
+    def to_dict(self) -> dict:
+        data = asdict(self)
+        data["rtf"] = round(self.rtf, 4)
+        return data
+
+
+class JSONLMetricsSink:
+    """追加写入 JSONL 的指标 sink。"""
+
+    def __init__(self, path: str | Path) -> None:
+        self.path = Path(path)
+
+    def emit(self, records: list[ASRChunkMetrics]) -> None:
+        if not records:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self.path.open("a", encoding="utf-8") as f:
+            for r in records:
+                f.write(json.dumps(r.to_dict(), ensure_ascii=False) + "\n")
+
+
+def group_metrics(
+    paths: list[str],
+    transcripts: list[list],
+    *,
+    wall_s: float,
+    diarization: dict[str, DiarizationStatus],
+    device: str,
+    engine: str,
+    cached: bool = False,
+    source: str = "",
+) -> list[ASRChunkMetrics]:
+    """把一次（可能是批量的）ASR 调用拆成逐 chunk 记录，墙钟耗时按音频时长分摊。"""
+
+    durations = [wav_duration_s(p) for p in paths]
+    total = sum(durations)
+    records = []
+    for path, utterances, audio_s in zip(paths, transcripts, durations):
+        share = audio_s / total if total > 0 else 1.0 / len(paths)
+        records.append(
+            ASRChunkMetrics(
+                chunk=Path(path).name,
+                audio_s=round(audio_s, 3),
+                wall_s=round(wall_s * share, 4),
+                utterances=len(utterances),
+                diarization=diarization.get(path, "unknown"),
+                device=device,
+                engine=engine,
+                cached=cached,
+                batch_size=len(paths),
+                source=source,
+            )
+        )
+    return records
+
+
+def percentile(values: list[float], q: float) -> float:
+    """最近秩法分位数；空列表返回 0。"""
+
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(1, math.ceil(q / 100 * len(ordered)))
+    return ordered[rank - 1]
+
+
+def wav_duration_s(audio_path: str | Path) -> float:
+    """WAV 时长（秒）；无法读取时返回 0。"""
+
+    try:
+        with wave.open(str(audio_path), "rb") as wf:
+            return wf.getnframes() / float(wf.getframerate())
+    except (wave.Error, EOFError, OSError):
+        return 0.0
@@ -0,0 +1,138 @@
+"""分阶段内存采样，以及 chunker 是否改为流式切分的 RSS 阈值判断。"""
+from __future__ import annotations
+
+import os
+import resource
+import sys
+import threading
+import tracemalloc
+from contextlib import contextmanager
+from typing import Iterator, Optional
+
+_MB = 1024 * 1024
+
+
+def current_rss_bytes() -> int:
+    """当前进程 RSS 字节数。
+
+    Linux 读 /proc/self/statm 得到实时值；其他平台没有无依赖的实时接口，
+    退化为 ru_maxrss（进程历史峰值），此时各阶段峰值只会单调不减。
+    """
+
+    try:
+        with open("/proc/self/statm", "rb") as f:
+            pages = int(f.read().split()[1])
+        return pages * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        maxrss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # macOS 单位为字节，Linux/BSD 为 KB。
+        return maxrss if sys.platform == "darwin" else maxrss * 1024
+
+
+class MemoryMonitor:
+    """按 pipeline 阶段记录 RSS（以及可选的 tracemalloc）峰值。
+
+    用法：
+
+        with monitor.running():
+            with monitor.stage("asr"):
+                ...
+
+    running() 期间后台线程按 sample_interval 采样 RSS 并记到当前阶段；
+    进入/离开阶段时也各采一次，保证很短的阶段也有数据。
+    未启用时所有方法都是空操作。
+    """
+
+    def __init__(
+        self,
+        *,
+        enabled: bool = False,
+        trace: bool = False,
+        sample_interval: float = 0.05,
+        budget_bytes: Optional[int] = None,
+    ) -> None:
+        self.enabled = enabled
+        self.trace = trace
+        self.sample_interval = sample_interval
+        self.budget_bytes = budget_bytes
+
+        self.peak_rss: dict[str, int] = {}
+        self.peak_traced: dict[str, int] = {}
+        self._current: Optional[str] = None
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    @contextmanager
+    def running(self) -> Iterator["MemoryMonitor"]:
+        if not self.enabled:
+            yield self
+            return
+
+        self.peak_rss = {}
+        self.peak_traced = {}
+        started_trace = False
+        if self.trace and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            started_trace = True
+
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._sample_loop, daemon=True)
+        self._thread.start()
+        try:
+            yield self
+        finally:
+            self._stop.set()
+            self._thread.join()
+            self._thread = None
+            if started_trace:
+                tracemalloc.stop()
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        if not self.enabled:
+            yield
+            return
+
+        with self._lock:
+            prev = self._current
+            self._current = name
+        if self.trace and tracemalloc.is_tracing():
+            tracemalloc.reset_peak()
+        self._sample()
+        try:
+            yield
+        finally:
+            self._sample()
+            if self.trace and tracemalloc.is_tracing():
+                traced_peak = tracemalloc.get_traced_memory()[1]
+                self.peak_traced[name] = max(self.peak_traced.get(name, 0), traced_peak)
+            with self._lock:
+                self._current = prev
+
+    def would_exceed(self, extra_bytes: int) -> bool:
+        """当前 RSS 再增加 extra_bytes 是否会超过预算；未设预算时恒为 False。
+
+        预算只用于决定 chunker 是否流式切分，不限制其他阶段的内存占用。
+        """
+
+        if self.budget_bytes is None:
+            return False
+        return current_rss_bytes() + extra_bytes > self.budget_bytes
+
+    def peaks_mb(self) -> dict[str, float]:
+        return {k: round(v / _MB, 1) for k, v in self.peak_rss.items()}
+
+    def traced_peaks_mb(self) -> dict[str, float]:
+        return {k: round(v / _MB, 1) for k, v in self.peak_traced.items()}
+
+    def _sample(self) -> None:
+        rss = current_rss_bytes()
+        with self._lock:
+            name = self._current
+            if name is not None and rss > self.peak_rss.get(name, 0):
+                self.peak_rss[name] = rss
+
+    def _sample_loop(self) -> None:
+        while not self._stop.wait(self.sample_interval):
+            self._sample()
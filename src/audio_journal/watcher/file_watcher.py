@@ -58,10 +58,13 @@ class AudioFileHandler(FileSystemEventHandler):
         patterns: Iterable[str],
         stable_seconds: float,
         on_audio_ready: Callable[[Path], None],
+        wait_for_stable: bool = True,
     ) -> None:
         self.patterns = list(patterns)
         self.stable_seconds = stable_seconds
         self.on_audio_ready = on_audio_ready
+        # 流式模式下由消费方自行跟随文件增长，出现即回调
+        self.wait_for_stable = wait_for_stable
 
     def on_created(self, event) -> None:  # type: ignore[override]
         if getattr(event, "is_directory", False):
@@ -71,17 +74,26 @@ class AudioFileHandler(FileSystemEventHandler):
         if p.suffix.lower() != ".wav":
             return
 
-        wait_stable(p, stable_seconds=self.stable_seconds)
+        if self.wait_for_stable:
+            wait_stable(p, stable_seconds=self.stable_seconds)
         self.on_audio_ready(p)
 
 
 class FileWatcher:
     """前台文件监听服务（Phase 1 MVP）。"""
 
-    def __init__(self, *, watch_dir: str | Path, patterns: Iterable[str], stable_seconds: float) -> None:
+    def __init__(
+        self,
+        *,
+        watch_dir: str | Path,
+        patterns: Iterable[str],
+        stable_seconds: float,
+        wait_for_stable: bool = True,
+    ) -> None:
         self.watch_dir = Path(watch_dir)
         self.patterns = list(patterns)
         self.stable_seconds = stable_seconds
+        self.wait_for_stable = wait_for_stable
 
     def start(self, on_audio_ready: Callable[[Path], None]) -> None:
         self.watch_dir.mkdir(parents=True, exist_ok=True)
@@ -90,6 +102,7 @@ class FileWatcher:
             patterns=self.patterns,
             stable_seconds=self.stable_seconds,
             on_audio_ready=on_audio_ready,
+            wait_for_stable=self.wait_for_stable,
         )
         observer.schedule(handler, str(self.watch_dir), recursive=False)
         observer.start()
@@ -73,3 +73,35 @@ def test_archiver_slugify_keeps_chinese_title(tmp_path: Path) -> None:
 
     p = Path(entry.archive_path)
     assert "中文标题-测试" in p.name
+
+
+def test_archiver_upgrade_rewrites_preview_in_place(tmp_path: Path) -> None:
+    archiver = LocalArchiver(base_dir=tmp_path)
+
+    preview = AnalysisResult(segment_id="seg-1", scene=SceneType.MEETING, raw_text="x")
+    entry = archiver.archive(
+        preview, archive_date="2026-02-27", source_file="a.wav", tier="preview"
+    )
+    assert entry.tier == "preview"
+    assert "tier: preview" in Path(entry.archive_path).read_text(encoding="utf-8")
+
+    deep = AnalysisResult(
+        segment_id="seg-1",
+        scene=SceneType.MEETING,
+        summary="深度摘要",
+        topics=["周会"],
+        raw_text="x",
+    )
+    upgraded = archiver.upgrade(entry.id, deep)
+
+    assert upgraded.id == entry.id
+    assert upgraded.archive_path == entry.archive_path
+    assert upgraded.tier == "final"
+    assert upgraded.title == "周会"
+    text = Path(entry.archive_path).read_text(encoding="utf-8")
+    assert "深度摘要" in text
+    assert "tier:" not in text
+
+    entries = archiver.index.list(date="2026-02-27")
+    assert len(entries) == 1
+    assert entries[0].tier == "final"
@@ -0,0 +1,249 @@
+from __future__ import annotations
+
+import os
+import wave
+from pathlib import Path
+
+from audio_journal.asr.base import ASREngine
+from audio_journal.asr.cache import CachedASREngine, asr_config_fingerprint
+from audio_journal.chunker.vad_chunker import write_speech_regions
+from audio_journal.config import ASRConfig, ASROnnxConfig, ASRStreamingConfig
+from audio_journal.models.schemas import Speaker, Utterance
+
+
+class _CountingASR(ASREngine):
+    def __init__(self) -> None:
+        self.calls: list[str] = []
+        self.batches: list[list[str]] = []
+
+    def transcribe(self, audio_path: str) -> list[Utterance]:
+        self.calls.append(Path(audio_path).name)
+        return [
+            Utterance(
+                speaker=Speaker(id="SPEAKER_01"),
+                text=f"转写 {Path(audio_path).stem}",
+                start_time=0.5,
+                end_time=1.25,
+            )
+        ]
+
+    def transcribe_many(self, audio_paths: list[str]) -> list[list[Utterance]]:
+        self.batches.append([Path(p).name for p in audio_paths])
+        return [self.transcribe(p) for p in audio_paths]
+
+
+def _write_wav(path: Path, frames: bytes) -> Path:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with wave.open(str(path), "wb") as wf:
+        wf.setnchannels(1)
+        wf.setsampwidth(2)
+        wf.setframerate(16000)
+        wf.writeframes(frames)
+    return path
+
+
+def _cached(inner: ASREngine, tmp_path: Path, **kwargs) -> CachedASREngine:
+    fingerprint = kwargs.pop("fingerprint", asr_config_fingerprint(ASRConfig()))
+    max_bytes = kwargs.pop("max_bytes", 1 << 20)
+    return CachedASREngine(
+        inner, tmp_path / "cache", fingerprint=fingerprint, max_bytes=max_bytes
+    )
+
+
+def test_cache_hit_is_keyed_by_pcm_content_not_path(tmp_path: Path) -> None:
+    inner = _CountingASR()
+    engine = _cached(inner, tmp_path)
+
+    a = _write_wav(tmp_path / "run1" / "chunk_001.wav", b"\x01\x00" * 1600)
+    b = _write_wav(tmp_path / "run2" / "chunk_001.wav", b"\x01\x00" * 1600)
+
+    first = engine.transcribe(str(a))
+    second = engine.transcribe(str(b))
+
+    assert inner.calls == ["chunk_001.wav"]
+    assert second == first
+    assert (engine.hits, engine.misses) == (1, 1)
+
+
+def test_cache_misses_on_different_audio_or_config(tmp_path: Path) -> None:
+    inner = _CountingASR()
+    a = _write_wav(tmp_path / "a.wav", b"\x01\x00" * 1600)
+    b = _write_wav(tmp_path / "b.wav", b"\x02\x00" * 1600)
+
+    engine = _cached(inner, tmp_path)
+    engine.transcribe(str(a))
+    engine.transcribe(str(b))
+
+    other = _cached(
+        inner, tmp_path, fingerprint=asr_config_fingerprint(ASRConfig(device="cpu"))
+    )
+    other.transcribe(str(a))
+
+    assert inner.calls == ["a.wav", "b.wav", "a.wav"]
+
+
+def test_fingerprint_covers_backend_specific_settings() -> None:
+    onnx = ASRConfig(engine="funasr-onnx")
+    streaming = ASRConfig(engine="funasr-streaming")
+
+    assert asr_config_fingerprint(onnx) != asr_config_fingerprint(
+        ASRConfig(engine="funasr-onnx", onnx=ASROnnxConfig(quantize=False))
+    )
+    assert asr_config_fingerprint(streaming) != asr_config_fingerprint(
+        ASRConfig(engine="funasr-streaming", streaming=ASRStreamingConfig(chunk_ms=480))
+    )
+    # 未使用的后端配置不影响指纹
+    assert asr_config_fingerprint(ASRConfig(engine="funasr")) == asr_config_fingerprint(
+        ASRConfig(engine="funasr", onnx=ASROnnxConfig(quantize=False))
+    )
+
+
+def test_cache_key_includes_speech_regions_sidecar(tmp_path: Path) -> None:
+    inner = _CountingASR()
+    engine = _cached(inner, tmp_path)
+    a = _write_wav(tmp_path / "run1" / "chunk_001.wav", b"\x01\x00" * 1600)
+    b = _write_wav(tmp_path / "run2" / "chunk_001.wav", b"\x01\x00" * 1600)
+    write_speech_regions(a, [(0.0, 0.1)])
+    write_speech_regions(b, [(0.0, 0.05)])
+
+    engine.transcribe(str(a))
+    engine.transcribe(str(b))
+    write_speech_regions(b, [(0.0, 0.1)])
+    engine.transcribe(str(b))
+
+    assert inner.calls == ["chunk_001.wav", "chunk_001.wav"]
+    assert (engine.hits, engine.misses) == (1, 2)
+
+
+class _FlakyASR(_CountingASR):
+    """missing 返回空结果（模拟批量结果缺失），degraded 标记说话人分离回退。"""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.last_diarization: dict[str, str] = {}
+
+    def transcribe(self, audio_path: str) -> list[Utterance]:
+        out = super().transcribe(audio_path)
+        stem = Path(audio_path).stem
+        self.last_diarization[audio_path] = "fallback" if stem == "degraded" else "ok"
+        return [] if stem == "missing" else out
+
+    def transcribe_many(self, audio_paths: list[str]) -> list[list[Utterance]]:
+        self.last_diarization = {}
+        return super().transcribe_many(audio_paths)
+
+
+def test_cache_skips_empty_and_degraded_results(tmp_path: Path) -> None:
+    inner = _FlakyASR()
+    engine = _cached(inner, tmp_path)
+    paths = [
+        str(_write_wav(tmp_path / f"{name}.wav", bytes([i + 1, 0]) * 1600))
+        for i, name in enumerate(("missing", "degraded", "ok"))
+    ]
+
+    engine.transcribe(paths[0])
+    engine.transcribe(paths[1])
+    engine.transcribe_many(paths)
+
+    # 只有正常结果被缓存；空结果与降级结果下次仍重新转写
+    assert inner.calls == ["missing.wav", "degraded.wav", "missing.wav", "degraded.wav", "ok.wav"]
+    assert len(list((tmp_path / "cache").glob("*/*.ajt"))) == 1
+    engine.transcribe(paths[2])
+    assert engine.hits == 1
+
+
+def test_cache_transcribe_many_only_sends_misses(tmp_path: Path) -> None:
+    inner = _CountingASR()
+    engine = _cached(inner, tmp_path)
+    paths = [
+        str(_write_wav(tmp_path / f"chunk_00{i}.wav", bytes([i, 0]) * 1600)) for i in (1, 2, 3)
+    ]
+
+    engine.transcribe(paths[1])
+    outputs = engine.transcribe_many(paths)
+
+    assert inner.batches == [["chunk_001.wav", "chunk_003.wav"]]
+    assert [u[0].text for u in outputs] == ["转写 chunk_001", "转写 chunk_002", "转写 chunk_003"]
+    assert (engine.hits, engine.misses) == (1, 3)
+
+
+def test_cache_evicts_least_recently_used(tmp_path: Path) -> None:
+    inner = _CountingASR()
+    paths = [_write_wav(tmp_path / f"c{i}.wav", bytes([i, 0]) * 1600) for i in range(3)]
+
+    engine = _cached(inner, tmp_path)
+    engine.transcribe(str(paths[0]))
+    entry_size = sum(p.stat().st_size for p in (tmp_path / "cache").glob("*/*.ajt"))
+
+    # 只容得下两条
+    engine = _cached(inner, tmp_path, max_bytes=entry_size * 2 + entry_size // 2)
+    engine.transcribe(str(paths[1]))
+    # 让 c0 比 c1 更近被使用
+    for i, p in enumerate(sorted((tmp_path / "cache").glob("*/*.ajt"))):
+        os.utime(p, (1000 + i, 1000 + i))
+    engine.transcribe(str(paths[0]))
+    engine.transcribe(str(paths[2]))
+
+    inner.calls.clear()
+    engine.transcribe(str(paths[0]))
+    engine.transcribe(str(paths[1]))
+
+    assert inner.calls == ["c1.wav"]
+
+
+def test_cache_evicts_to_low_water_mark_in_one_scan(tmp_path: Path) -> None:
+    inner = _CountingASR()
+    paths = [
+        str(_write_wav(tmp_path / f"c{i:02d}.wav", bytes([i + 1, 0]) * 1600)) for i in range(12)
+    ]
+    engine = _cached(inner, tmp_path)
+    engine.transcribe(paths[0])
+    entry_size = next((tmp_path / "cache").glob("*/*.ajt")).stat().st_size
+
+    engine = _cached(inner, tmp_path, max_bytes=entry_size * 10 + entry_size // 2)
+    for p in paths[1:10]:
+        engine.transcribe(p)
+    scans = 0
+    entries = engine._entries
+
+    def _counting_entries():
+        nonlocal scans
+        scans += 1
+        return entries()
+
+    engine._entries = _counting_entries
+    engine.transcribe(paths[10])
+    engine.transcribe(paths[11])
+
+    assert scans == 1
+    assert len(list((tmp_path / "cache").glob("*/*.ajt"))) == 10
+
+
+def test_cache_evicts_legacy_gzip_entries(tmp_path: Path) -> None:
+    inner = _CountingASR()
+    legacy = tmp_path / "cache" / "ab" / ("ab" + "0" * 62 + ".json.gz")
+    legacy.parent.mkdir(parents=True)
+    legacy.write_bytes(b"\x00" * 4096)
+    os.utime(legacy, (1000, 1000))
+
+    engine = _cached(inner, tmp_path, max_bytes=4096)
+    engine.transcribe(str(_write_wav(tmp_path / "a.wav", b"\x01\x00" * 1600)))
+
+    assert not legacy.exists()
+    assert len(list((tmp_path / "cache").glob("*/*.ajt"))) == 1
+
+
+def test_cache_ignores_corrupt_entry(tmp_path: Path) -> None:
+    inner = _CountingASR()
+    engine = _cached(inner, tmp_path)
+    audio = _write_wav(tmp_path / "a.wav", b"\x01\x00" * 1600)
+
+    engine.transcribe(str(audio))
+    entry = next((tmp_path / "cache").glob("*/*.ajt"))
+    entry.write_bytes(b"not a table")
+
+    out = engine.transcribe(str(audio))
+
+    assert out[0].text == "转写 a"
+    assert len(inner.calls) == 2
+
@@ -69,6 +69,26 @@ def test_funasr_engine_loads_model(
     assert call_kwargs["device"] == "cpu"
 
 
+@patch("funasr.AutoModel")
+def test_funasr_engine_loads_from_snapshot_cache(
+    mock_automodel: MagicMock, asr_config: ASRConfig, model_dir: Path
+) -> None:
+    """启用 model_snapshot 时通过快照缓存加载并记录加载耗时。"""
+    asr_config.model_snapshot = True
+    snapshot_model = MagicMock()
+
+    with patch(
+        "audio_journal.asr.snapshot.ModelSnapshotCache.load_or_build",
+        return_value=(snapshot_model, "snapshot", 0.25),
+    ) as load_or_build:
+        engine = FunASREngine(asr_config, model_dir=model_dir)
+
+    mock_automodel.assert_not_called()
+    assert load_or_build.call_args.args[0]["model"] == str(model_dir / "paraformer-zh")
+    assert engine._model is snapshot_model
+    assert (engine.load_source, engine.load_seconds) == ("snapshot", 0.25)
+
+
 @patch("funasr.AutoModel")
 def test_funasr_transcribe_with_speaker(
     mock_automodel: MagicMock, asr_config: ASRConfig, model_dir: Path
@@ -203,3 +223,206 @@ def test_funasr_real_model_integration(asr_config: ASRConfig, tmp_path: Path) ->
         assert utt.speaker.id.startswith("SPEAKER_")
         assert len(utt.text) > 0
         assert utt.end_time >= utt.start_time
+
+
+@patch("funasr.AutoModel")
+def test_funasr_transcribe_many_maps_results_by_key(
+    mock_automodel: MagicMock, asr_config: ASRConfig, model_dir: Path
+) -> None:
+    """测试批量转写按 key 将结果对应回各 chunk。"""
+    mock_model = MagicMock()
+    mock_automodel.return_value = mock_model
+
+    # FunASR 返回顺序不保证与输入一致时，按 key 对齐
+    mock_model.generate.return_value = [
+        {
+            "key": "chunk_002",
+            "text": "第二段。",
+            "timestamp": [[0, 500, "第二段"], [500, 600, "。"]],
+            "speaker": [],
+        },
+        {
+            "key": "chunk_001",
+            "text": "第一段。",
+            "timestamp": [[0, 500, "第一段"], [500, 600, "。"]],
+            "speaker": [],
+        },
+    ]
+
+    engine = FunASREngine(asr_config, model_dir=model_dir)
+    outputs = engine.transcribe_many(["/tmp/chunk_001.wav", "/tmp/chunk_002.wav"])
+
+    call_kwargs = mock_model.generate.call_args.kwargs
+    assert call_kwargs["input"] == ["/tmp/chunk_001.wav", "/tmp/chunk_002.wav"]
+    assert call_kwargs["batch_size"] == asr_config.batch_size
+    assert mock_model.generate.call_count == 1
+
+    assert len(outputs) == 2
+    assert outputs[0][0].text == "第一段。"
+    assert outputs[1][0].text == "第二段。"
+
+
+@patch("funasr.AutoModel")
+def test_funasr_transcribe_many_missing_result(
+    mock_automodel: MagicMock, asr_config: ASRConfig, model_dir: Path
+) -> None:
+    """测试批量结果缺失的 chunk 返回空列表。"""
+    mock_model = MagicMock()
+    mock_automodel.return_value = mock_model
+    mock_model.generate.return_value = [
+        {"key": "chunk_001", "text": "你好。", "timestamp": [[0, 500, "你好"], [500, 600, "。"]]},
+    ]
+
+    engine = FunASREngine(asr_config, model_dir=model_dir)
+    outputs = engine.transcribe_many(["chunk_001.wav", "chunk_002.wav"])
+
+    assert [len(u) for u in outputs] == [1, 0]
+
+
+@patch("funasr.AutoModel")
+def test_funasr_speaker_failure_falls_back_per_chunk(
+    mock_automodel: MagicMock, asr_config: ASRConfig, model_dir: Path
+) -> None:
+    """测试说话人分离失败只降级当前 chunk，不重新加载模型。"""
+    mock_model = MagicMock()
+    mock_model.spk_model = object()
+    mock_automodel.return_value = mock_model
+
+    ok = [{"text": "你好。", "timestamp": [[0, 500, "你好"], [500, 600, "。"]]}]
+    mock_model.generate.side_effect = [AssertionError("labels mismatch"), ok, ok]
+
+    engine = FunASREngine(asr_config, model_dir=model_dir)
+    engine.transcribe("/tmp/bad.wav")
+    engine.transcribe("/tmp/good.wav")
+
+    # 只加载过一次模型，主模型仍保留说话人分离
+    assert mock_automodel.call_count == 1
+    assert engine._model is mock_model
+    assert mock_model.spk_model is not None
+    assert engine._fallback_model.spk_model is None
+    assert mock_model.generate.call_count == 3
+
+
+@patch("funasr.AutoModel")
+def test_funasr_batch_speaker_failure_retries_individually(
+    mock_automodel: MagicMock, asr_config: ASRConfig, model_dir: Path
+) -> None:
+    """测试批量转写失败时逐个重试，只有失败的 chunk 走降级模型。"""
+    mock_model = MagicMock()
+    mock_model.spk_model = object()
+    mock_automodel.return_value = mock_model
+
+    def item(key: str) -> list[dict]:
+        return [{"key": key, "text": "好。", "timestamp": [[0, 500, "好"], [500, 600, "。"]]}]
+
+    mock_model.generate.side_effect = [
+        AssertionError("batch"),
+        item("chunk_001"),
+        AssertionError("chunk_002"),
+        item("chunk_002"),
+    ]
+
+    engine = FunASREngine(asr_config, model_dir=model_dir)
+    outputs = engine.transcribe_many(["chunk_001.wav", "chunk_002.wav"])
+
+    assert [len(u) for u in outputs] == [1, 1]
+    assert mock_automodel.call_count == 1
+    inputs = [c.kwargs["input"] for c in mock_model.generate.call_args_list]
+    assert inputs == [
+        ["chunk_001.wav", "chunk_002.wav"],
+        "chunk_001.wav",
+        "chunk_002.wav",
+        "chunk_002.wav",
+    ]
+    assert engine.last_diarization == {"chunk_001.wav": "ok", "chunk_002.wav": "fallback"}
+
+
+def test_word_index_matches_linear_scan() -> None:
+    """测试排序索引取词与逐段全量扫描结果一致（含乱序与异常时间戳）。"""
+    import random
+
+    from audio_journal.asr.funasr import _WordIndex
+
+    rng = random.Random(7)
+    timestamp: list[list] = []
+    t = 0
+    for i in range(500):
+        dur = rng.randint(-50, 400)  # 少量 end < start 的异常词
+        timestamp.append([t, t + dur, f"w{i}"])
+        t += rng.randint(0, 300)
+    middle = timestamp[100:200]
+    rng.shuffle(middle)
+    timestamp[100:200] = middle
+    timestamp.append([1, 2])  # 字段不足，跳过
+
+    turns = [(s, s + rng.randint(0, 5000)) for s in sorted(rng.sample(range(t), 80))]
+
+    def linear(start_ms: int, end_ms: int) -> str:
+        return "".join(
+            ts[2] for ts in timestamp if len(ts) >= 3 and ts[0] >= start_ms and ts[1] <= end_ms
+        )
+
+    index = _WordIndex(timestamp)
+    for start_ms, end_ms in turns:
+        assert index.text_in_range(start_ms, end_ms) == linear(start_ms, end_ms)
+
+
+@patch("funasr.AutoModel")
+def test_funasr_chunker_regions_skip_model_vad(
+    mock_automodel: MagicMock, asr_config: ASRConfig, model_dir: Path, tmp_path: Path
+) -> None:
+    """测试 vad_source=chunker 时只解码语音区间，且不经过 fsmn-vad。"""
+    import wave
+
+    from audio_journal.chunker.vad_chunker import write_speech_regions
+
+    mock_model = MagicMock()
+    mock_automodel.return_value = mock_model
+    mock_model.generate.side_effect = [
+        [{"text": "你好", "timestamp": [[100, 300], [300, 500]]}, {"text": ""}],
+        [{"text": "你好。"}],
+    ]
+
+    chunk = tmp_path / "chunk_001.wav"
+    with wave.open(str(chunk), "wb") as wf:
+        wf.setnchannels(1)
+        wf.setsampwidth(2)
+        wf.setframerate(16000)
+        wf.writeframes(b"\x00\x00" * 16000 * 3)
+    write_speech_regions(chunk, [(0.5, 1.5), (2.0, 2.5)])
+
+    asr_config.vad_source = "chunker"
+    engine = FunASREngine(asr_config, model_dir=model_dir)
+    utterances = engine.transcribe(str(chunk))
+
+    asr_call = mock_model.generate.call_args_list[0].kwargs
+    assert [len(c) for c in asr_call["input"]] == [16000, 8000]
+    assert asr_call["fs"] == 16000
+    region_asr, _ = engine._region_models
+    assert region_asr.vad_model is None
+    assert mock_model.vad_model is not None
+
+    assert len(utterances) == 1
+    assert utterances[0].text == "你好。"
+    assert utterances[0].start_time == pytest.approx(0.6)
+    assert utterances[0].end_time == pytest.approx(1.0)
+
+
+@patch("funasr.AutoModel")
+def test_funasr_chunker_regions_empty_chunk_skips_decode(
+    mock_automodel: MagicMock, asr_config: ASRConfig, model_dir: Path, tmp_path: Path
+) -> None:
+    """测试全静音 chunk（无语音区间）不调用模型。"""
+    from audio_journal.chunker.vad_chunker import write_speech_regions
+
+    mock_model = MagicMock()
+    mock_automodel.return_value = mock_model
+    chunk = tmp_path / "chunk_002.wav"
+    chunk.write_bytes(b"")
+    write_speech_regions(chunk, [])
+
+    asr_config.vad_source = "chunker"
+    engine = FunASREngine(asr_config, model_dir=model_dir)
+
+    assert engine.transcribe(str(chunk)) == []
+    mock_model.generate.assert_not_called()
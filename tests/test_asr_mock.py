@@ -35,3 +35,18 @@ def test_mock_asr_loads_fixture(tmp_path: Path) -> None:
     assert utterances[0].speaker.id == "SPEAKER_00"
     assert utterances[0].text == "你好"
     assert utterances[1].speaker.id == "SPEAKER_01"
+
+
+def test_mock_asr_transcribe_many_defaults_to_per_file(tmp_path: Path) -> None:
+    fixture = tmp_path / "asr.json"
+    fixture.write_text(
+        json.dumps([{"speaker": "SPEAKER_00", "text": "你好", "start_time": 0.0, "end_time": 1.0}]),
+        encoding="utf-8",
+    )
+
+    engine = MockASREngine(fixture)
+    outputs = engine.transcribe_many(["a.wav", "b.wav"])
+
+    assert len(outputs) == 2
+    assert outputs[0][0].text == "你好"
+    assert outputs[1][0].text == "你好"
@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from audio_journal.asr.onnx import OnnxASREngine, _preds_text, _vad_segments
+from audio_journal.config import ASRConfig
+
+
+@pytest.fixture
+def asr_config() -> ASRConfig:
+    return ASRConfig(
+        engine="funasr-onnx",
+        model="paraformer-zh",
+        vad_model="fsmn-vad",
+        punc_model="ct-punc",
+        device="cpu",
+    )
+
+
+@pytest.fixture
+def model_dir(tmp_path: Path) -> Path:
+    model_dir = tmp_path / "models"
+    for name in ["paraformer-zh", "fsmn-vad", "ct-punc"]:
+        (model_dir / name).mkdir(parents=True)
+        (model_dir / name / "model_quant.onnx").write_bytes(b"")
+    return model_dir
+
+
+def test_onnx_engine_missing_models(asr_config: ASRConfig, tmp_path: Path) -> None:
+    pytest.importorskip("funasr_onnx")
+    with pytest.raises(RuntimeError, match="ONNX 模型文件缺失"):
+        OnnxASREngine(asr_config, model_dir=tmp_path)
+
+
+def test_onnx_engine_missing_deps_points_at_extra(
+    asr_config: ASRConfig, model_dir: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setitem(sys.modules, "funasr_onnx", None)
+    with pytest.raises(RuntimeError, match=r"audio-journal\[onnx\]"):
+        OnnxASREngine(asr_config, model_dir=model_dir)
+
+
+def test_vad_segments_handles_nesting() -> None:
+    assert _vad_segments([[[0, 500], [800, 1200]]]) == [[0, 500], [800, 1200]]
+    assert _vad_segments([[0, 500]]) == [[0, 500]]
+    assert _vad_segments([[]]) == []
+    assert _vad_segments([]) == []
+
+
+def test_preds_text_formats() -> None:
+    assert _preds_text([{"preds": "你好 "}]) == "你好"
+    assert _preds_text([{"preds": ("你好", ["你", "好"])}]) == "你好"
+    assert _preds_text([]) == ""
+
+
+@patch("audio_journal.asr.onnx._load_audio")
+@patch("funasr_onnx.CT_Transformer")
+@patch("funasr_onnx.Fsmn_vad")
+@patch("funasr_onnx.Paraformer")
+def test_onnx_engine_transcribe_per_vad_segment(
+    mock_asr: MagicMock,
+    mock_vad: MagicMock,
+    mock_punc: MagicMock,
+    mock_load: MagicMock,
+    asr_config: ASRConfig,
+    model_dir: Path,
+) -> None:
+    """测试每个 VAD 语音段产出一条带标点的 utterance。"""
+    mock_load.return_value = [0.0] * 32000
+    mock_vad.return_value.return_value = [[[0, 800], [1000, 1900]]]
+    mock_asr.return_value.side_effect = [[{"preds": "你好"}], [{"preds": "再见"}]]
+    mock_punc.return_value.side_effect = lambda text: (text + "。", [])
+
+    engine = OnnxASREngine(asr_config, model_dir=model_dir)
+    utterances = engine.transcribe("a.wav")
+
+    assert mock_asr.call_args.kwargs["quantize"] is True
+    assert [u.text for u in utterances] == ["你好。", "再见。"]
+    assert (utterances[1].start_time, utterances[1].end_time) == (1.0, 1.9)
+    speech = mock_asr.return_value.call_args_list[1].args[0]
+    assert len(speech) == 14400
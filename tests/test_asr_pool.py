@@ -0,0 +1,108 @@
+from __future__ import annotations
+
+import functools
+import json
+import os
+import wave
+from pathlib import Path
+
+import pytest
+
+from audio_journal.asr import pool as pool_mod
+from audio_journal.asr.base import ASREngine
+from audio_journal.asr.mock import MockASREngine
+from audio_journal.asr.pool import ProcessPoolASREngine, longest_first
+from audio_journal.asr.supervisor import ASRWorkerError
+from audio_journal.models.schemas import Speaker, Utterance
+
+
+def _write_wav(path: Path, seconds: float) -> str:
+    with wave.open(str(path), "wb") as wf:
+        wf.setnchannels(1)
+        wf.setsampwidth(2)
+        wf.setframerate(16000)
+        wf.writeframes(b"\x00\x00" * int(16000 * seconds))
+    return str(path)
+
+
+class _CrashingASR(ASREngine):
+    def transcribe(self, audio_path: str) -> list[Utterance]:
+        if audio_path.endswith("crash.wav"):
+            os._exit(3)
+        return [Utterance(speaker=Speaker(id="SPEAKER_00"), text="ok", start_time=0, end_time=1)]
+
+
+@pytest.fixture
+def fixture_path(tmp_path: Path) -> Path:
+    p = tmp_path / "asr.json"
+    p.write_text(
+        json.dumps([{"speaker": "SPEAKER_00", "text": "你好", "start_time": 0.0, "end_time": 1.0}]),
+        encoding="utf-8",
+    )
+    return p
+
+
+def test_longest_first_orders_by_duration(tmp_path: Path) -> None:
+    paths = [
+        _write_wav(tmp_path / "a.wav", 1.0),
+        _write_wav(tmp_path / "b.wav", 3.0),
+        _write_wav(tmp_path / "c.wav", 2.0),
+        _write_wav(tmp_path / "d.wav", 3.0),
+    ]
+
+    assert longest_first(paths) == [1, 3, 2, 0]
+
+
+def test_init_worker_pins_threads_and_builds_engine(
+    fixture_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    for var in pool_mod._THREAD_ENV_VARS:
+        monkeypatch.delenv(var, raising=False)
+    monkeypatch.setattr(pool_mod, "_worker_engine", None)
+
+    pool_mod._init_worker(functools.partial(MockASREngine, fixture_path), 3)
+
+    assert os.environ["OMP_NUM_THREADS"] == "3"
+    assert isinstance(pool_mod._worker_engine, MockASREngine)
+    assert pool_mod._transcribe_in_worker("x.wav")[0].text == "你好"
+
+
+def test_pool_transcribe_many_keeps_input_order(tmp_path: Path, fixture_path: Path) -> None:
+    paths = [_write_wav(tmp_path / f"c{i}.wav", 0.1 * (i + 1)) for i in range(4)]
+    engine = ProcessPoolASREngine(
+        functools.partial(MockASREngine, fixture_path), workers=2, threads_per_worker=1
+    )
+    try:
+        outputs = engine.transcribe_many(paths)
+        single = engine.transcribe(paths[0])
+    finally:
+        engine.close()
+
+    assert len(outputs) == 4
+    assert all(u[0].text == "你好" for u in outputs)
+    assert single[0].text == "你好"
+
+
+def test_pool_worker_crash_raises_worker_error_and_rebuilds(tmp_path: Path) -> None:
+    ok = [_write_wav(tmp_path / f"ok{i}.wav", 0.1) for i in range(2)]
+    crash = _write_wav(tmp_path / "crash.wav", 0.2)
+    engine = ProcessPoolASREngine(_CrashingASR, workers=2, threads_per_worker=1)
+    try:
+        # 崩溃转为 ASRWorkerError，Pipeline 据此跳过 chunk
+        with pytest.raises(ASRWorkerError):
+            engine.transcribe(crash)
+        # 失效的进程池被丢弃，下次调用重建
+        assert engine.transcribe(ok[0])[0].text == "ok"
+        # 批量中途崩溃时逐个重跑，坏 chunk 单独失败
+        with pytest.raises(ASRWorkerError):
+            engine.transcribe_many([ok[0], crash, ok[1]])
+        assert [u[0].text for u in engine.transcribe_many(ok)] == ["ok", "ok"]
+    finally:
+        engine.close()
+    assert engine._executor is None
+
+
+def test_pool_threads_default_split_cores(fixture_path: Path) -> None:
+    engine = ProcessPoolASREngine(functools.partial(MockASREngine, fixture_path), workers=2)
+
+    assert engine.threads_per_worker == max(1, (os.cpu_count() or 1) // 2)
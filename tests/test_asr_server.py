@@ -0,0 +1,143 @@
+from __future__ import annotations
+
+import functools
+import os
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from audio_journal.asr.base import ASREngine
+from audio_journal.asr.mock import MockASREngine
+from audio_journal.asr.server import ASRServer, RemoteASREngine
+from audio_journal.asr.supervisor import ASRWorkerError, SupervisedASREngine
+from audio_journal.config import AppConfig, ASRConfig
+from audio_journal.models.schemas import Speaker, Utterance
+from audio_journal.pipeline import _default_asr
+
+
+class _RecordingASR(ASREngine):
+    def __init__(self) -> None:
+        self.paths: list[str] = []
+
+    def transcribe(self, audio_path: str) -> list[Utterance]:
+        if audio_path.endswith("bad.wav"):
+            raise RuntimeError("decode failed")
+        self.paths.append(audio_path)
+        return [
+            Utterance(
+                speaker=Speaker(id="SPEAKER_01"), text="你好", start_time=0.5, end_time=1.5
+            )
+        ]
+
+
+class _CrashingASR(ASREngine):
+    def __init__(self, marker: str) -> None:
+        self.marker = marker
+
+    def transcribe(self, audio_path: str) -> list[Utterance]:
+        if audio_path.endswith("crash.wav"):
+            os._exit(3)
+        return [
+            Utterance(speaker=Speaker(id="SPEAKER_00"), text=self.marker, start_time=0, end_time=1)
+        ]
+
+
+def _serve(engine: ASREngine, socket_path: Path):
+    server = ASRServer(engine, socket_path)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+
+    client = RemoteASREngine(server.socket_path)
+    for _ in range(100):
+        if client.is_available():
+            break
+        time.sleep(0.01)
+    return server, thread, client
+
+
+@pytest.fixture
+def running_server(tmp_path: Path):
+    engine = _RecordingASR()
+    server, thread, client = _serve(engine, tmp_path / "asr.sock")
+
+    yield server, engine, client
+
+    server.shutdown()
+    thread.join(timeout=5)
+
+
+def test_remote_engine_roundtrip(running_server, tmp_path: Path) -> None:
+    server, engine, client = running_server
+
+    utterances = client.transcribe("chunk_001.wav")
+
+    assert utterances == [
+        Utterance(speaker=Speaker(id="SPEAKER_01"), text="你好", start_time=0.5, end_time=1.5)
+    ]
+    # 客户端发送绝对路径
+    assert engine.paths == [str(Path("chunk_001.wav").resolve())]
+    assert (server.socket_path.stat().st_mode & 0o777) == 0o600
+
+
+def test_remote_engine_surfaces_server_errors(running_server) -> None:
+    _, _, client = running_server
+
+    with pytest.raises(RuntimeError, match="decode failed") as exc:
+        client.transcribe("bad.wav")
+    # 引擎自身的错误不是 worker 故障，不应被当作可跳过的 chunk
+    assert not isinstance(exc.value, ASRWorkerError)
+
+
+def test_server_refuses_second_instance(running_server) -> None:
+    server, engine, _ = running_server
+
+    with pytest.raises(RuntimeError, match="已在运行"):
+        ASRServer(engine, server.socket_path).serve_forever()
+
+
+def test_remote_engine_unavailable_without_server(tmp_path: Path) -> None:
+    assert RemoteASREngine(tmp_path / "missing.sock").is_available() is False
+
+
+def test_default_asr_prefers_server(running_server) -> None:
+    server, _, _ = running_server
+    cfg = AppConfig(asr=ASRConfig(use_server=True, server_socket=server.socket_path))
+
+    assert isinstance(_default_asr(cfg), RemoteASREngine)
+
+
+def test_default_asr_falls_back_to_local(monkeypatch, tmp_path: Path) -> None:
+    fixture = tmp_path / "asr.json"
+    fixture.write_text("[]", encoding="utf-8")
+    monkeypatch.setenv("AUDIO_JOURNAL_MOCK_ASR_FIXTURE", str(fixture))
+    cfg = AppConfig(asr=ASRConfig(use_server=True, server_socket=tmp_path / "missing.sock"))
+
+    assert isinstance(_default_asr(cfg), MockASREngine)
+
+
+def test_remote_engine_transcribe_many(running_server) -> None:
+    _, engine, client = running_server
+
+    outputs = client.transcribe_many(["a.wav", "b.wav"])
+
+    assert [len(u) for u in outputs] == [1, 1]
+    assert engine.paths == [str(Path("a.wav").resolve()), str(Path("b.wav").resolve())]
+
+
+def test_remote_engine_reraises_supervised_worker_failure(tmp_path: Path) -> None:
+    engine = SupervisedASREngine(
+        functools.partial(_CrashingASR, "ok"), min_deadline_s=30.0, retries=0
+    )
+    server, thread, client = _serve(engine, tmp_path / "asr.sock")
+    try:
+        # 服务端 worker 崩溃 → 客户端得到 ASRWorkerError，Pipeline 据此跳过 chunk
+        with pytest.raises(ASRWorkerError):
+            client.transcribe("crash.wav")
+        # worker 重启后服务继续可用
+        assert client.transcribe("fine.wav")[0].text == "ok"
+    finally:
+        server.shutdown()
+        thread.join(timeout=5)
+        engine.close()
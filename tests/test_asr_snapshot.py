@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+import pytest
+
+from audio_journal.asr.snapshot import ModelSnapshotCache, snapshot_key
+
+
+@pytest.fixture
+def model_kwargs(tmp_path: Path) -> dict:
+    asr = tmp_path / "models" / "paraformer-zh"
+    asr.mkdir(parents=True)
+    (asr / "model.pt").write_bytes(b"weights")
+    return {"model": str(asr), "device": "cpu"}
+
+
+def test_snapshot_key_changes_when_model_files_change(model_kwargs: dict) -> None:
+    before = snapshot_key(model_kwargs)
+    assert snapshot_key(model_kwargs) == before
+
+    weights = Path(model_kwargs["model"]) / "model.pt"
+    weights.write_bytes(b"new weights")
+    os.utime(weights, ns=(1, 1))
+    after = snapshot_key(model_kwargs)
+
+    # 构建参数不变，只有内容部分变化
+    assert after != before
+    assert after.split("-")[0] == before.split("-")[0]
+
+
+def test_snapshot_key_depends_on_build_params(model_kwargs: dict) -> None:
+    other = {**model_kwargs, "device": "mps"}
+
+    assert snapshot_key(other).split("-")[0] != snapshot_key(model_kwargs).split("-")[0]
+
+
+def test_load_or_build_round_trips_through_snapshot(tmp_path: Path, model_kwargs: dict) -> None:
+    torch = pytest.importorskip("torch")
+    cache = ModelSnapshotCache(tmp_path / "snapshots")
+    builds = []
+
+    def build():
+        builds.append(1)
+        return {"model": torch.nn.Linear(4, 2)}
+
+    first, source, _ = cache.load_or_build(model_kwargs, build)
+    second, source2, _ = cache.load_or_build(model_kwargs, build)
+
+    assert (source, source2) == ("cold", "snapshot")
+    assert len(builds) == 1
+    assert torch.equal(first["model"].weight, second["model"].weight)
+
+
+def test_unserializable_model_falls_back_to_cold_start(
+    tmp_path: Path, model_kwargs: dict
+) -> None:
+    cache = ModelSnapshotCache(tmp_path / "snapshots")
+
+    # lambda 不可 pickle（未安装 torch 时同样走失败分支）
+    model, source, _ = cache.load_or_build(model_kwargs, lambda: (lambda: None))
+
+    assert callable(model) and source == "cold"
+    assert not list((tmp_path / "snapshots").glob("*.pt"))
+
+
+def test_corrupt_snapshot_is_discarded(tmp_path: Path, model_kwargs: dict) -> None:
+    cache = ModelSnapshotCache(tmp_path / "snapshots")
+    path = cache.path_for(model_kwargs)
+    path.parent.mkdir(parents=True)
+    path.write_bytes(b"not a snapshot")
+
+    model, source, _ = cache.load_or_build(model_kwargs, lambda: "built")
+
+    assert (model, source) == ("built", "cold")
+    assert not path.exists()
@@ -0,0 +1,107 @@
+from __future__ import annotations
+
+import struct
+import threading
+import time
+import wave
+from array import array
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from audio_journal.asr.streaming import StreamingFunASREngine, read_wav_pcm
+from audio_journal.config import ASRConfig
+
+
+def _tone(n: int, amp: int) -> bytes:
+    return array("h", [amp if i % 2 else -amp for i in range(n)]).tobytes()
+
+
+def _write_wav(path: Path, frames: bytes, *, channels: int = 1) -> None:
+    with wave.open(str(path), "wb") as wf:
+        wf.setnchannels(channels)
+        wf.setsampwidth(2)
+        wf.setframerate(16000)
+        wf.writeframes(frames)
+
+
+def test_read_wav_pcm_takes_first_channel(tmp_path: Path) -> None:
+    p = tmp_path / "stereo.wav"
+    _write_wav(p, array("h", [1, -1] * 1000).tobytes(), channels=2)
+
+    data = b"".join(read_wav_pcm(p, block_frames=300))
+    samples = array("h")
+    samples.frombytes(data)
+
+    assert len(samples) == 1000
+    assert set(samples) == {1}
+
+
+def test_read_wav_pcm_follows_growing_file(tmp_path: Path) -> None:
+    p = tmp_path / "rec.wav"
+    # 录音中的 WAV：data 长度字段为 0
+    header = (
+        b"RIFF" + struct.pack("<I", 0) + b"WAVE"
+        + b"fmt " + struct.pack("<IHHIIHH", 16, 1, 1, 16000, 32000, 2, 16)
+        + b"data" + struct.pack("<I", 0)
+    )
+    p.write_bytes(header)
+
+    def _writer() -> None:
+        for _ in range(3):
+            time.sleep(0.05)
+            with p.open("ab") as f:
+                f.write(_tone(1600, 1000))
+
+    t = threading.Thread(target=_writer)
+    t.start()
+    data = b"".join(
+        read_wav_pcm(p, block_frames=1600, follow=True, idle_seconds=0.3, poll_interval=0.02)
+    )
+    t.join(timeout=2)
+
+    assert len(data) == 3 * 1600 * 2
+
+
+@pytest.fixture
+def streaming_model_dir(tmp_path: Path) -> Path:
+    model_dir = tmp_path / "models"
+    (model_dir / "paraformer-zh-streaming").mkdir(parents=True)
+    return model_dir
+
+
+@patch("funasr.AutoModel")
+def test_streaming_engine_emits_utterance_at_silence_endpoint(
+    mock_automodel: MagicMock, streaming_model_dir: Path
+) -> None:
+    """测试端点检测：语音后连续静音即产出 utterance，并重置解码缓存。"""
+    pytest.importorskip("numpy")
+    mock_model = MagicMock()
+    mock_automodel.return_value = mock_model
+
+    caches: list[dict] = []
+
+    def _generate(*, input, cache, is_final, **kwargs):
+        caches.append(cache)
+        # 有声块返回文字，静音块不返回
+        return [{"text": "你好" if abs(float(input[1])) > 0.01 else ""}]
+
+    mock_model.generate.side_effect = _generate
+
+    config = ASRConfig(device="cpu")
+    config.streaming.punctuate = False
+    config.streaming.endpoint_silence_s = 1.2
+    engine = StreamingFunASREngine(config, model_dir=streaming_model_dir)
+
+    chunk = engine.chunk_samples
+    pcm = _tone(chunk * 2, 3000) + bytes(chunk * 2 * 2) + _tone(chunk, 3000)
+    utterances = list(engine.stream([pcm]))
+
+    assert [u.text for u in utterances] == ["你好你好", "你好"]
+    assert utterances[0].start_time == 0.0
+    assert utterances[0].end_time == pytest.approx(1.2)
+    assert utterances[1].start_time == pytest.approx(2.4)
+    # 第一句结束后换用新的缓存
+    assert caches[0] is caches[3]
+    assert caches[4] is not caches[0]
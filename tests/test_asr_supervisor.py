@@ -0,0 +1,106 @@
+from __future__ import annotations
+
+import functools
+import os
+import time
+import wave
+from pathlib import Path
+
+import pytest
+
+from audio_journal.asr.base import ASREngine
+from audio_journal.asr.supervisor import ASRWorkerError, SupervisedASREngine
+from audio_journal.models.schemas import Speaker, Utterance
+
+
+class _ScriptedEngine(ASREngine):
+    """按文件名决定行为：hang 卡住、crash 直接退出进程、hang-once 仅第一次卡住。"""
+
+    def __init__(self, marker_dir: str) -> None:
+        self.marker_dir = Path(marker_dir)
+
+    def transcribe(self, audio_path: str) -> list[Utterance]:
+        name = Path(audio_path).stem
+        if name == "hang":
+            time.sleep(60)
+        if name == "crash":
+            os._exit(3)
+        if name == "hang-once":
+            marker = self.marker_dir / "hung"
+            if not marker.exists():
+                marker.touch()
+                time.sleep(60)
+        if name == "boom":
+            raise ValueError("bad audio")
+        return [Utterance(speaker=Speaker(id="SPEAKER_00"), text=name, start_time=0, end_time=1)]
+
+
+def _engine(tmp_path: Path, **kwargs) -> SupervisedASREngine:
+    kwargs.setdefault("min_deadline_s", 1.0)
+    return SupervisedASREngine(functools.partial(_ScriptedEngine, str(tmp_path)), **kwargs)
+
+
+def _write_wav(path: Path, seconds: float) -> str:
+    with wave.open(str(path), "wb") as wf:
+        wf.setnchannels(1)
+        wf.setsampwidth(2)
+        wf.setframerate(16000)
+        wf.writeframes(b"\x00\x00" * int(16000 * seconds))
+    return str(path)
+
+
+def test_deadline_scales_with_chunk_duration(tmp_path: Path) -> None:
+    engine = _engine(tmp_path, deadline_factor=0.5, min_deadline_s=2.0)
+    long_wav = _write_wav(tmp_path / "long.wav", 10.0)
+    short_wav = _write_wav(tmp_path / "short.wav", 1.0)
+
+    assert engine.deadline_for([long_wav]) == pytest.approx(5.0)
+    assert engine.deadline_for([short_wav]) == 2.0
+    assert engine.deadline_for([long_wav, long_wav]) == pytest.approx(10.0)
+
+
+def test_timeout_restarts_worker_and_retries_once(tmp_path: Path) -> None:
+    engine = _engine(tmp_path)
+    try:
+        out = engine.transcribe("hang-once.wav")
+        # 重启后的 worker 继续可用
+        assert engine.transcribe("ok.wav")[0].text == "ok"
+    finally:
+        engine.close()
+
+    assert out[0].text == "hang-once"
+    assert engine.restarts == 1
+
+
+def test_persistent_hang_raises_after_retry(tmp_path: Path) -> None:
+    engine = _engine(tmp_path)
+    try:
+        with pytest.raises(ASRWorkerError):
+            engine.transcribe("hang.wav")
+    finally:
+        engine.close()
+
+    assert engine.restarts == 2
+
+
+def test_crash_is_detected_without_waiting_for_deadline(tmp_path: Path) -> None:
+    engine = _engine(tmp_path, min_deadline_s=30.0, retries=0)
+    try:
+        t0 = time.monotonic()
+        with pytest.raises(ASRWorkerError):
+            engine.transcribe("crash.wav")
+        assert time.monotonic() - t0 < 30.0
+    finally:
+        engine.close()
+
+
+def test_engine_exception_is_not_retried(tmp_path: Path) -> None:
+    engine = _engine(tmp_path)
+    try:
+        with pytest.raises(RuntimeError, match="bad audio"):
+            engine.transcribe("boom.wav")
+        assert engine.transcribe_many(["a.wav", "b.wav"])[1][0].text == "b"
+    finally:
+        engine.close()
+
+    assert engine.restarts == 0
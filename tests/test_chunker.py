@@ -4,7 +4,7 @@ import math
 import wave
 from pathlib import Path
 
-from audio_journal.chunker.vad_chunker import VADChunker
+from audio_journal.chunker.vad_chunker import VADChunker, read_speech_regions
 from audio_journal.config import ChunkerConfig
 
 
@@ -66,3 +66,72 @@ def test_chunker_merges_too_short_tail_chunk(tmp_path: Path) -> None:
     assert len(chunks) == 2
     assert chunks[0].duration <= 0.31
     assert chunks[1].duration >= 0.33
+
+
+def test_chunker_low_memory_matches_default(tmp_path: Path) -> None:
+    sr = 8000
+    samples = _tone(0.5, sr) + _silence(0.6, sr) + _tone(0.9, sr)
+    samples += _silence(0.7, sr) + _tone(0.3, sr)
+    wav_path = tmp_path / "d.wav"
+    _write_wav(wav_path, samples, sr)
+
+    cfg = ChunkerConfig(min_silence_gap=0.5, max_chunk_duration=0.8, min_chunk_duration=0.1)
+    chunker = VADChunker(cfg)
+    # 缩小流式块，确保跨块边界
+    chunker._stream_block_frames = 3
+
+    default = chunker.split(wav_path, tmp_path / "full")
+    streamed = chunker.split(wav_path, tmp_path / "stream", low_memory=True)
+
+    assert [(c.start_time, c.end_time) for c in streamed] == [
+        (c.start_time, c.end_time) for c in default
+    ]
+    for a, b in zip(default, streamed, strict=True):
+        assert a.path.read_bytes() == b.path.read_bytes()
+    assert chunker.estimate_memory(wav_path) >= len(samples) * 2
+
+
+def test_chunker_emits_speech_regions(tmp_path: Path) -> None:
+    sr = 8000
+    # 语音 0.3s / 短停顿 0.15s / 语音 0.3s / 长静音 1.5s / 语音 0.3s
+    samples = (
+        _tone(0.3, sr) + _silence(0.15, sr) + _tone(0.3, sr) + _silence(1.5, sr) + _tone(0.3, sr)
+    )
+    wav_path = tmp_path / "r.wav"
+    _write_wav(wav_path, samples, sr)
+
+    cfg = ChunkerConfig(
+        min_silence_gap=10.0,
+        max_chunk_duration=10.0,
+        min_chunk_duration=0.0,
+        speech_merge_gap_s=0.3,
+        speech_pad_s=0.0,
+    )
+    chunks = VADChunker(cfg).split(wav_path, tmp_path / "chunks")
+
+    assert len(chunks) == 1
+    regions = chunks[0].speech_regions
+    assert len(regions) == 2
+    assert regions[0][0] == 0.0
+    assert abs(regions[0][1] - 0.75) < 0.04
+    assert abs(regions[1][0] - 2.25) < 0.04
+    assert read_speech_regions(chunks[0].path) == list(regions)
+
+
+def test_chunker_speech_regions_same_in_low_memory_mode(tmp_path: Path) -> None:
+    sr = 8000
+    samples = _tone(0.3, sr) + _silence(0.7, sr) + _tone(0.5, sr) + _silence(0.7, sr)
+    wav_path = tmp_path / "s.wav"
+    _write_wav(wav_path, samples, sr)
+
+    cfg = ChunkerConfig(
+        min_silence_gap=0.6, max_chunk_duration=10.0, min_chunk_duration=0.0, speech_pad_s=0.1
+    )
+    default = VADChunker(cfg).split(wav_path, tmp_path / "a")
+    chunker = VADChunker(cfg)
+    chunker._stream_block_frames = 3
+    streamed = chunker.split(wav_path, tmp_path / "b", low_memory=True)
+
+    assert [c.speech_regions for c in default] == [c.speech_regions for c in streamed]
+    # 末尾纯静音 chunk 没有语音区间
+    assert [bool(c.speech_regions) for c in default] == [True, True, False]
@@ -0,0 +1,127 @@
+from __future__ import annotations
+
+import asyncio
+import os
+from pathlib import Path
+
+import pytest
+
+from audio_journal.classifier.cache import ClassificationCache, llm_fingerprint
+from audio_journal.classifier.scene import SceneClassifier
+from audio_journal.models.schemas import SceneType, Segment, Speaker, Utterance
+
+
+class _FakeLLM:
+    def __init__(self, reply: str, model: str = "m1", temperature: float = 0.3) -> None:
+        self.reply = reply
+        self.model = model
+        self.temperature = temperature
+        self.calls = 0
+
+    async def complete(self, prompt: str, system: str = "", json_mode: bool = False) -> str:
+        self.calls += 1
+        return self.reply
+
+
+def _segment(text: str, seg_id: str = "seg-1") -> Segment:
+    utt = Utterance(speaker=Speaker(id="SPEAKER_00"), text=text, start_time=0.0, end_time=1.0)
+    return Segment(
+        id=seg_id, utterances=[utt], start_time=0.0, end_time=1.0, duration=1.0, source_file="a.wav"
+    )
+
+
+def _cache(tmp_path: Path, llm: _FakeLLM, **kwargs) -> ClassificationCache:
+    opts = {"ttl_s": 3600.0, "max_entries": 100, **kwargs}
+    return ClassificationCache(tmp_path / "cache", fingerprint=llm_fingerprint(llm), **opts)
+
+
+def _classifier(tmp_path: Path, llm: _FakeLLM, cache: ClassificationCache) -> SceneClassifier:
+    prompt = tmp_path / "classifier.txt"
+    if not prompt.exists():
+        prompt.write_text("{{transcript}}", encoding="utf-8")
+    return SceneClassifier(prompt_path=prompt, llm=llm, cache=cache)
+
+
+def test_repeated_sample_skips_llm_across_runs(tmp_path: Path) -> None:
+    llm = _FakeLLM('{"scene":"meeting","confidence":0.9}')
+
+    first = _classifier(tmp_path, llm, _cache(tmp_path, llm))
+    asyncio.run(first.classify(_segment("开会")))
+
+    # 新进程：重新构建缓存对象，另一个片段 id 但采样文本相同
+    cache = _cache(tmp_path, llm)
+    out = asyncio.run(_classifier(tmp_path, llm, cache).classify(_segment("开会", "seg-2")))
+
+    assert llm.calls == 1
+    assert (out.id, out.scene, out.confidence) == ("seg-2", SceneType.MEETING, 0.9)
+    assert (cache.hits, cache.misses) == (1, 0)
+
+
+def test_key_covers_sample_template_and_model(tmp_path: Path) -> None:
+    llm = _FakeLLM('{"scene":"chat","confidence":0.5}')
+    clf = _classifier(tmp_path, llm, _cache(tmp_path, llm))
+    asyncio.run(clf.classify(_segment("闲聊")))
+
+    asyncio.run(clf.classify(_segment("别的话题")))
+    (tmp_path / "classifier.txt").write_text("新模板 {{transcript}}", encoding="utf-8")
+    asyncio.run(_classifier(tmp_path, llm, _cache(tmp_path, llm)).classify(_segment("闲聊")))
+    other = _FakeLLM(llm.reply, model="m2")
+    asyncio.run(_classifier(tmp_path, other, _cache(tmp_path, other)).classify(_segment("闲聊")))
+
+    assert llm.calls == 3
+    assert other.calls == 1
+
+
+def test_expired_entries_miss(tmp_path: Path) -> None:
+    llm = _FakeLLM('{"scene":"idea","confidence":0.7}')
+    cache = _cache(tmp_path, llm, ttl_s=0.0)
+    clf = _classifier(tmp_path, llm, cache)
+
+    asyncio.run(clf.classify(_segment("灵感")))
+    asyncio.run(clf.classify(_segment("灵感")))
+
+    assert llm.calls == 2
+    assert (cache.hits, cache.misses) == (0, 2)
+
+
+def test_evicts_least_recently_used_beyond_max_entries(tmp_path: Path) -> None:
+    llm = _FakeLLM("{}")
+    cache = _cache(tmp_path, llm, max_entries=10)
+    keys = [cache.key_for(str(i)) for i in range(12)]
+
+    for i in range(10):
+        cache.put(keys[i], {"n": i})
+    os.utime(cache._path_for(keys[0]), (1000, 1000))
+    os.utime(cache._path_for(keys[1]), (1001, 1001))
+
+    scans = 0
+    entries = cache._entries
+
+    def _counting_entries():
+        nonlocal scans
+        scans += 1
+        return entries()
+
+    cache._entries = _counting_entries
+    # 超出上限时一次淘汰到 90%（9 条），下一次写入不再扫描目录
+    cache.put(keys[10], {"n": 10})
+    cache.put(keys[11], {"n": 11})
+
+    assert scans == 1
+    assert len(list((tmp_path / "cache").glob("*/*.json"))) == 10
+    assert cache.get(keys[0]) is None
+    assert cache.get(keys[1]) is None
+    assert cache.get(keys[11]) == {"n": 11}
+
+
+def test_unknown_scene_is_not_cached(tmp_path: Path) -> None:
+    llm = _FakeLLM('{"scene":"party","confidence":0.9}')
+    cache = _cache(tmp_path, llm)
+    clf = _classifier(tmp_path, llm, cache)
+
+    for _ in range(2):
+        with pytest.raises(ValueError):
+            asyncio.run(clf.classify(_segment("x")))
+
+    assert llm.calls == 2
+    assert not list((tmp_path / "cache").glob("*/*.json"))
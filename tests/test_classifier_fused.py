@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+import asyncio
+import json
+from pathlib import Path
+
+import pytest
+
+from audio_journal.analyzer.meeting import MeetingAnalyzer
+from audio_journal.classifier.fused import FusedClassifier
+from audio_journal.models.schemas import SceneType, Segment, Speaker, Utterance
+
+
+class _FakeLLM:
+    def __init__(self, reply: str) -> None:
+        self.reply = reply
+        self.prompts: list[str] = []
+
+    async def complete(self, prompt: str, system: str = "", json_mode: bool = False) -> str:
+        self.prompts.append(prompt)
+        return self.reply
+
+
+def _segment() -> Segment:
+    utterances = [
+        Utterance(speaker=Speaker(id="SPEAKER_00"), text="先过一下进度", start_time=0.0, end_time=1.0),
+        Utterance(speaker=Speaker(id="SPEAKER_01"), text="接口本周完成", start_time=1.2, end_time=2.0),
+    ]
+    return Segment(
+        id="seg-1",
+        utterances=utterances,
+        start_time=0.0,
+        end_time=2.0,
+        duration=2.0,
+        source_file="a.wav",
+    )
+
+
+def _fused(tmp_path: Path, reply: dict) -> tuple[FusedClassifier, _FakeLLM]:
+    fused_prompt = tmp_path / "fused.txt"
+    fused_prompt.write_text("{{analysis_scenes}}\n{{speakers}}\n{{transcript}}", encoding="utf-8")
+    meeting_prompt = tmp_path / "meeting.txt"
+    meeting_prompt.write_text("{{transcript}}", encoding="utf-8")
+
+    llm = _FakeLLM(json.dumps(reply, ensure_ascii=False))
+    meeting = MeetingAnalyzer(llm=llm, prompt_path=meeting_prompt)
+    fused = FusedClassifier(
+        prompt_path=fused_prompt, llm=llm, analyzers={SceneType.MEETING: meeting}
+    )
+    return fused, llm
+
+
+def test_fused_returns_classification_and_analysis(tmp_path: Path) -> None:
+    fused, llm = _fused(
+        tmp_path,
+        {
+            "scene": "meeting",
+            "confidence": 0.88,
+            "analysis": {
+                "summary": "同步进度",
+                "key_points": ["接口本周完成"],
+                "action_items": [{"task": "完成接口", "owner": "SPEAKER_01", "deadline": None}],
+                "topics": ["进度"],
+            },
+        },
+    )
+
+    classified, result = asyncio.run(fused.classify_and_analyze(_segment()))
+
+    assert len(llm.prompts) == 1
+    assert "meeting" in llm.prompts[0]
+    assert "接口本周完成" in llm.prompts[0]
+
+    assert classified.scene == SceneType.MEETING
+    assert classified.confidence == 0.88
+    assert result is not None
+    assert result.segment_id == "seg-1"
+    assert result.summary == "同步进度"
+    assert result.action_items == ["完成接口 [SPEAKER_01]"]
+    assert "[00:00:00] SPEAKER_00: 先过一下进度" in result.raw_text
+
+
+def test_fused_without_analyzer_returns_only_classification(tmp_path: Path) -> None:
+    fused, _ = _fused(tmp_path, {"scene": "phone", "confidence": 0.6, "analysis": {}})
+
+    classified, result = asyncio.run(fused.classify_and_analyze(_segment()))
+
+    assert classified.scene == SceneType.PHONE
+    assert result is None
+
+
+def test_fused_rejects_unknown_scene(tmp_path: Path) -> None:
+    fused, _ = _fused(tmp_path, {"scene": "party", "confidence": 0.6})
+
+    with pytest.raises(ValueError, match="未知 scene"):
+        asyncio.run(fused.classify_and_analyze(_segment()))
@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+import asyncio
+
+from audio_journal.classifier.heuristic import (
+    CascadeClassifier,
+    HeuristicClassifier,
+    extract_features,
+)
+from audio_journal.models.schemas import ClassifiedSegment, SceneType, Segment, Speaker, Utterance
+
+
+def _segment(lines: list[tuple[str, str]], *, step: float = 5.0, source: str = "a.wav") -> Segment:
+    utts = [
+        Utterance(
+            speaker=Speaker(id=spk), text=text, start_time=i * step, end_time=i * step + step - 1
+        )
+        for i, (spk, text) in enumerate(lines)
+    ]
+    end = utts[-1].end_time
+    return Segment(
+        id="seg-1", utterances=utts, start_time=0.0, end_time=end, duration=end, source_file=source
+    )
+
+
+class _LLMClassifier:
+    def __init__(self, scene: SceneType) -> None:
+        self.scene = scene
+        self.calls = 0
+
+    async def classify(self, segment: Segment) -> ClassifiedSegment:
+        self.calls += 1
+        return ClassifiedSegment.from_segment(segment, scene=self.scene, confidence=0.9)
+
+
+_MONOLOGUE = [("S0", "突然想到一个想法，记一下"), ("S0", "明天提醒自己改方案")] * 10
+_MEETING = [(f"S{i % 4}", "今天会议同步一下项目进度和上线排期") for i in range(160)]
+_AMBIGUOUS = [("S0", "嗯"), ("S1", "对")] * 5
+
+
+def test_extract_features() -> None:
+    seg = _segment(_MEETING, source="/inbox/20250301143000.wav")
+
+    f = extract_features(seg)
+
+    assert f.speakers == 4
+    assert f.dominant_share == 0.25
+    assert round(f.turns_per_min) == 12
+    assert f.keyword_hits[SceneType.MEETING] >= 3
+    assert f.hour == 14
+
+
+def test_heuristic_predicts_clear_cases_confidently() -> None:
+    clf = HeuristicClassifier()
+
+    idea = clf.predict(_segment(_MONOLOGUE))
+    meeting = clf.predict(_segment(_MEETING, source="20250301100000.wav"))
+    unsure = clf.predict(_segment(_AMBIGUOUS))
+
+    assert (idea.scene, meeting.scene) == (SceneType.IDEA, SceneType.MEETING)
+    assert idea.confidence >= 0.8 and meeting.confidence >= 0.8
+    assert unsure.confidence < 0.8
+
+
+def test_cascade_skips_llm_only_when_confident() -> None:
+    llm = _LLMClassifier(SceneType.CHAT)
+    cascade = CascadeClassifier(HeuristicClassifier(), llm, threshold=0.8)
+
+    idea = asyncio.run(cascade.classify(_segment(_MONOLOGUE)))
+    other = asyncio.run(cascade.classify(_segment(_AMBIGUOUS)))
+
+    assert idea.scene == SceneType.IDEA
+    assert other.scene == SceneType.CHAT
+    assert llm.calls == 1
+    assert (cascade.checked, cascade.decided, cascade.compared) == (2, 1, 0)
+
+
+def test_cascade_shadow_mode_measures_agreement() -> None:
+    llm = _LLMClassifier(SceneType.IDEA)
+    cascade = CascadeClassifier(HeuristicClassifier(), llm, threshold=0.8, shadow=True)
+    segments = [_segment(_MONOLOGUE), _segment(_MEETING), _segment(_AMBIGUOUS)]
+
+    out = asyncio.run(cascade.classify_many(segments))
+
+    # shadow 下结果全部来自 LLM；两个置信片段中只有 idea 与 LLM 一致
+    assert [c.scene for c in out] == [SceneType.IDEA] * 3
+    assert llm.calls == 3
+    assert (cascade.decided, cascade.compared, cascade.agreed) == (2, 2, 1)
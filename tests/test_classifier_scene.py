@@ -80,3 +80,81 @@ def test_classifier_sets_empty_value_tags_in_mvp(tmp_path: Path) -> None:
 
     assert out.scene == SceneType.CHAT
     assert out.value_tags == []
+
+
+class _BatchLLM:
+    """按 prompt 类型应答：批量 prompt 返回给定的 results，单个 prompt 返回 meeting。"""
+
+    def __init__(self, results: list | str) -> None:
+        self.results = results
+        self.prompts: list[str] = []
+
+    async def complete(self, prompt: str, system: str = "", json_mode: bool = False) -> str:
+        self.prompts.append(prompt)
+        if prompt.startswith("BATCH"):
+            if isinstance(self.results, str):
+                return self.results
+            return __import__("json").dumps({"results": self.results})
+        return '{"scene":"meeting","confidence":0.5}'
+
+
+def _batch_classifier(tmp_path: Path, llm: _BatchLLM, batch_size: int) -> SceneClassifier:
+    single = tmp_path / "classifier.txt"
+    single.write_text("{{transcript}}", encoding="utf-8")
+    batch = tmp_path / "classifier_batch.txt"
+    batch.write_text("BATCH {{count}}\n{{segments}}", encoding="utf-8")
+    return SceneClassifier(
+        prompt_path=single, llm=llm, batch_prompt_path=batch, batch_size=batch_size
+    )
+
+
+def test_classify_many_packs_samples_into_one_prompt(tmp_path: Path) -> None:
+    llm = _BatchLLM(
+        [
+            {"id": "s2", "scene": "chat", "confidence": 0.6},
+            {"id": "s1", "scene": "phone", "confidence": 0.8},
+        ]
+    )
+    clf = _batch_classifier(tmp_path, llm, batch_size=2)
+    segs = [_segment(2).model_copy(update={"id": f"seg-{i}"}) for i in range(2)]
+
+    out = __import__("asyncio").run(clf.classify_many(segs))
+
+    assert len(llm.prompts) == 1
+    assert llm.prompts[0].startswith("BATCH 2\n### s1\n")
+    assert [(c.id, c.scene, c.confidence) for c in out] == [
+        ("seg-0", SceneType.PHONE, 0.8),
+        ("seg-1", SceneType.CHAT, 0.6),
+    ]
+    assert clf.batch_fallbacks == 0
+
+
+def test_classify_many_falls_back_for_missing_or_invalid_items(tmp_path: Path) -> None:
+    llm = _BatchLLM(
+        [
+            {"id": "s1", "scene": "phone", "confidence": 0.8},
+            {"id": "s2", "scene": "party", "confidence": 0.9},
+        ]
+    )
+    clf = _batch_classifier(tmp_path, llm, batch_size=3)
+    segs = [_segment(2).model_copy(update={"id": f"seg-{i}"}) for i in range(3)]
+
+    out = __import__("asyncio").run(clf.classify_many(segs))
+
+    # s2 场景无效、s3 缺失：各自单独调用一次
+    assert len(llm.prompts) == 3
+    assert [c.scene for c in out] == [SceneType.PHONE, SceneType.MEETING, SceneType.MEETING]
+    assert clf.batch_fallbacks == 2
+
+
+def test_classify_many_falls_back_when_batch_reply_unparseable(tmp_path: Path) -> None:
+    llm = _BatchLLM("not json")
+    clf = _batch_classifier(tmp_path, llm, batch_size=4)
+    segs = [_segment(2).model_copy(update={"id": f"seg-{i}"}) for i in range(5)]
+
+    out = __import__("asyncio").run(clf.classify_many(segs))
+
+    # 第一批 4 个整体失败后逐个调用；最后剩 1 个直接单独调用
+    assert len(llm.prompts) == 1 + 4 + 1
+    assert [c.id for c in out] == [f"seg-{i}" for i in range(5)]
+    assert clf.batch_fallbacks == 4
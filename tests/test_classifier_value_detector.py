@@ -0,0 +1,118 @@
+from __future__ import annotations
+
+import asyncio
+from pathlib import Path
+
+from audio_journal.classifier.value_detector import ValueDetector
+from audio_journal.llm.base import estimate_tokens
+from audio_journal.models.schemas import ClassifiedSegment, SceneType, Speaker, Utterance
+
+
+class _FakeLLM:
+    def __init__(self, reply: str) -> None:
+        self.reply = reply
+        self.last_prompt: str | None = None
+
+    async def complete(self, prompt: str, system: str = "", json_mode: bool = False) -> str:
+        self.last_prompt = prompt
+        return self.reply
+
+
+def _chat_segment(n: int) -> ClassifiedSegment:
+    utterances = [
+        Utterance(
+            speaker=Speaker(id="SPEAKER_00"),
+            text=f"utterance number {i} " * 4,
+            start_time=float(i),
+            end_time=float(i) + 0.5,
+        )
+        for i in range(n)
+    ]
+    return ClassifiedSegment(
+        id="seg-1",
+        utterances=utterances,
+        start_time=0.0,
+        end_time=float(n),
+        duration=float(n),
+        source_file="a.wav",
+        scene=SceneType.CHAT,
+        confidence=0.8,
+    )
+
+
+def test_value_detector_parses_score_and_tags(tmp_path: Path) -> None:
+    prompt_path = tmp_path / "value_detector.txt"
+    prompt_path.write_text("{{transcript}}", encoding="utf-8")
+
+    llm = _FakeLLM('{"has_value": true, "value_score": 0.8, "value_tags": ["技术讨论"]}')
+    detector = ValueDetector(prompt_path=prompt_path, llm=llm)
+
+    out = asyncio.run(detector.detect(_chat_segment(3)))
+
+    assert out.segment_id == "seg-1"
+    assert out.has_value is True
+    assert out.value_score == 0.8
+    assert out.value_tags == ["技术讨论"]
+    assert out.sample_tokens > 0
+
+
+def test_value_detector_falls_back_to_has_value(tmp_path: Path) -> None:
+    prompt_path = tmp_path / "value_detector.txt"
+    prompt_path.write_text("{{transcript}}", encoding="utf-8")
+
+    llm = _FakeLLM('{"has_value": false, "value_tags": [], "valuable_segments": []}')
+    detector = ValueDetector(prompt_path=prompt_path, llm=llm)
+
+    out = asyncio.run(detector.detect(_chat_segment(3)))
+
+    assert out.value_score == 0.0
+
+
+def test_value_detector_sample_respects_token_budget(tmp_path: Path) -> None:
+    prompt_path = tmp_path / "value_detector.txt"
+    prompt_path.write_text("{{transcript}}", encoding="utf-8")
+
+    llm = _FakeLLM('{"has_value": false}')
+    detector = ValueDetector(prompt_path=prompt_path, llm=llm, sample_token_budget=100)
+
+    out = asyncio.run(detector.detect(_chat_segment(200)))
+
+    assert out.sample_tokens <= 100
+    assert llm.last_prompt is not None
+    # 均匀采样：不只取开头
+    assert "utterance number 0 " in llm.last_prompt
+    assert "utterance number 1 " not in llm.last_prompt
+
+
+def test_value_detector_truncates_oversized_utterance(tmp_path: Path) -> None:
+    prompt_path = tmp_path / "value_detector.txt"
+    prompt_path.write_text("{{transcript}}", encoding="utf-8")
+
+    llm = _FakeLLM('{"has_value": false}')
+    detector = ValueDetector(prompt_path=prompt_path, llm=llm, sample_token_budget=100)
+    segment = _chat_segment(200)
+    # 开头一条独白远超预算：旧实现遇到它就停止，采样为空
+    segment.utterances[0].text = "很长的一段独白" * 200
+
+    out = asyncio.run(detector.detect(segment))
+
+    assert 0 < out.sample_tokens <= 100
+    assert llm.last_prompt is not None
+    assert "很长的一段独白" in llm.last_prompt
+    # 截断后仍保留后续均匀采样点
+    assert "utterance number 138 " in llm.last_prompt
+
+
+def test_value_detector_counts_instructions_and_completion(tmp_path: Path) -> None:
+    prompt_path = tmp_path / "value_detector.txt"
+    instructions = "判断这段闲聊是否有价值，输出 JSON。\n"
+    prompt_path.write_text(instructions + "{{transcript}}", encoding="utf-8")
+
+    reply = '{"has_value": false}'
+    detector = ValueDetector(prompt_path=prompt_path, llm=_FakeLLM(reply))
+
+    out = asyncio.run(detector.detect(_chat_segment(3)))
+
+    assert out.prompt_tokens > out.sample_tokens
+    assert out.completion_tokens == estimate_tokens(reply)
+    assert out.tokens_spent == out.prompt_tokens + out.completion_tokens
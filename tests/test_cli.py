@@ -90,11 +90,15 @@ def test_cli_process_uses_pipeline(monkeypatch, tmp_path: Path) -> None:
     class _FakePipeline:
         def __init__(self) -> None:
             self.called = False
+            self.closed = False
 
         async def process(self, audio_path: Path):
             self.called = True
             return []
 
+        def close(self) -> None:
+            self.closed = True
+
     fake = _FakePipeline()
 
     monkeypatch.setattr(cli, "create_pipeline", lambda config: fake)
@@ -103,6 +107,7 @@ def test_cli_process_uses_pipeline(monkeypatch, tmp_path: Path) -> None:
     res = runner.invoke(cli.main, ["--config", str(cfg), "process", str(wav)])
     assert res.exit_code == 0
     assert fake.called is True
+    assert fake.closed is True
 
 
 def test_cli_status_shows_today_archive_count(monkeypatch, tmp_path: Path) -> None:
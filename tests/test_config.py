@@ -2,7 +2,10 @@ from __future__ import annotations
 
 from pathlib import Path
 
-from audio_journal.config import load_config
+import pytest
+from pydantic import ValidationError
+
+from audio_journal.config import PreviewConfig, load_config
 
 
 def test_load_config_defaults_and_paths(tmp_path: Path) -> None:
@@ -48,3 +51,9 @@ llm:
     cfg = load_config(cfg_path)
     assert cfg.llm.api_key_env == "TEST_LLM_API_KEY"
     assert cfg.llm.get_api_key() == "secret"
+
+
+def test_preview_deep_hours_must_be_valid_hours() -> None:
+    assert PreviewConfig(deep_hours=[0, 2, 23]).deep_hours == [0, 2, 23]
+    with pytest.raises(ValidationError, match="0-23"):
+        PreviewConfig(deep_hours=[1, 24])
@@ -0,0 +1,123 @@
+from __future__ import annotations
+
+import wave
+from pathlib import Path
+
+import numpy as np
+
+from audio_journal.diarization.global_diarizer import (
+    GlobalDiarizer,
+    SpeakerEmbedder,
+    _assign,
+    _fill_labels,
+    cluster_embeddings,
+)
+from audio_journal.models.schemas import Speaker, Utterance
+
+_RATE = 16000
+
+
+def _write_wav(path: Path, seconds: float) -> None:
+    with wave.open(str(path), "wb") as wf:
+        wf.setnchannels(1)
+        wf.setsampwidth(2)
+        wf.setframerate(_RATE)
+        wf.writeframes(b"\x00\x00" * int(seconds * _RATE))
+
+
+def _utt(spk: str, start: float, end: float) -> Utterance:
+    return Utterance(speaker=Speaker(id=spk), text="x", start_time=start, end_time=end)
+
+
+class _TableEmbedder(SpeakerEmbedder):
+    """按片段长度查表返回 embedding，长度（采样点数）即"说话人"。"""
+
+    def __init__(self, table: dict[int, list[float]]) -> None:
+        self.table = table
+        self.calls = 0
+
+    def embed(self, clips, sample_rate):
+        self.calls += 1
+        return np.asarray([self.table[len(c)] for c in clips], dtype=np.float32)
+
+
+def test_cluster_embeddings_groups_by_cosine_similarity() -> None:
+    rng = np.random.default_rng(0)
+    a, b, c = np.eye(3, 16)
+    rows = [v + rng.normal(0, 0.05, 16) for v in (a, b, a, c, b, a, c)]
+
+    labels = cluster_embeddings(np.asarray(rows), threshold=0.6)
+
+    assert labels.tolist() == [0, 1, 0, 2, 1, 0, 2]
+
+
+def test_cluster_embeddings_merges_clusters_above_threshold() -> None:
+    # 逐个 leader 聚类时第二个向量会另起一簇，合并阶段应并回
+    rows = np.asarray([[1.0, 0.0], [0.5, 0.5], [0.0, 1.0], [0.7, 0.7]])
+
+    labels = cluster_embeddings(rows, threshold=0.5)
+
+    assert len(set(labels.tolist())) == 1
+
+
+def test_assign_skips_empty_clusters_even_when_all_similarities_negative() -> None:
+    x = np.asarray([[-1.0, 0.0]])
+    c = np.asarray([[1.0, 0.0], [0.0, 0.0]])
+
+    assert _assign(x, c, np.asarray([True, False])).tolist() == [0]
+
+
+def test_fill_labels_uses_nearest_clustered_neighbour() -> None:
+    def _u(start: float, end: float) -> Utterance:
+        return Utterance(speaker=Speaker(id="X"), text="", start_time=start, end_time=end)
+
+    utts = [_u(0, 1), _u(1, 2), _u(2, 3), _u(10, 11), _u(15, 16), _u(20, 21), _u(30, 31)]
+    known = {0: 0, 3: 1, 5: 2}
+
+    # 4 与 3、5 等距时取前一个；6 之后没有已聚类邻居，取前一个
+    assert _fill_labels(utts, known) == [0, 0, 0, 1, 1, 2, 2]
+    assert _fill_labels(utts, {}) == [None] * len(utts)
+
+
+def test_global_diarizer_keeps_speaker_ids_consistent_across_chunks(tmp_path: Path) -> None:
+    for name in ("a.wav", "b.wav"):
+        _write_wav(tmp_path / name, 10.0)
+    # 1s 片段 → 说话人甲，2s 片段 → 说话人乙
+    embedder = _TableEmbedder({_RATE: [1.0, 0.0], 2 * _RATE: [0.0, 1.0]})
+    diarizer = GlobalDiarizer(embedder, threshold=0.6)
+
+    transcripts = [
+        (tmp_path / "a.wav", [_utt("SPEAKER_00", 0.0, 1.0), _utt("SPEAKER_01", 2.0, 4.0)]),
+        # 第二个 chunk 内 cam++ 会把编号反过来
+        (tmp_path / "b.wav", [_utt("SPEAKER_00", 0.0, 2.0), _utt("SPEAKER_01", 3.0, 4.0)]),
+    ]
+    out = diarizer.diarize(transcripts)
+
+    assert [[u.speaker.id for u in utts] for utts in out] == [
+        ["SPEAKER_00", "SPEAKER_01"],
+        ["SPEAKER_01", "SPEAKER_00"],
+    ]
+    assert embedder.calls == 2
+    assert (diarizer.last_regions, diarizer.last_speakers) == (4, 2)
+
+
+def test_global_diarizer_assigns_short_utterances_to_nearest_neighbour(tmp_path: Path) -> None:
+    _write_wav(tmp_path / "a.wav", 10.0)
+    embedder = _TableEmbedder({_RATE: [1.0, 0.0], 2 * _RATE: [0.0, 1.0]})
+    diarizer = GlobalDiarizer(embedder, threshold=0.6, min_region_s=0.5)
+
+    utts = [
+        _utt("SPEAKER_00", 0.0, 1.0),
+        _utt("SPEAKER_00", 1.1, 1.3),  # 过短，归到相邻的 0.0-1.0
+        _utt("SPEAKER_01", 5.0, 7.0),
+        _utt("SPEAKER_00", 7.2, 7.4),  # 过短，归到相邻的 5.0-7.0
+    ]
+    out = diarizer.diarize([(tmp_path / "a.wav", utts)])
+
+    assert [u.speaker.id for u in out[0]] == [
+        "SPEAKER_00",
+        "SPEAKER_00",
+        "SPEAKER_01",
+        "SPEAKER_01",
+    ]
+    assert diarizer.last_regions == 2
@@ -262,3 +262,38 @@ def test_partial_merge():
     assert result[0].original_segment_ids == ["seg1", "seg2"]
     assert isinstance(result[1], ClassifiedSegment)
     assert result[1].id == "seg3"
+
+
+def _utts(*starts: float) -> list[Utterance]:
+    return [
+        Utterance(speaker=Speaker(id="SPEAKER_00"), text=f"{s}", start_time=s, end_time=s + 0.5)
+        for s in starts
+    ]
+
+
+def test_merge_utterances_concatenates_ordered_runs_by_reference() -> None:
+    from audio_journal.merger.segment_merger import merge_utterances
+
+    runs = [_utts(0, 1, 2), [], _utts(5, 6), _utts(6, 9)]
+
+    merged = merge_utterances(runs)
+
+    assert [u.start_time for u in merged] == [0, 1, 2, 5, 6, 6, 9]
+    assert merged[4] is runs[2][1] and merged[5] is runs[3][0]
+
+
+def test_merge_utterances_matches_stable_sort_for_overlapping_runs() -> None:
+    import random
+
+    from audio_journal.merger.segment_merger import merge_utterances
+
+    rng = random.Random(11)
+    runs = [
+        _utts(*sorted(round(rng.uniform(0, 50), 1) for _ in range(rng.randint(0, 30))))
+        for _ in range(6)
+    ]
+
+    expected = sorted((u for r in runs for u in r), key=lambda u: u.start_time)
+    merged = merge_utterances(runs)
+
+    assert [id(u) for u in merged] == [id(u) for u in expected]
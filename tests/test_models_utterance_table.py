@@ -0,0 +1,25 @@
+from __future__ import annotations
+
+from audio_journal.models.schemas import Speaker, Utterance
+from audio_journal.models.utterance_table import UtteranceTable
+
+
+def _utt(start: float, end: float, text: str, spk: str = "SPEAKER_00") -> Utterance:
+    return Utterance(speaker=Speaker(id=spk), text=text, start_time=start, end_time=end)
+
+
+def test_round_trip_preserves_fields_and_interns_speakers() -> None:
+    utts = [
+        _utt(0.0, 1.0, "你好", "SPEAKER_00"),
+        _utt(1.0, 2.5, "", "SPEAKER_01"),
+        _utt(3.0, 4.0, "再见。", "SPEAKER_00"),
+    ]
+
+    table = UtteranceTable.from_utterances(utts)
+    out = table.to_utterances()
+
+    assert len(table) == 3
+    assert [u.model_dump() for u in out] == [u.model_dump() for u in utts]
+    assert len(table.speakers) == 2
+    assert out[0].speaker is out[2].speaker
+    assert [u.text for u in table.to_utterances(1, 3)] == ["", "再见。"]
@@ -3,6 +3,8 @@ from __future__ import annotations
 import asyncio
 from pathlib import Path
 
+from audio_journal.asr.cache import CachedASREngine
+from audio_journal.asr.supervisor import ASRWorkerError
 from audio_journal.config import load_config
 from audio_journal.models.schemas import (
     AnalysisResult,
@@ -251,3 +253,540 @@ archive:
     assert meeting_analyzer.calls == ["seg-hi-1"]
     assert segmenter.source_files == ["in.wav", "in.wav"]
     assert archiver.source_file == "in.wav"
+
+
+def test_pipeline_memory_budget_switches_chunker_to_low_memory(tmp_path: Path) -> None:
+    import wave
+
+    cfg_path = tmp_path / "config.yaml"
+    cfg_path.write_text(
+        f"""
+paths:
+  processing: {tmp_path.as_posix()}/processing
+  prompts: {tmp_path.as_posix()}/prompts
+memory:
+  enabled: true
+  budget_mb: 1
+""".lstrip(),
+        encoding="utf-8",
+    )
+    cfg = load_config(cfg_path)
+
+    class _SpyChunker:
+        def __init__(self) -> None:
+            self.low_memory: bool | None = None
+
+        def estimate_memory(self, audio_path) -> int:
+            return 1024
+
+        def split(self, audio_path, output_dir, *, low_memory: bool = False):
+            self.low_memory = low_memory
+            return _FakeChunker().split(audio_path, output_dir)
+
+    chunker = _SpyChunker()
+    pipe = Pipeline(
+        cfg,
+        chunker=chunker,
+        asr=_FakeASR(),
+        segmenter=_FakeSegmenter(),
+        classifier=_FakeClassifier(),
+        meeting_analyzer=_FakeMeetingAnalyzer(),
+        archiver=_FakeArchiver(),
+    )
+
+    audio = tmp_path / "in.wav"
+    with wave.open(str(audio), "wb") as wf:
+        wf.setparams((1, 2, 8000, 0, "NONE", "not compressed"))
+
+    asyncio.run(pipe.process(audio))
+
+    # 1MB 预算必然低于进程当前 RSS
+    assert chunker.low_memory is True
+    assert pipe.last_stats.low_memory_chunking is True
+    assert {"chunk", "asr", "classify", "analyze", "archive"} <= set(
+        pipe.last_stats.stage_peak_rss_mb
+    )
+
+
+def test_pipeline_batches_chunks_through_transcribe_many(tmp_path: Path) -> None:
+    cfg_path = tmp_path / "config.yaml"
+    cfg_path.write_text(
+        f"""
+asr:
+  chunks_per_call: 2
+paths:
+  processing: {tmp_path.as_posix()}/processing
+  prompts: {tmp_path.as_posix()}/prompts
+merger:
+  enabled: false
+""".lstrip(),
+        encoding="utf-8",
+    )
+    cfg = load_config(cfg_path)
+
+    class _ThreeChunks:
+        def split(self, audio_path, output_dir):
+            paths = [Path(output_dir) / f"chunk_00{i}.wav" for i in (1, 2, 3)]
+            return [type("C", (), {"path": p})() for p in paths]
+
+    class _BatchASR:
+        def __init__(self) -> None:
+            self.calls: list[list[str]] = []
+
+        def transcribe(self, audio_path: str):
+            self.calls.append([Path(audio_path).name])
+            return _FakeASR().transcribe(audio_path)
+
+        def transcribe_many(self, audio_paths: list[str]):
+            self.calls.append([Path(p).name for p in audio_paths])
+            return [_FakeASR().transcribe(p) for p in audio_paths]
+
+    asr = _BatchASR()
+    pipe = Pipeline(
+        cfg,
+        chunker=_ThreeChunks(),
+        asr=asr,
+        segmenter=_FakeSegmenter(),
+        classifier=_FakeClassifier(),
+        meeting_analyzer=_FakeMeetingAnalyzer(),
+        archiver=_FakeArchiver(),
+    )
+
+    audio = tmp_path / "in.wav"
+    audio.write_bytes(b"x")
+    results = asyncio.run(pipe.process(audio))
+
+    assert asr.calls == [["chunk_001.wav", "chunk_002.wav"], ["chunk_003.wav"]]
+    # 每个 chunk 两个片段
+    assert len(results) == 6
+
+
+def test_pipeline_skips_chunk_when_asr_worker_fails(tmp_path: Path) -> None:
+    cfg_path = tmp_path / "config.yaml"
+    cfg_path.write_text(
+        f"""
+paths:
+  processing: {tmp_path.as_posix()}/processing
+  prompts: {tmp_path.as_posix()}/prompts
+merger:
+  enabled: false
+""".lstrip(),
+        encoding="utf-8",
+    )
+    cfg = load_config(cfg_path)
+
+    class _TwoChunks:
+        def split(self, audio_path, output_dir):
+            paths = [Path(output_dir) / f"chunk_00{i}.wav" for i in (1, 2)]
+            return [type("C", (), {"path": p})() for p in paths]
+
+    class _FlakyASR(_FakeASR):
+        def transcribe(self, audio_path: str):
+            if audio_path.endswith("chunk_001.wav"):
+                raise ASRWorkerError("timeout")
+            return super().transcribe(audio_path)
+
+    pipe = Pipeline(
+        cfg,
+        chunker=_TwoChunks(),
+        asr=_FlakyASR(),
+        segmenter=_FakeSegmenter(),
+        classifier=_FakeClassifier(),
+        meeting_analyzer=_FakeMeetingAnalyzer(),
+        archiver=_FakeArchiver(),
+    )
+    audio = tmp_path / "in.wav"
+    audio.write_bytes(b"x")
+    results = asyncio.run(pipe.process(audio))
+
+    assert len(results) == 2
+    assert pipe.last_stats.asr_failed_chunks == 1
+
+
+def test_pipeline_records_per_chunk_asr_metrics(tmp_path: Path) -> None:
+    import json
+    import wave
+
+    cfg_path = tmp_path / "config.yaml"
+    cfg_path.write_text(
+        f"""
+asr:
+  metrics:
+    enabled: true
+    path: {tmp_path.as_posix()}/asr.jsonl
+paths:
+  processing: {tmp_path.as_posix()}/processing
+  prompts: {tmp_path.as_posix()}/prompts
+merger:
+  enabled: false
+""".lstrip(),
+        encoding="utf-8",
+    )
+    cfg = load_config(cfg_path)
+
+    class _WavChunker:
+        def split(self, audio_path, output_dir):
+            out = Path(output_dir)
+            out.mkdir(parents=True, exist_ok=True)
+            chunks = []
+            for i, seconds in enumerate((2.0, 4.0), start=1):
+                p = out / f"chunk_00{i}.wav"
+                with wave.open(str(p), "wb") as wf:
+                    wf.setnchannels(1)
+                    wf.setsampwidth(2)
+                    wf.setframerate(16000)
+                    wf.writeframes(b"\x00\x00" * int(16000 * seconds))
+                chunks.append(type("C", (), {"path": p})())
+            return chunks
+
+    class _StatusASR(_FakeASR):
+        def __init__(self) -> None:
+            self.last_diarization: dict[str, str] = {}
+
+        def transcribe(self, audio_path: str):
+            status = "fallback" if audio_path.endswith("chunk_002.wav") else "ok"
+            self.last_diarization = {audio_path: status}
+            return super().transcribe(audio_path)
+
+    pipe = Pipeline(
+        cfg,
+        chunker=_WavChunker(),
+        asr=_StatusASR(),
+        segmenter=_FakeSegmenter(),
+        classifier=_FakeClassifier(),
+        meeting_analyzer=_FakeMeetingAnalyzer(),
+        archiver=_FakeArchiver(),
+    )
+    audio = tmp_path / "in.wav"
+    audio.write_bytes(b"x")
+    asyncio.run(pipe.process(audio))
+
+    stats = pipe.last_stats
+    assert (stats.asr_chunks, stats.asr_audio_s) == (2, 6.0)
+    assert stats.asr_diarization_fallbacks == 1
+    assert stats.asr_rtf == stats.asr_wall_s / 6.0
+
+    records = [json.loads(line) for line in (tmp_path / "asr.jsonl").read_text().splitlines()]
+    assert [(r["chunk"], r["audio_s"], r["utterances"]) for r in records] == [
+        ("chunk_001.wav", 2.0, 2),
+        ("chunk_002.wav", 4.0, 2),
+    ]
+    assert {r["source"] for r in records} == {"in.wav"}
+
+
+def test_pipeline_reports_asr_cache_hit_rate(tmp_path: Path) -> None:
+    cfg_path = tmp_path / "config.yaml"
+    cfg_path.write_text(
+        f"""
+paths:
+  processing: {tmp_path.as_posix()}/processing
+  prompts: {tmp_path.as_posix()}/prompts
+merger:
+  enabled: false
+""".lstrip(),
+        encoding="utf-8",
+    )
+    cfg = load_config(cfg_path)
+
+    class _CountingASR(_FakeASR):
+        def __init__(self) -> None:
+            self.calls = 0
+
+        def transcribe(self, audio_path: str):
+            self.calls += 1
+            return super().transcribe(audio_path)
+
+    inner = _CountingASR()
+    asr = CachedASREngine(inner, tmp_path / "asr_cache", fingerprint="test", max_bytes=1 << 20)
+    pipe = Pipeline(
+        cfg,
+        chunker=_FakeChunker(),
+        asr=asr,
+        segmenter=_FakeSegmenter(),
+        classifier=_FakeClassifier(),
+        meeting_analyzer=_FakeMeetingAnalyzer(),
+        archiver=_FakeArchiver(),
+    )
+    audio = tmp_path / "in.wav"
+    audio.write_bytes(b"x")
+
+    asyncio.run(pipe.process(audio))
+    assert pipe.last_stats.asr_cache_misses == 1
+    asyncio.run(pipe.process(audio))
+
+    assert inner.calls == 1
+    assert (pipe.last_stats.asr_cache_hits, pipe.last_stats.asr_cache_misses) == (1, 0)
+    assert pipe.last_stats.asr_cache_hit_rate == 1.0
+
+
+def test_pipeline_close_shuts_down_wrapped_asr(tmp_path: Path) -> None:
+    class _ClosableASR(_FakeASR):
+        def __init__(self) -> None:
+            self.closed = False
+
+        def close(self) -> None:
+            self.closed = True
+
+    cfg_path = tmp_path / "config.yaml"
+    cfg_path.write_text(f"paths:\n  processing: {tmp_path.as_posix()}/processing\n", "utf-8")
+    inner = _ClosableASR()
+    asr = CachedASREngine(inner, tmp_path / "asr_cache", fingerprint="test", max_bytes=1 << 20)
+    pipe = Pipeline(
+        load_config(cfg_path),
+        chunker=_FakeChunker(),
+        asr=asr,
+        segmenter=_FakeSegmenter(),
+        classifier=_FakeClassifier(),
+        meeting_analyzer=_FakeMeetingAnalyzer(),
+        archiver=_FakeArchiver(),
+    )
+    pipe.close()
+
+    assert inner.closed is True
+
+
+def test_pipeline_relabels_speakers_across_chunks_before_segmenting(tmp_path: Path) -> None:
+    cfg_path = tmp_path / "config.yaml"
+    cfg_path.write_text(
+        f"""
+paths:
+  processing: {tmp_path.as_posix()}/processing
+  prompts: {tmp_path.as_posix()}/prompts
+merger:
+  enabled: false
+""".lstrip(),
+        encoding="utf-8",
+    )
+    cfg = load_config(cfg_path)
+
+    class _TwoChunks:
+        def split(self, audio_path, output_dir):
+            paths = [Path(output_dir) / f"chunk_00{i}.wav" for i in (1, 2)]
+            return [type("C", (), {"path": p})() for p in paths]
+
+    class _FakeDiarizer:
+        last_regions = 4
+        last_speakers = 1
+
+        def __init__(self) -> None:
+            self.seen: list[str] = []
+
+        def diarize(self, transcripts):
+            self.seen = [Path(p).name for p, _ in transcripts]
+            return [
+                [u.model_copy(update={"speaker": Speaker(id="SPEAKER_07")}) for u in utts]
+                for _, utts in transcripts
+            ]
+
+    class _RecordingSegmenter(_FakeSegmenter):
+        def __init__(self) -> None:
+            self.speakers: list[str] = []
+
+        def segment(self, utterances, source_file: str):
+            self.speakers.extend(u.speaker.id for u in utterances)
+            return super().segment(utterances, source_file)
+
+    diarizer = _FakeDiarizer()
+    segmenter = _RecordingSegmenter()
+    pipe = Pipeline(
+        cfg,
+        chunker=_TwoChunks(),
+        asr=_FakeASR(),
+        segmenter=segmenter,
+        classifier=_FakeClassifier(),
+        meeting_analyzer=_FakeMeetingAnalyzer(),
+        archiver=_FakeArchiver(),
+        diarizer=diarizer,
+    )
+    audio = tmp_path / "in.wav"
+    audio.write_bytes(b"x")
+    asyncio.run(pipe.process(audio))
+
+    assert diarizer.seen == ["chunk_001.wav", "chunk_002.wav"]
+    assert set(segmenter.speakers) == {"SPEAKER_07"}
+    assert (pipe.last_stats.diarization_regions, pipe.last_stats.diarization_speakers) == (4, 1)
+
+
+def test_pipeline_process_stream_classifies_segments_as_they_close(tmp_path: Path) -> None:
+    cfg_path = tmp_path / "config.yaml"
+    cfg_path.write_text(
+        f"""
+paths:
+  processing: {tmp_path.as_posix()}/processing
+  prompts: {tmp_path.as_posix()}/prompts
+segmenter:
+  min_silence_gap: 30
+  min_segment_duration: 0
+merger:
+  enabled: false
+""".lstrip(),
+        encoding="utf-8",
+    )
+    cfg = load_config(cfg_path)
+
+    classified: list[list[str]] = []
+
+    def _utt(text: str, start: float) -> Utterance:
+        return Utterance(
+            speaker=Speaker(id="SPEAKER_00"), text=text, start_time=start, end_time=start + 2
+        )
+
+    class _StreamingASR:
+        def transcribe(self, audio_path: str):
+            raise AssertionError("流式模式不应调用 transcribe")
+
+        def transcribe_stream(self, audio_path: str, *, follow: bool, idle_seconds: float):
+            assert follow
+            yield _utt("a", 0.0)
+            yield _utt("b", 5.0)
+            assert classified == []
+            yield _utt("c", 60.0)
+            # 长静音后的第一句到达时，前一个片段已经闭合并完成分类
+            assert classified == [["a", "b"]]
+            yield _utt("d", 63.0)
+
+    class _CaptureClassifier(_FakeClassifier):
+        async def classify(self, seg: Segment) -> ClassifiedSegment:
+            classified.append([u.text for u in seg.utterances])
+            return await super().classify(seg)
+
+    archiver = _FakeArchiver()
+    pipe = Pipeline(
+        cfg,
+        chunker=_FakeChunker(),
+        asr=_StreamingASR(),
+        classifier=_CaptureClassifier(),
+        meeting_analyzer=_FakeMeetingAnalyzer(),
+        archiver=archiver,
+    )
+
+    results = asyncio.run(pipe.process_stream(tmp_path / "rec.wav"))
+
+    assert classified == [["a", "b"], ["c", "d"]]
+    assert len(results) == 2
+    assert len(archiver.archived) == 2
+
+
+def test_pipeline_process_stream_unwraps_cache_and_keeps_loop_responsive(
+    tmp_path: Path,
+) -> None:
+    import time
+
+    cfg_path = tmp_path / "config.yaml"
+    cfg_path.write_text(
+        f"paths:\n  processing: {tmp_path.as_posix()}/processing\n"
+        "segmenter:\n  min_segment_duration: 0\nmerger:\n  enabled: false\n",
+        encoding="utf-8",
+    )
+    cfg = load_config(cfg_path)
+
+    class _SlowStreamingASR:
+        def transcribe(self, audio_path: str):
+            raise AssertionError("流式模式不应调用 transcribe")
+
+        def transcribe_stream(self, audio_path: str, *, follow: bool, idle_seconds: float):
+            for i in range(3):
+                time.sleep(0.05)  # 模拟阻塞等待文件增长
+                yield Utterance(
+                    speaker=Speaker(id="SPEAKER_00"),
+                    text=str(i),
+                    start_time=i * 2.0,
+                    end_time=i * 2.0 + 1,
+                )
+
+    asr = CachedASREngine(
+        _SlowStreamingASR(), tmp_path / "asr_cache", fingerprint="t", max_bytes=1 << 20
+    )
+    pipe = Pipeline(
+        cfg,
+        chunker=_FakeChunker(),
+        asr=asr,
+        classifier=_FakeClassifier(),
+        meeting_analyzer=_FakeMeetingAnalyzer(),
+        archiver=_FakeArchiver(),
+    )
+
+    async def _run() -> tuple[list, int]:
+        ticks = 0
+        done = False
+
+        async def _ticker() -> None:
+            nonlocal ticks
+            while not done:
+                ticks += 1
+                await asyncio.sleep(0.01)
+
+        task = asyncio.create_task(_ticker())
+        results = await pipe.process_stream(tmp_path / "rec.wav")
+        done = True
+        await task
+        return results, ticks
+
+    results, ticks = asyncio.run(_run())
+
+    assert len(results) == 1
+    assert ticks >= 5
+
+
+def test_pipeline_counts_classifier_cache_hits(tmp_path: Path) -> None:
+    from audio_journal.classifier.cache import ClassificationCache
+    from audio_journal.classifier.scene import SceneClassifier
+
+    class _LLM:
+        calls = 0
+
+        async def complete(self, prompt: str, system: str = "", json_mode: bool = False) -> str:
+            _LLM.calls += 1
+            return '{"scene":"phone","confidence":0.8}'
+
+    prompt = tmp_path / "classifier.txt"
+    prompt.write_text("{{transcript}}", encoding="utf-8")
+    cache = ClassificationCache(tmp_path / "cls", fingerprint="f", ttl_s=60, max_entries=10)
+    cfg_path = tmp_path / "config.yaml"
+    cfg_path.write_text(f"paths:\n  processing: {tmp_path.as_posix()}/processing\n")
+    pipe = Pipeline(
+        load_config(cfg_path),
+        chunker=_FakeChunker(),
+        asr=_FakeASR(),
+        segmenter=_FakeSegmenter(),
+        classifier=SceneClassifier(prompt_path=prompt, llm=_LLM(), cache=cache),
+        meeting_analyzer=_FakeMeetingAnalyzer(),
+        archiver=_FakeArchiver(),
+    )
+    audio = tmp_path / "in.wav"
+    audio.write_bytes(b"x")
+
+    asyncio.run(pipe.process(audio))
+    first = pipe.last_stats
+    asyncio.run(pipe.process(audio))
+
+    # 两个片段采样相同：首轮一次未命中一次命中，次轮全部命中
+    assert (first.classifier_cache_hits, first.classifier_cache_misses) == (1, 1)
+    stats = pipe.last_stats
+    assert (stats.classifier_cache_hits, stats.classifier_cache_misses) == (2, 0)
+    assert _LLM.calls == 1
+
+
+def test_pipeline_reports_heuristic_cascade_stats(tmp_path: Path) -> None:
+    from audio_journal.classifier.heuristic import CascadeClassifier, HeuristicClassifier
+
+    cfg_path = tmp_path / "config.yaml"
+    cfg_path.write_text(f"paths:\n  processing: {tmp_path.as_posix()}/processing\n")
+    llm = _FakeClassifier()
+    pipe = Pipeline(
+        load_config(cfg_path),
+        chunker=_FakeChunker(),
+        asr=_FakeASR(),
+        segmenter=_FakeSegmenter(),
+        classifier=CascadeClassifier(HeuristicClassifier(), llm, threshold=0.0, shadow=True),
+        meeting_analyzer=_FakeMeetingAnalyzer(),
+        archiver=_FakeArchiver(),
+    )
+    audio = tmp_path / "in.wav"
+    audio.write_bytes(b"x")
+
+    asyncio.run(pipe.process(audio))
+
+    stats = pipe.last_stats
+    assert (stats.heuristic_checked, stats.heuristic_decided, stats.heuristic_compared) == (2, 2, 2)
+    assert stats.heuristic_decided_rate == 1.0
@@ -3,6 +3,7 @@ from __future__ import annotations
 import asyncio
 from pathlib import Path
 
+from audio_journal.archiver.local import LocalArchiver
 from audio_journal.config import load_config
 from audio_journal.models.schemas import (
     AnalysisResult,
@@ -197,3 +198,110 @@ merger:
     assert meeting_analyzer.calls == ["seg-1", "seg-2"]
     # 归档应该有 2 个结果
     assert len(archiver.archived) == 2
+
+
+class _FakeFusedClassifier:
+    """fused 模式：分类同时返回分析结果。"""
+
+    def __init__(self) -> None:
+        self.calls: list[str] = []
+
+    async def classify_and_analyze(self, seg: Segment):
+        self.calls.append(seg.id)
+        cseg = ClassifiedSegment(**seg.model_dump(), scene=SceneType.MEETING, confidence=0.9)
+        res = AnalysisResult(
+            segment_id=seg.id, scene=SceneType.MEETING, summary="fused", raw_text="x"
+        )
+        return cseg, res
+
+
+def _fused_config(tmp_path: Path, merger_enabled: bool, preview_enabled: bool = False):
+    cfg_path = tmp_path / "config.yaml"
+    cfg_path.write_text(
+        f"""
+paths:
+  processing: {tmp_path.as_posix()}/processing
+  prompts: {tmp_path.as_posix()}/prompts
+merger:
+  enabled: {str(merger_enabled).lower()}
+preview:
+  enabled: {str(preview_enabled).lower()}
+  queue_path: {tmp_path.as_posix()}/queue.jsonl
+""".lstrip(),
+        encoding="utf-8",
+    )
+    return load_config(cfg_path)
+
+
+def test_pipeline_fused_reanalyzes_only_merged_segments(tmp_path: Path) -> None:
+    """测试 fused 模式下仅合并后的片段会重新分析。"""
+    meeting_analyzer = _FakeMeetingAnalyzer()
+    fused = _FakeFusedClassifier()
+
+    pipe = Pipeline(
+        _fused_config(tmp_path, merger_enabled=True),
+        chunker=_FakeChunker(),
+        asr=_FakeASR(),
+        segmenter=_FakeSegmenter(),
+        classifier=_FakeClassifier(),
+        meeting_analyzer=meeting_analyzer,
+        archiver=_FakeArchiver(),
+        fused_classifier=fused,
+    )
+
+    audio = tmp_path / "in.wav"
+    audio.write_bytes(b"x")
+    results = asyncio.run(pipe.process(audio))
+
+    assert fused.calls == ["seg-1", "seg-2"]
+    assert meeting_analyzer.calls == ["merged-seg-1-seg-2"]
+    assert len(results) == 1
+    assert pipe.last_stats.fused_calls == 2
+    assert pipe.last_stats.fused_reanalyzed == 1
+
+
+def test_pipeline_fused_without_merge_skips_second_call(tmp_path: Path) -> None:
+    """测试 fused 模式下未合并的片段直接使用 fused 结果。"""
+    meeting_analyzer = _FakeMeetingAnalyzer()
+
+    pipe = Pipeline(
+        _fused_config(tmp_path, merger_enabled=False),
+        chunker=_FakeChunker(),
+        asr=_FakeASR(),
+        segmenter=_FakeSegmenter(),
+        classifier=_FakeClassifier(),
+        meeting_analyzer=meeting_analyzer,
+        archiver=_FakeArchiver(),
+        fused_classifier=_FakeFusedClassifier(),
+    )
+
+    audio = tmp_path / "in.wav"
+    audio.write_bytes(b"x")
+    results = asyncio.run(pipe.process(audio))
+
+    assert meeting_analyzer.calls == []
+    assert [r.summary for r in results] == ["fused", "fused"]
+    assert pipe.last_stats.fused_reanalyzed == 0
+
+
+def test_pipeline_fused_preview_deferred_merge_not_counted_as_reanalyzed(tmp_path: Path) -> None:
+    """测试 preview 延后深度分析的合并片段不计入 fused_reanalyzed。"""
+    meeting_analyzer = _FakeMeetingAnalyzer()
+
+    pipe = Pipeline(
+        _fused_config(tmp_path, merger_enabled=True, preview_enabled=True),
+        chunker=_FakeChunker(),
+        asr=_FakeASR(),
+        segmenter=_FakeSegmenter(),
+        classifier=_FakeClassifier(),
+        meeting_analyzer=meeting_analyzer,
+        archiver=LocalArchiver(base_dir=tmp_path / "archive"),
+        fused_classifier=_FakeFusedClassifier(),
+    )
+
+    audio = tmp_path / "in.wav"
+    audio.write_bytes(b"x")
+    asyncio.run(pipe.process(audio))
+
+    assert meeting_analyzer.calls == []
+    assert pipe.last_stats.fused_reanalyzed == 0
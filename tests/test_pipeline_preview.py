@@ -0,0 +1,156 @@
+from __future__ import annotations
+
+import asyncio
+from pathlib import Path
+
+from audio_journal.archiver.local import LocalArchiver
+from audio_journal.config import load_config
+from audio_journal.models.schemas import (
+    AnalysisResult,
+    ClassifiedSegment,
+    SceneType,
+    Segment,
+    Speaker,
+    Utterance,
+)
+from audio_journal.pipeline import Pipeline
+
+
+class _FakeChunker:
+    def split(self, audio_path: str | Path, output_dir: str | Path):
+        out_dir = Path(output_dir)
+        out_dir.mkdir(parents=True, exist_ok=True)
+        p = out_dir / "chunk_001.wav"
+        p.write_bytes(b"x")
+        return [type("C", (), {"path": p})()]
+
+
+class _FakeASR:
+    def transcribe(self, audio_path: str):
+        return [
+            Utterance(speaker=Speaker(id="SPEAKER_00"), text="hi", start_time=0.0, end_time=1.0),
+        ]
+
+
+class _FakeSegmenter:
+    def segment(self, utterances, source_file: str):
+        return [
+            Segment(
+                id=f"seg-{i}",
+                utterances=utterances,
+                start_time=float(i * 10),
+                end_time=float(i * 10 + 1),
+                duration=1.0,
+                source_file=source_file,
+            )
+            for i in range(2)
+        ]
+
+
+class _FakeClassifier:
+    async def classify(self, seg: Segment) -> ClassifiedSegment:
+        scene = SceneType.MEETING if seg.id == "seg-0" else SceneType.PHONE
+        return ClassifiedSegment(**seg.model_dump(), scene=scene, confidence=0.9)
+
+
+class _FakeMeetingAnalyzer:
+    def __init__(self) -> None:
+        self.calls: list[str] = []
+
+    async def analyze(self, seg) -> AnalysisResult:
+        self.calls.append(seg.id)
+        return AnalysisResult(
+            segment_id=seg.id,
+            scene=seg.scene,
+            summary="深度分析完成",
+            topics=["周会"],
+            raw_text="x",
+        )
+
+
+def _config(tmp_path: Path):
+    cfg_path = tmp_path / "config.yaml"
+    cfg_path.write_text(
+        f"""
+paths:
+  processing: {tmp_path.as_posix()}/processing
+  prompts: {tmp_path.as_posix()}/prompts
+merger:
+  enabled: false
+preview:
+  enabled: true
+  queue_path: {tmp_path.as_posix()}/queue.jsonl
+""".lstrip(),
+        encoding="utf-8",
+    )
+    return load_config(cfg_path)
+
+
+def test_preview_archives_immediately_and_defers_deep_analysis(tmp_path: Path) -> None:
+    cfg = _config(tmp_path)
+    meeting_analyzer = _FakeMeetingAnalyzer()
+    archiver = LocalArchiver(base_dir=tmp_path / "archive")
+
+    pipe = Pipeline(
+        cfg,
+        chunker=_FakeChunker(),
+        asr=_FakeASR(),
+        segmenter=_FakeSegmenter(),
+        classifier=_FakeClassifier(),
+        meeting_analyzer=meeting_analyzer,
+        archiver=archiver,
+    )
+
+    audio = tmp_path / "in.wav"
+    audio.write_bytes(b"x")
+    results = asyncio.run(pipe.process(audio))
+
+    # 预览阶段不调用 LLM 分析
+    assert meeting_analyzer.calls == []
+    assert len(results) == 2
+    entries = archiver.index.list()
+    assert [e.tier for e in entries] == ["preview", "final"]
+    assert pipe.last_stats.deep_queued == 1
+    assert len(pipe.deep_queue) == 1
+
+    upgraded = asyncio.run(pipe.run_deep_queue())
+
+    assert meeting_analyzer.calls == ["seg-0"]
+    assert len(upgraded) == 1
+    assert upgraded[0].id == entries[0].id
+    assert upgraded[0].archive_path == entries[0].archive_path
+    assert "深度分析完成" in Path(entries[0].archive_path).read_text(encoding="utf-8")
+    assert [e.tier for e in archiver.index.list()] == ["final", "final"]
+    assert len(pipe.deep_queue) == 0
+
+
+def test_deep_queue_skips_asr_and_drops_jobs_without_archive_entry(tmp_path: Path) -> None:
+    from audio_journal.storage.deep_queue import DeepAnalysisJob
+
+    cfg = _config(tmp_path)
+    meeting_analyzer = _FakeMeetingAnalyzer()
+    # 不注入 ASR：默认 mock 引擎缺少 fixture 时构建会失败，deep 不应触发构建
+    pipe = Pipeline(
+        cfg,
+        classifier=_FakeClassifier(),
+        meeting_analyzer=meeting_analyzer,
+        archiver=LocalArchiver(base_dir=tmp_path / "archive"),
+    )
+    seg = ClassifiedSegment(
+        id="seg-0",
+        utterances=_FakeASR().transcribe("x"),
+        start_time=0.0,
+        end_time=1.0,
+        duration=1.0,
+        source_file="a.wav",
+        scene=SceneType.MEETING,
+        confidence=0.9,
+    )
+    pipe.deep_queue.push(DeepAnalysisJob(entry_id="missing", segment=seg))
+
+    upgraded = asyncio.run(pipe.run_deep_queue())
+
+    assert upgraded == []
+    assert meeting_analyzer.calls == ["seg-0"]
+    assert len(pipe.deep_queue) == 0
+    assert pipe._asr is None
@@ -0,0 +1,152 @@
+from __future__ import annotations
+
+import asyncio
+from pathlib import Path
+
+from audio_journal.config import load_config
+from audio_journal.models.schemas import (
+    AnalysisResult,
+    ClassifiedSegment,
+    SceneType,
+    Segment,
+    Speaker,
+    Utterance,
+    ValueDetection,
+)
+from audio_journal.pipeline import Pipeline
+
+
+class _FakeChunker:
+    def split(self, audio_path: str | Path, output_dir: str | Path):
+        out_dir = Path(output_dir)
+        out_dir.mkdir(parents=True, exist_ok=True)
+        p = out_dir / "chunk_001.wav"
+        p.write_bytes(b"x")
+        return [type("C", (), {"path": p})()]
+
+
+class _FakeASR:
+    def transcribe(self, audio_path: str):
+        return [
+            Utterance(
+                speaker=Speaker(id="SPEAKER_00"),
+                text="最近怎么样" * 20,
+                start_time=0.0,
+                end_time=1.0,
+            )
+        ]
+
+
+class _FakeSegmenter:
+    def segment(self, utterances, source_file: str):
+        return [
+            Segment(
+                id=f"seg-{i}",
+                utterances=utterances,
+                start_time=float(i),
+                end_time=float(i) + 1.0,
+                duration=1.0,
+                source_file=source_file,
+            )
+            for i in range(2)
+        ]
+
+
+class _FakeClassifier:
+    async def classify(self, seg: Segment) -> ClassifiedSegment:
+        return ClassifiedSegment(**seg.model_dump(), scene=SceneType.CHAT, confidence=0.9)
+
+
+class _FakeValueDetector:
+    async def detect(self, seg) -> ValueDetection:
+        score = 0.9 if seg.id == "seg-0" else 0.1
+        return ValueDetection(
+            segment_id=seg.id,
+            has_value=score > 0.5,
+            value_score=score,
+            value_tags=["技术讨论"] if score > 0.5 else [],
+            sample_tokens=10,
+            prompt_tokens=30,
+            completion_tokens=5,
+        )
+
+
+class _FakeChatAnalyzer:
+    def __init__(self) -> None:
+        self.calls: list[str] = []
+
+    async def analyze(self, seg) -> AnalysisResult:
+        self.calls.append(seg.id)
+        return AnalysisResult(segment_id=seg.id, scene=seg.scene, summary="chat", raw_text="x")
+
+
+class _FakeArchiver:
+    def archive_all(self, results, *, source_file: str = ""):
+        return []
+
+
+def _config(tmp_path: Path, enabled: bool):
+    cfg_path = tmp_path / "config.yaml"
+    cfg_path.write_text(
+        f"""
+paths:
+  processing: {tmp_path.as_posix()}/processing
+  prompts: {tmp_path.as_posix()}/prompts
+merger:
+  enabled: false
+value_filter:
+  enabled: {str(enabled).lower()}
+  threshold: 0.5
+""".lstrip(),
+        encoding="utf-8",
+    )
+    return load_config(cfg_path)
+
+
+def _pipeline(cfg, chat_analyzer: _FakeChatAnalyzer, detector=None) -> Pipeline:
+    return Pipeline(
+        cfg,
+        chunker=_FakeChunker(),
+        asr=_FakeASR(),
+        segmenter=_FakeSegmenter(),
+        classifier=_FakeClassifier(),
+        meeting_analyzer=object(),
+        archiver=_FakeArchiver(),
+        value_detector=detector,
+        chat_analyzer=chat_analyzer,
+    )
+
+
+def test_value_filter_routes_only_high_value_chat(tmp_path: Path) -> None:
+    chat_analyzer = _FakeChatAnalyzer()
+    pipe = _pipeline(_config(tmp_path, True), chat_analyzer, _FakeValueDetector())
+
+    audio = tmp_path / "in.wav"
+    audio.write_bytes(b"x")
+    results = asyncio.run(pipe.process(audio))
+
+    assert chat_analyzer.calls == ["seg-0"]
+    filtered = next(r for r in results if r.segment_id == "seg-1")
+    assert filtered.summary == ""
+    assert filtered.metadata["value_filtered"] is True
+    assert filtered.metadata["prefilter_score"] == 0.1
+
+    stats = pipe.last_stats
+    assert stats.value_filter_checked == 2
+    assert stats.value_filter_passed == 1
+    # 计入完整 prompt 与返回，而不只是转写采样
+    assert stats.value_filter_tokens_spent == 70
+    assert stats.value_filter_tokens_saved > 0
+
+
+def test_value_filter_disabled_keeps_chat_passthrough(tmp_path: Path) -> None:
+    chat_analyzer = _FakeChatAnalyzer()
+    pipe = _pipeline(_config(tmp_path, False), chat_analyzer)
+
+    audio = tmp_path / "in.wav"
+    audio.write_bytes(b"x")
+    results = asyncio.run(pipe.process(audio))
+
+    assert chat_analyzer.calls == []
+    assert all(r.summary == "" for r in results)
+    assert pipe.last_stats.value_filter_checked == 0
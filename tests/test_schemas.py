@@ -56,3 +56,69 @@ def test_analysis_result_accepts_metadata() -> None:
         metadata={"a": {"b": [1, 2, 3]}, "x": ["y"]},
     )
     assert r.metadata["a"]["b"] == [1, 2, 3]
+
+
+def _day_segments(n_utterances: int, per_segment: int = 50) -> list[Segment]:
+    speakers = [Speaker(id=f"SPEAKER_{i:02d}") for i in range(4)]
+    segments = []
+    for lo in range(0, n_utterances, per_segment):
+        utts = [
+            Utterance(
+                speaker=speakers[i % 4],
+                text=f"第 {i} 句话，内容长度和真实转写差不多。",
+                start_time=float(i),
+                end_time=i + 0.8,
+            )
+            for i in range(lo, min(lo + per_segment, n_utterances))
+        ]
+        segments.append(
+            Segment(
+                id=f"seg-{lo}",
+                utterances=utts,
+                start_time=utts[0].start_time,
+                end_time=utts[-1].end_time,
+                duration=utts[-1].end_time - utts[0].start_time,
+                source_file="day.wav",
+            )
+        )
+    return segments
+
+
+def test_classified_from_segment_shares_utterances() -> None:
+    seg = _day_segments(10)[0]
+
+    cseg = ClassifiedSegment.from_segment(
+        seg, scene=SceneType.MEETING, confidence=0.9, value_tags=["x"]
+    )
+
+    assert cseg.utterances is seg.utterances
+    assert cseg == ClassifiedSegment(
+        **seg.model_dump(), scene=SceneType.MEETING, confidence=0.9, value_tags=["x"]
+    )
+    assert ClassifiedSegment.model_validate_json(cseg.model_dump_json()) == cseg
+
+
+def test_classified_from_segment_allocates_far_less_than_model_dump() -> None:
+    import tracemalloc
+
+    segments = _day_segments(10_000)
+
+    def peak(promote) -> int:
+        tracemalloc.start()
+        try:
+            out = [promote(s) for s in segments]
+            _, peak_bytes = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        assert len(out) == len(segments)
+        return peak_bytes
+
+    legacy = peak(
+        lambda s: ClassifiedSegment(**s.model_dump(), scene=SceneType.CHAT, confidence=0.5)
+    )
+    promoted = peak(
+        lambda s: ClassifiedSegment.from_segment(s, scene=SceneType.CHAT, confidence=0.5)
+    )
+
+    # 旧路径为每条 utterance 重建 dict 与对象；新路径只分配 200 个片段外壳
+    assert promoted * 20 < legacy
@@ -46,3 +46,92 @@ def test_segmenter_drops_too_short() -> None:
     ], source_file="c.wav")
 
     assert segs == []
+
+
+def test_segmenter_sorts_input() -> None:
+    cfg = SegmenterConfig(min_silence_gap=3.0, max_segment_duration=999.0, min_segment_duration=0.0)
+    utts = [_utt(10.0, 11.0, "c"), _utt(0.0, 1.0, "a"), _utt(1.5, 2.0, "b")]
+    seg = SilenceSegmenter(cfg)
+
+    segs = seg.segment(utts, source_file="d.wav")
+
+    assert [[u.text for u in s.utterances] for s in segs] == [["a", "b"], ["c"]]
+    assert segs[0].id == "d-0.00-2.00"
+
+
+def test_incremental_segmenter_emits_closed_segments_early() -> None:
+    cfg = SegmenterConfig(min_silence_gap=3.0, max_segment_duration=5.0, min_segment_duration=0.0)
+    inc = SilenceSegmenter(cfg).incremental("e.wav")
+
+    assert inc.feed([_utt(0.0, 1.0, "a"), _utt(1.5, 2.0, "b")]) == []
+    closed = inc.feed([_utt(10.0, 11.0, "c")])  # 长静音：a、b 所在片段闭合
+    assert [[u.text for u in s.utterances] for s in closed] == [["a", "b"]]
+    closed = inc.feed([_utt(11.5, 16.0, "d")])  # 超过最大时长：c 所在片段闭合
+    assert [[u.text for u in s.utterances] for s in closed] == [["c"]]
+    assert [[u.text for u in s.utterances] for s in inc.flush()] == [["d"]]
+    assert inc.flush() == []
+
+
+def test_incremental_segmenter_matches_batch_segment() -> None:
+    import random
+
+    rng = random.Random(3)
+    utts = []
+    t = 0.0
+    for i in range(300):
+        dur = rng.uniform(0.5, 4.0)
+        utts.append(_utt(t, t + dur, str(i), spk=f"SPEAKER_0{rng.randrange(3)}"))
+        t += dur + rng.choice([0.2, 0.5, 1.0, 4.0, 40.0])
+    cfg = SegmenterConfig(min_silence_gap=3.0, max_segment_duration=60.0, min_segment_duration=5.0)
+    seg = SilenceSegmenter(cfg)
+
+    inc = seg.incremental("f.wav")
+    streamed = []
+    for i in range(0, len(utts), 7):
+        streamed.extend(inc.feed(utts[i : i + 7]))
+    streamed.extend(inc.flush())
+
+    assert [s.model_dump() for s in streamed] == [
+        s.model_dump() for s in seg.segment(utts, source_file="f.wav")
+    ]
+
+
+def test_incremental_segmenter_keeps_late_utterances_ordered() -> None:
+    cfg = SegmenterConfig(min_silence_gap=3.0, max_segment_duration=99.0, min_segment_duration=0.0)
+    inc = SilenceSegmenter(cfg).incremental("g.wav")
+
+    inc.feed([_utt(0.0, 1.0, "a"), _utt(2.0, 3.0, "c")])
+    inc.feed([_utt(1.0, 1.5, "b")])
+
+    (seg,) = inc.flush()
+    assert [u.text for u in seg.utterances] == ["a", "b", "c"]
+    assert inc.late == []
+
+
+def test_incremental_segmenter_sets_aside_utterances_from_closed_segments() -> None:
+    cfg = SegmenterConfig(min_silence_gap=3.0, max_segment_duration=99.0, min_segment_duration=0.0)
+    inc = SilenceSegmenter(cfg).incremental("h.wav")
+
+    (first,) = inc.feed([_utt(0.0, 1.0, "a"), _utt(10.0, 11.0, "c"), _utt(12.0, 12.5, "e")])
+    # 0.5s 落在已闭合的第一个片段内；d 迟到但在当前片段内，且结束得比 e 晚
+    assert inc.feed([_utt(0.5, 0.8, "late"), _utt(11.5, 15.0, "d")]) == []
+    # 与 d 结束（15.0）的间隔不足 3s，不应分段
+    assert inc.feed([_utt(17.0, 18.0, "f")]) == []
+    (seg,) = inc.flush()
+
+    assert [u.text for u in inc.late] == ["late"]
+    assert (first.start_time, first.end_time) == (0.0, 1.0)
+    assert (seg.start_time, seg.end_time) == (10.0, 18.0)
+    assert [u.text for u in seg.utterances] == ["c", "d", "e", "f"]
+
+
+def test_segmenter_reuses_input_utterances() -> None:
+    cfg = SegmenterConfig(min_silence_gap=3.0, max_segment_duration=999.0, min_segment_duration=0.0)
+    utts = [_utt(0.0, 1.0, "a"), _utt(1.5, 2.0, "b"), _utt(10.0, 11.0, "c")]
+    seg = SilenceSegmenter(cfg)
+
+    segs = seg.segment(utts, source_file="e.wav")
+
+    flat = [u for s in segs for u in s.utterances]
+    assert len(flat) == 3 and all(u is v for u, v in zip(flat, utts))
+    assert [s.end_time for s in segs] == [2.0, 11.0]
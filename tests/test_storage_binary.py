@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+import pytest
+
+from audio_journal.models.schemas import (
+    ClassifiedSegment,
+    MergedSegment,
+    SceneType,
+    Segment,
+    Speaker,
+    Utterance,
+)
+from audio_journal.models.utterance_table import UtteranceTable
+from audio_journal.storage.binary import (
+    FORMAT_VERSION,
+    FormatError,
+    dumps_segments,
+    dumps_table,
+    loads_segments,
+    loads_table,
+)
+
+
+def _utt(start: float, text: str, spk: str = "SPEAKER_00", label: str | None = None) -> Utterance:
+    return Utterance(
+        speaker=Speaker(id=spk, label=label), text=text, start_time=start, end_time=start + 0.5
+    )
+
+
+def _segment(seg_id: str, utts: list[Utterance]) -> Segment:
+    return Segment(
+        id=seg_id,
+        utterances=utts,
+        start_time=utts[0].start_time,
+        end_time=utts[-1].end_time,
+        duration=utts[-1].end_time - utts[0].start_time,
+        source_file="a.wav",
+    )
+
+
+@pytest.mark.parametrize("compress", [False, True])
+def test_table_round_trip(compress: bool) -> None:
+    utts = [_utt(0.0, "你好", label="我"), _utt(1.0, "", label="我"), _utt(2.25, "再见。", "SPEAKER_01")]
+
+    data = dumps_table(UtteranceTable.from_utterances(utts), compress=compress)
+    table = loads_table(data)
+
+    assert [u.model_dump() for u in table.to_utterances()] == [u.model_dump() for u in utts]
+    assert len(table.speakers) == 2
+
+
+def test_empty_table_round_trip() -> None:
+    table = loads_table(dumps_table(UtteranceTable.from_utterances([])))
+
+    assert len(table) == 0
+    assert table.to_utterances() == []
+
+
+def test_segments_round_trip_keeps_classification_and_merge_metadata() -> None:
+    a = _segment("a-0.00-1.50", [_utt(0.0, "一"), _utt(1.0, "二")])
+    b = _segment("a-5.00-5.50", [_utt(5.0, "三", "SPEAKER_01")])
+    plain = _segment("a-9.00-9.50", [_utt(9.0, "四")])
+    classified = ClassifiedSegment.from_segment(
+        a, scene=SceneType.MEETING, confidence=0.8, value_tags=["决策"]
+    )
+    merged = MergedSegment(
+        id="merged-a-b",
+        scene=SceneType.MEETING,
+        utterances=a.utterances + b.utterances,
+        start_time=0.0,
+        end_time=5.5,
+        duration=5.5,
+        source_file="a.wav",
+        confidence=0.7,
+        original_segment_ids=[a.id, b.id],
+        gap_durations=[3.5],
+    )
+
+    out = loads_segments(dumps_segments([classified, merged, plain], compress=True))
+
+    assert [type(s) for s in out] == [ClassifiedSegment, MergedSegment, Segment]
+    assert out[0].model_dump() == classified.model_dump()
+    assert out[1].model_dump() == merged.model_dump()
+    assert out[2].model_dump() == plain.model_dump()
+
+
+def test_rejects_other_versions_and_corruption() -> None:
+    data = dumps_table(UtteranceTable.from_utterances([_utt(0.0, "x")]))
+
+    newer = bytearray(data)
+    newer[4:6] = (FORMAT_VERSION + 1).to_bytes(2, "little")
+    flipped = bytearray(data)
+    flipped[-1] ^= 0xFF
+
+    for bad in (b"", b"not a table", bytes(newer), bytes(flipped), data[:-3]):
+        with pytest.raises(FormatError):
+            loads_table(bad)
+    with pytest.raises(FormatError):
+        loads_segments(data)
@@ -0,0 +1,116 @@
+from __future__ import annotations
+
+import threading
+import time
+from pathlib import Path
+
+from audio_journal.models.schemas import (
+    ClassifiedSegment,
+    MergedSegment,
+    SceneType,
+    Speaker,
+    Utterance,
+)
+from audio_journal.storage.deep_queue import DeepAnalysisJob, JSONLDeepAnalysisQueue
+
+
+def _utterances() -> list[Utterance]:
+    return [Utterance(speaker=Speaker(id="SPEAKER_00"), text="hi", start_time=0.0, end_time=1.0)]
+
+
+def test_deep_queue_roundtrip_keeps_segment_type(tmp_path: Path) -> None:
+    q = JSONLDeepAnalysisQueue(tmp_path / "queue.jsonl")
+    classified = ClassifiedSegment(
+        id="seg-1",
+        utterances=_utterances(),
+        start_time=0.0,
+        end_time=1.0,
+        duration=1.0,
+        source_file="a.wav",
+        scene=SceneType.MEETING,
+        confidence=0.9,
+    )
+    merged = MergedSegment(
+        id="merged-a-b",
+        scene=SceneType.MEETING,
+        utterances=_utterances(),
+        start_time=0.0,
+        end_time=1.0,
+        duration=1.0,
+        source_file="a.wav",
+        confidence=0.9,
+        original_segment_ids=["a", "b"],
+        gap_durations=[0.0],
+    )
+
+    q.push(DeepAnalysisJob(entry_id="20260227-001", segment=classified))
+    q.push(DeepAnalysisJob(entry_id="20260227-002", segment=merged))
+
+    jobs = q.pending()
+    assert len(q) == 2
+    assert isinstance(jobs[0].segment, ClassifiedSegment)
+    assert isinstance(jobs[1].segment, MergedSegment)
+    assert jobs[1].segment.original_segment_ids == ["a", "b"]
+
+
+def test_deep_queue_remove(tmp_path: Path) -> None:
+    q = JSONLDeepAnalysisQueue(tmp_path / "queue.jsonl")
+    assert q.pending() == []
+
+    for i in range(3):
+        seg = ClassifiedSegment(
+            id=f"seg-{i}",
+            utterances=_utterances(),
+            start_time=0.0,
+            end_time=1.0,
+            duration=1.0,
+            source_file="a.wav",
+            scene=SceneType.CHAT,
+            confidence=0.5,
+        )
+        q.push(DeepAnalysisJob(entry_id=f"20260227-00{i}", segment=seg))
+
+    q.remove("20260227-001")
+    assert [j.entry_id for j in q.pending()] == ["20260227-000", "20260227-002"]
+
+    q.remove_many(["20260227-000", "20260227-002", "unknown"])
+    assert q.pending() == []
+
+
+def _job(entry_id: str) -> DeepAnalysisJob:
+    seg = ClassifiedSegment(
+        id=f"seg-{entry_id}",
+        utterances=_utterances(),
+        start_time=0.0,
+        end_time=1.0,
+        duration=1.0,
+        source_file="a.wav",
+        scene=SceneType.CHAT,
+        confidence=0.5,
+    )
+    return DeepAnalysisJob(entry_id=entry_id, segment=seg)
+
+
+def test_deep_queue_push_during_remove_is_not_lost(tmp_path: Path, monkeypatch) -> None:
+    path = tmp_path / "queue.jsonl"
+    consumer = JSONLDeepAnalysisQueue(path)
+    consumer.push(_job("a"))
+    consumer.push(_job("b"))
+
+    # 另一个进程的 pipeline 在 deep 命令读出队列、尚未替换文件时入队
+    producer = JSONLDeepAnalysisQueue(path)
+    pusher = threading.Thread(target=producer.push, args=(_job("c"),))
+    read_pending = consumer.pending
+
+    def _pending_then_race():
+        jobs = read_pending()
+        pusher.start()
+        time.sleep(0.2)
+        return jobs
+
+    monkeypatch.setattr(consumer, "pending", _pending_then_race)
+    consumer.remove_many(["a"])
+    pusher.join(timeout=5)
+    monkeypatch.undo()
+
+    assert [j.entry_id for j in consumer.pending()] == ["b", "c"]
@@ -0,0 +1,14 @@
+from __future__ import annotations
+
+from audio_journal.telemetry.accuracy import char_error_rate, edit_distance, normalize_for_cer
+
+
+def test_normalize_for_cer_drops_punctuation_and_whitespace() -> None:
+    assert normalize_for_cer("你好， 世界！ OK.") == "你好世界OK"
+
+
+def test_char_error_rate() -> None:
+    assert edit_distance("今天开会", "今天开会") == 0
+    assert edit_distance("今天开会", "明天会") == 2
+    assert char_error_rate("今天开会", "明天会") == 0.5
+    assert char_error_rate("", "多余") == 2.0
@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+import json
+import wave
+from pathlib import Path
+
+import pytest
+
+from audio_journal.telemetry.asr import (
+    ASRChunkMetrics,
+    JSONLMetricsSink,
+    group_metrics,
+    percentile,
+    wav_duration_s,
+)
+
+
+def _write_wav(path: Path, seconds: float) -> str:
+    with wave.open(str(path), "wb") as wf:
+        wf.setnchannels(1)
+        wf.setsampwidth(2)
+        wf.setframerate(16000)
+        wf.writeframes(b"\x00\x00" * int(16000 * seconds))
+    return str(path)
+
+
+def test_group_metrics_splits_batch_wall_time_by_audio_duration(tmp_path: Path) -> None:
+    paths = [_write_wav(tmp_path / "a.wav", 30.0), _write_wav(tmp_path / "b.wav", 10.0)]
+
+    records = group_metrics(
+        paths,
+        [[object()] * 3, [object()]],
+        wall_s=4.0,
+        diarization={paths[0]: "ok", paths[1]: "fallback"},
+        device="cpu",
+        engine="funasr",
+    )
+
+    assert [r.chunk for r in records] == ["a.wav", "b.wav"]
+    assert [r.wall_s for r in records] == [3.0, 1.0]
+    assert [r.rtf for r in records] == [pytest.approx(0.1), pytest.approx(0.1)]
+    assert [r.utterances for r in records] == [3, 1]
+    assert [r.diarization for r in records] == ["ok", "fallback"]
+    assert all(r.batch_size == 2 for r in records)
+
+
+def test_group_metrics_unknown_duration_and_status(tmp_path: Path) -> None:
+    (records,) = group_metrics(
+        [str(tmp_path / "x.mp3")], [[]], wall_s=2.0, diarization={}, device="mps", engine="x"
+    )
+
+    assert (records.audio_s, records.wall_s, records.rtf) == (0.0, 2.0, 0.0)
+    assert records.diarization == "unknown"
+
+
+def test_jsonl_sink_appends_one_line_per_chunk(tmp_path: Path) -> None:
+    sink = JSONLMetricsSink(tmp_path / "metrics" / "asr.jsonl")
+    rec = ASRChunkMetrics(
+        chunk="c.wav",
+        audio_s=10.0,
+        wall_s=2.5,
+        utterances=4,
+        diarization="ok",
+        device="cpu",
+        engine="funasr",
+    )
+
+    sink.emit([rec])
+    sink.emit([rec])
+
+    lines = (tmp_path / "metrics" / "asr.jsonl").read_text(encoding="utf-8").splitlines()
+    assert len(lines) == 2
+    data = json.loads(lines[0])
+    assert data["rtf"] == 0.25
+    assert data["chunk"] == "c.wav" and data["device"] == "cpu"
+
+
+def test_percentile_nearest_rank() -> None:
+    values = [0.1 * i for i in range(1, 21)]
+
+    assert percentile(values, 95) == pytest.approx(1.9)
+    assert percentile(values, 50) == pytest.approx(1.0)
+    assert percentile([], 95) == 0.0
+
+
+def test_wav_duration(tmp_path: Path) -> None:
+    assert wav_duration_s(_write_wav(tmp_path / "a.wav", 1.5)) == pytest.approx(1.5)
+    assert wav_duration_s(tmp_path / "missing.wav") == 0.0
@@ -0,0 +1,41 @@
+from __future__ import annotations
+
+from audio_journal.telemetry.memory import MemoryMonitor, current_rss_bytes
+
+
+def test_current_rss_is_positive() -> None:
+    assert current_rss_bytes() > 0
+
+
+def test_monitor_records_stage_peaks() -> None:
+    monitor = MemoryMonitor(enabled=True, trace=True, sample_interval=0.001)
+
+    with monitor.running():
+        with monitor.stage("alloc"):
+            data = [bytes(1024) for _ in range(2000)]
+            del data
+        with monitor.stage("idle"):
+            pass
+
+    assert set(monitor.peaks_mb()) == {"alloc", "idle"}
+    assert monitor.peak_rss["alloc"] > 0
+    # 2000 * 1KB ≈ 2MB 的 Python 堆分配
+    assert monitor.peak_traced["alloc"] >= 2000 * 1024
+
+
+def test_disabled_monitor_is_noop() -> None:
+    monitor = MemoryMonitor()
+
+    with monitor.running():
+        with monitor.stage("asr"):
+            pass
+
+    assert monitor.peak_rss == {}
+    assert monitor.would_exceed(10**12) is False
+
+
+def test_budget_check() -> None:
+    monitor = MemoryMonitor(budget_bytes=current_rss_bytes() + 100 * 1024 * 1024)
+
+    assert monitor.would_exceed(0) is False
+    assert monitor.would_exceed(200 * 1024 * 1024) is True
@@ -41,3 +41,26 @@ def test_handler_ignores_non_wav(tmp_path: Path) -> None:
 
     handler.on_created(_Evt(str(tmp_path / "a.txt")))
     assert called == []
+
+
+def test_handler_streaming_mode_skips_wait_stable(tmp_path: Path) -> None:
+    called: list[Path] = []
+
+    handler = AudioFileHandler(
+        patterns=["*.wav"],
+        # 若仍等待稳定，会在这里阻塞到超时
+        stable_seconds=60.0,
+        on_audio_ready=lambda p: called.append(p),
+        wait_for_stable=False,
+    )
+
+    class _Evt:
+        is_directory = False
+
+        def __init__(self, src_path: str) -> None:
+            self.src_path = src_path
+
+    p = tmp_path / "rec.wav"
+    p.write_bytes(b"RIFF")
+    handler.on_created(_Evt(str(p)))
+    assert called == [p]